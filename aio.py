@@ -0,0 +1,158 @@
+"""
+Parse from asyncio without blocking the event loop: the work runs on an
+executor (threads by default, or processes), with a bound on how many
+parses run at once, and a timeout per parse.
+
+    parser = AsyncParser(max_concurrency=4, timeout=5)
+    ast = await parser.parse(text)
+    async for n, ast, error in parser.parse_many(sources):
+        ...
+
+Parses that time out or are cancelled stop at their next check of the
+token stream, so they don't keep a worker busy after the caller gave up.
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from lex import LineIndex, tokenize
+from parse import parse_tokens
+
+# How many tokens are parsed between checks for a timeout or cancellation
+CHECK_TOKENS = 256
+
+
+def _checked(tokens, deadline, cancelled):
+    for n, t in enumerate(tokens):
+        if n % CHECK_TOKENS == 0:
+            if deadline is not None and time.time() > deadline:
+                raise TimeoutError("Parse timed out")
+            if cancelled is not None and cancelled.is_set():
+                raise asyncio.CancelledError()
+        yield t
+
+
+def _parse(text, deadline=None, cancelled=None):
+    """
+    parse(text) in a worker, giving up after `deadline` (a time.time(),
+    so it means the same in other processes) or once `cancelled` is set
+    """
+    line_index = LineIndex(text)
+    tokens = _checked(tokenize(text, line_index), deadline, cancelled)
+    return parse_tokens(tokens, text, line_index)
+
+
+class AsyncParser:
+    """
+    Runs parses on `executor` (None for the event loop's default thread
+    pool), at most `max_concurrency` at a time; callers beyond that wait
+    for a slot. `timeout` is the default for every parse, in seconds.
+    """
+
+    def __init__(self, executor=None, max_concurrency=None, timeout=None):
+        self.executor = executor
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self.timeout = timeout
+        self._slots = asyncio.Semaphore(self.max_concurrency)
+
+    async def parse(self, text, timeout=None):
+        """
+        Same as parse(text). Raises TimeoutError if it takes longer than
+        `timeout` seconds (counting from when it gets a slot).
+        """
+        timeout = self.timeout if timeout is None else timeout
+        async with self._slots:
+            deadline = None if timeout is None else time.time() + timeout
+            # Processes can't see an Event set here, but do see the deadline
+            if isinstance(self.executor, ProcessPoolExecutor):
+                cancelled = None
+            else:
+                cancelled = threading.Event()
+
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self.executor, _parse, text, deadline, cancelled
+            )
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except BaseException:
+                if cancelled is not None:
+                    cancelled.set()  # Stop the worker, if it already started
+                raise
+
+    async def parse_many(self, sources, ordered=True, timeout=None):
+        """
+        Parse an iterable (or async iterable) of source texts, yielding
+        `(n, ast, error)` for the n-th source like batch.parse_many().
+        Sources are only taken from `sources` as slots free up.
+        """
+        pending = deque() if ordered else set()
+        try:
+            async for n, text in _aenumerate(sources):
+                task = asyncio.ensure_future(self._result(n, text, timeout))
+                if ordered:
+                    pending.append(task)
+                else:
+                    pending.add(task)
+                if len(pending) >= self.max_concurrency:
+                    for result in await _next_done(pending, ordered):
+                        yield result
+
+            while pending:
+                for result in await _next_done(pending, ordered):
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _result(self, n, text, timeout):
+        try:
+            return n, await self.parse(text, timeout), None
+        except Exception as e:
+            # Report this source's error without stopping the rest
+            return n, None, e
+
+
+async def _aenumerate(sources):
+    if hasattr(sources, "__aiter__"):
+        n = 0
+        async for text in sources:
+            yield n, text
+            n += 1
+    else:
+        for n, text in enumerate(sources):
+            yield n, text
+
+
+async def _next_done(pending, ordered):
+    """
+    Wait for (and remove) the next task in order, or any finished tasks
+    """
+    if ordered:
+        return [await pending.popleft()]
+
+    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    pending.difference_update(done)
+    return [task.result() for task in done]
+
+
+async def parse_async(text, executor=None, timeout=None):
+    """
+    parse(text) on `executor` (see AsyncParser)
+    """
+    return await AsyncParser(executor, 1, timeout).parse(text)
+
+
+async def parse_many_async(
+    sources, executor=None, max_concurrency=None, timeout=None, ordered=True
+):
+    """
+    Parse many sources on `executor`, yielding `(n, ast, error)` for each
+    (see AsyncParser.parse_many)
+    """
+    parser = AsyncParser(executor, max_concurrency, timeout)
+    async for result in parser.parse_many(sources, ordered):
+        yield result
@@ -0,0 +1,127 @@
+"""
+Parse many sources at once across a pool of worker processes.
+
+    for n, ast, error in parse_many(sources, workers=8):
+        ...
+"""
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from parse import parse
+
+# Sources are grouped into tasks of about this many bytes, so lots of
+# small contracts don't each pay for a round trip to a worker
+CHUNK_BYTES = 64 * 1024
+
+
+def _warm_worker():
+    # Parse something trivial, so the parser tables are already built
+    # (or loaded from the cache) before the first real task arrives
+    parse("x: uint256")
+
+
+def _ready():
+    return os.getpid()
+
+
+def _parse_chunk(chunk):
+    results = []
+    for n, text in chunk:
+        try:
+            results.append((n, parse(text), None))
+        except Exception as e:
+            # Report this source's error without killing the rest of the batch
+            results.append((n, None, e))
+    return results
+
+
+def _chunks(sources, chunk_bytes):
+    chunk = []
+    size = 0
+    for n, text in enumerate(sources):
+        chunk.append((n, text))
+        size += len(text)
+        if size >= chunk_bytes:
+            yield chunk
+            chunk = []
+            size = 0
+
+    if chunk:
+        yield chunk
+
+
+class ParsePool:
+    """
+    A pool of warm worker processes that can be reused for many batches.
+    Use it as a context manager, or call `close()` when done.
+    """
+
+    def __init__(self, workers=None, chunk_bytes=CHUNK_BYTES, mp_context=None):
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_bytes = chunk_bytes
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp_context,
+            initializer=_warm_worker,
+        )
+        # The executor only starts processes as tasks arrive, so start them
+        # all now, rather than making the first batch wait for them
+        wait([self._executor.submit(_ready) for _ in range(self.workers)])
+
+        # Keep a bounded number of chunks in flight, so a huge (or endless)
+        # iterable of sources doesn't get pulled into memory all at once
+        self._max_pending = 4 * self.workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._executor.shutdown()
+
+    def parse_many(self, sources, ordered=True):
+        """
+        Parse an iterable of source texts, yielding `(n, ast, error)` for the
+        n-th source, where exactly one of `ast` and `error` is None.
+        Results come in input order, or as soon as they finish if not `ordered`.
+        """
+        if ordered:
+            return self._parse_ordered(sources)
+        else:
+            return self._parse_unordered(sources)
+
+    def _parse_ordered(self, sources):
+        pending = deque()
+        for chunk in _chunks(sources, self.chunk_bytes):
+            pending.append(self._executor.submit(_parse_chunk, chunk))
+            if len(pending) >= self._max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
+    def _parse_unordered(self, sources):
+        pending = set()
+        for chunk in _chunks(sources, self.chunk_bytes):
+            pending.add(self._executor.submit(_parse_chunk, chunk))
+            if len(pending) >= self._max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def parse_many(sources, workers=None, ordered=True, chunk_bytes=CHUNK_BYTES):
+    """
+    Parse an iterable of source texts using a temporary ParsePool,
+    yielding `(n, ast, error)` for each of them (see `ParsePool.parse_many`)
+    """
+    with ParsePool(workers, chunk_bytes) as pool:
+        yield from pool.parse_many(sources, ordered)
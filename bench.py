@@ -0,0 +1,836 @@
+"""
+Benchmarks for the lexer and parser.
+
+    python bench.py                 # run everything
+    python bench.py columns         # run a single benchmark
+
+Benchmarks that return metrics can be saved as a JSON baseline, and later
+runs compared against it, failing if any metric got worse by more than
+the threshold:
+
+    python bench.py corpus --save baseline.json
+    python bench.py corpus --compare baseline.json --threshold 0.1
+
+Or checked against fixed limits, e.g. on memory per byte of source:
+
+    python bench.py memory --limit "memory.*.parse.peak_bytes_per_byte=40"
+"""
+import argparse
+import fnmatch
+import glob
+import json
+import os
+import pickle
+import sys
+import time
+import tracemalloc
+
+from lex import VyperLexer, tokenize
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def timeit(func, *args, repeat=3):
+    """
+    Best wall time of `repeat` runs of func(*args), in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args):
+    """
+    Peak bytes allocated while running func(*args), and its result
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[1], result
+    finally:
+        tracemalloc.stop()
+
+
+def retained_memory(func, *args):
+    """
+    Bytes still allocated by func(*args) once it returned, and its result
+    """
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[0], result
+    finally:
+        tracemalloc.stop()
+
+
+def samples(func, *args, repeat):
+    """
+    Wall times of `repeat` runs of func(*args), in seconds, sorted
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return sorted(times)
+
+
+def percentile(times, p):
+    """
+    The p-th percentile of sorted `times` (nearest rank)
+    """
+    return times[min(len(times) - 1, int(len(times) * p / 100))]
+
+
+def consume(tokens):
+    for _ in tokens:
+        pass
+
+
+def single_line_array(size):
+    """
+    A constant array declaration that is `size` bytes long, all on one line
+    (like minified or generated contracts)
+    """
+    head = "a: constant(uint256[N]) = ["
+    items = []
+    length = len(head) + 1
+    n = 0
+    while length < size:
+        item = f"{n}, "
+        items.append(item)
+        length += len(item)
+        n += 1
+    return head + "".join(items) + "]"
+
+
+@benchmark
+def columns():
+    """
+    Column annotation should scale linearly on long single-line inputs
+    """
+    print(f"{'size':>10} {'seconds':>10} {'us/KB':>10}")
+    for size in (2 ** 17, 2 ** 18, 2 ** 19, 2 ** 20):
+        text = single_line_array(size)
+        seconds = timeit(lambda: consume(tokenize(text)))
+        print(f"{size:>10} {seconds:>10.4f} {seconds * 1e6 / (size / 1024):>10.1f}")
+
+
+SAMPLE = '''
+struct Point:
+    x: uint256
+    y: uint256
+
+balances: HashMap[address, uint256]
+owner: address
+
+@external
+def transfer(to: address, amount: uint256) -> bool:
+    assert self.balances[msg.sender] >= amount, "Too little"
+    self.balances[msg.sender] -= amount
+    self.balances[to] += amount
+    if amount > 100:
+        log Transfer({sender: msg.sender, receiver: to})
+    return True
+'''
+
+
+@benchmark
+def pipeline():
+    """
+    Per-token overhead of the fused post-processor vs. the reference filter chain
+    """
+    text = SAMPLE * 500
+    ntokens = sum(1 for _ in VyperLexer().tokenize(text))
+    lexing = timeit(lambda: consume(VyperLexer().tokenize(text)))
+
+    print(f"{'pipeline':>10} {'seconds':>10} {'ns/token':>10}")
+    print(f"{'lex only':>10} {lexing:>10.4f} {lexing * 1e9 / ntokens:>10.0f}")
+    for name in ("reference", "fused"):
+        seconds = timeit(lambda: consume(tokenize(text, pipeline=name)))
+        overhead = (seconds - lexing) * 1e9 / ntokens
+        print(f"{name:>10} {seconds:>10.4f} {overhead:>10.0f}")
+
+
+@benchmark
+def engines():
+    """
+    Lexer throughput of each engine (raw tokens, before post-processing)
+    """
+    from lex import ENGINES
+
+    text = SAMPLE * 500
+    size = len(text.encode())
+    ntokens = sum(1 for _ in VyperLexer().tokenize(text))
+
+    results = {}
+    print(f"{'engine':>10} {'seconds':>10} {'tok/s':>10} {'MB/s':>6}")
+    for name, lexer in ENGINES.items():
+        seconds = timeit(lambda: consume(lexer().tokenize(text)))
+        results[name] = {
+            "tokens_per_sec": ntokens / seconds,
+            "bytes_per_sec": size / seconds,
+        }
+        print(
+            f"{name:>10} {seconds:>10.4f} {ntokens / seconds:>10.0f} "
+            f"{size / seconds / 2 ** 20:>6.2f}"
+        )
+    return results
+
+
+@benchmark
+def parsers():
+    """
+    Per-call cost of parsing small snippets with a new parser each time
+    vs. this thread's re-used parser
+    """
+    from grammar import _VyperParser
+    from parse import parse_tokens
+
+    snippets = ["a: uint256", "MAX: constant(uint256) = 100", FUNCTION]
+    print(f"{'tokens':>10} {'new us':>10} {'reused us':>10}")
+    for snippet in snippets:
+        tokens = list(tokenize(snippet))
+        runs = 2000
+
+        def new():
+            for _ in range(runs):
+                _VyperParser().parse(iter(tokens), snippet)
+
+        def reused():
+            for _ in range(runs):
+                parse_tokens(tokens, snippet)
+
+        print(
+            f"{len(tokens):>10} {timeit(new, repeat=7) * 1e6 / runs:>10.2f} "
+            f"{timeit(reused, repeat=7) * 1e6 / runs:>10.2f}"
+        )
+
+
+@benchmark
+def buffer():
+    """
+    Memory held by a tokenized source as VyperTokens vs. as a TokenBuffer
+    """
+    text = SAMPLE * 500
+    print(f"{'storage':>10} {'seconds':>10} {'peak MB':>10} {'B/token':>10}")
+    for name, func in (
+        ("tokens", lambda: list(tokenize(text))),
+        ("buffer", lambda: tokenize(text, buffer=True)),
+    ):
+        seconds = timeit(func)
+        peak, tokens = peak_memory(func)
+        print(
+            f"{name:>10} {seconds:>10.4f} {peak / 2 ** 20:>10.2f} "
+            f"{peak / len(tokens):>10.0f}"
+        )
+
+
+# A function that the parser accepts, to be repeated into a large module
+FUNCTION = """
+@external
+def transfer(to: address, amount: uint256) -> bool:
+    assert amount > 0, "Too little"
+    self.balances[msg.sender] -= amount
+    self.balances[to] += amount
+    if amount > 100:
+        log Transfer({sender: msg.sender, receiver: to})
+    return True
+"""
+
+
+@benchmark
+def incremental():
+    """
+    Latency of re-parsing after a one-character edit vs. a full parse
+    """
+    from incremental import ParsedModule, reparse
+    from parse import parse
+
+    text = "owner: address\n" + FUNCTION * 500  # About 5,000 lines
+    module = ParsedModule(text)
+    # Change the last digit of "amount > 100" in the middle of the module
+    start = text.index("100", len(text) // 2) + 2
+
+    full = timeit(lambda: parse(text))
+    edit = timeit(lambda: reparse(module, start, start + 1, "1"))
+    print(f"{'mode':>10} {'seconds':>10}")
+    print(f"{'full':>10} {full:>10.4f}")
+    print(f"{'reparse':>10} {edit:>10.4f}")
+
+
+@benchmark
+def skeleton():
+    """
+    Parsing only the module skeleton (lazy function bodies) vs. everything
+    """
+    from parse import parse
+
+    text = "owner: address\n" + FUNCTION * 500
+    full = timeit(lambda: parse(text))
+    lazy = timeit(lambda: parse(text, lazy=True))
+    print(f"{'mode':>10} {'seconds':>10}")
+    print(f"{'full':>10} {full:>10.4f}")
+    print(f"{'lazy':>10} {lazy:>10.4f}")
+
+
+@benchmark
+def cache():
+    """
+    Cost of a repeat parse from each tier of the parse cache vs. parsing again
+    """
+    import tempfile
+
+    from cache import ParseCache
+    from parse import parse
+
+    text = "owner: address\n" + FUNCTION * 50
+    with tempfile.TemporaryDirectory() as directory:
+        warm = ParseCache(directory)
+        warm.parse(text)
+
+        full = timeit(lambda: parse(text))
+        memory = timeit(lambda: warm.parse(text))
+        # A fresh cache has nothing in memory, so it has to load from disk
+        disk = timeit(lambda: ParseCache(directory).parse(text))
+
+    print(f"{'tier':>10} {'seconds':>10}")
+    print(f"{'none':>10} {full:>10.4f}")
+    print(f"{'memory':>10} {memory:>10.4f}")
+    print(f"{'disk':>10} {disk:>10.4f}")
+
+
+@benchmark
+def stream():
+    """
+    Peak memory of parsing a large file from a string vs. memory-mapped in chunks
+    """
+    import os
+    import tempfile
+
+    from parse import parse
+    from stream import parse_file
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "large.vy")
+        with open(path, "w") as f:
+            for n in range(200_000):
+                f.write(f"value{n}: uint256  # A comment to make the line longer\n")
+        size = os.path.getsize(path)
+
+        def from_string():
+            with open(path) as f:
+                return parse(f.read())
+
+        print(f"{'source':>10} {'seconds':>10} {'peak MB':>10} {'B/byte':>10}")
+        for name, func in (("string", from_string), ("mmap", lambda: parse_file(path))):
+            seconds = timeit(func, repeat=1)
+            peak, _ = peak_memory(func)
+            print(
+                f"{name:>10} {seconds:>10.4f} {peak / 2 ** 20:>10.2f} "
+                f"{peak / size:>10.2f}"
+            )
+
+
+@benchmark
+def nodes():
+    """
+    Memory held by a large module's AST, and the time to walk it,
+    as tuples and dicts vs. `__slots__` nodes
+    """
+    from nodes import from_tuple
+    from parse import parse
+
+    with open(os.path.join(CORPUS, "markets_large.vy")) as f:
+        ast = parse(f.read())
+
+    # Load fresh copies, so both include their own names and literals
+    as_tuples, _ = retained_memory(pickle.loads, pickle.dumps(ast))
+    as_nodes, module = retained_memory(pickle.loads, pickle.dumps(from_tuple(ast)))
+
+    def walk_tuples():
+        return sum(len(f["body"]) + len(f["parameters"]) for f in ast[1]["function_defs"])
+
+    def walk_nodes():
+        return sum(len(f.body) + len(f.parameters) for f in module.function_defs)
+
+    print(f"{'shape':>10} {'bytes':>12} {'walk seconds':>14}")
+    print(f"{'tuples':>10} {as_tuples:>12} {timeit(walk_tuples, repeat=20):>14.6f}")
+    print(f"{'nodes':>10} {as_nodes:>12} {timeit(walk_nodes, repeat=20):>14.6f}")
+
+
+
+@benchmark
+def serialize():
+    """
+    Size and encode/decode time of a large module's AST in the binary
+    encoding vs. JSON and pickle, and reading just the function names lazily
+    """
+    import serialize
+    from parse import parse
+
+    with open(os.path.join(CORPUS, "markets_large.vy")) as f:
+        ast = parse(f.read())
+
+    formats = {
+        "binary": (serialize.dumps, serialize.loads),
+        "json": (json.dumps, json.loads),
+        "pickle": (pickle.dumps, pickle.loads),
+    }
+    results = {}
+    print(f"{'format':>10} {'bytes':>10} {'encode s':>10} {'decode s':>10}")
+    for name, (dumps, loads) in formats.items():
+        data = dumps(ast)
+        results[name] = {
+            "bytes": len(data),
+            "encode_seconds": timeit(lambda: dumps(ast), repeat=5),
+            "decode_seconds": timeit(lambda: loads(data), repeat=5),
+        }
+        print(
+            f"{name:>10} {len(data):>10} {results[name]['encode_seconds']:>10.4f} "
+            f"{results[name]['decode_seconds']:>10.4f}"
+        )
+
+    data = serialize.dumps(ast)
+
+    def names():
+        return [f["name"] for f in serialize.load_lazy(data)[1]["function_defs"]]
+
+    results["lazy_names_seconds"] = timeit(names, repeat=5)
+    print(f"{'lazy names':>10} {'':>10} {'':>10} {results['lazy_names_seconds']:>10.4f}")
+    return results
+
+
+
+@benchmark
+def imports():
+    """
+    Time to get a large module's imports by scanning the top of it vs.
+    parsing all of it
+    """
+    from deps import scan_imports
+    from parse import parse
+
+    with open(os.path.join(CORPUS, "markets_large.vy")) as f:
+        text = "from a import b\nimport c as d\n" + f.read()
+
+    results = {
+        "scan_seconds": timeit(scan_imports, text, repeat=10),
+        "parse_seconds": timeit(parse, text),
+    }
+    print(f"{'scan':>10} {results['scan_seconds']:>10.6f}")
+    print(f"{'parse':>10} {results['parse_seconds']:>10.6f}")
+    return results
+
+
+
+@benchmark
+def project():
+    """
+    Time to build a project of 3000 small files, then build it again with
+    nothing changed, and with one changed file (imported by 49 others)
+    """
+    import tempfile
+
+    from project import Project
+
+    with tempfile.TemporaryDirectory() as root:
+        for n in range(3000):
+            directory = os.path.join(root, f"pkg{n // 100}")
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"c{n}.vy"), "w") as f:
+                f.write(f"from . import c{n - 1}\n" if n % 100 else "")
+                f.write(f"x{n}: uint256\n\n@external\ndef f() -> uint256:\n    return {n}\n")
+            # Old enough that the build can trust their mtimes
+            os.utime(f.name, ns=(0, 0))
+
+        start = time.perf_counter()
+        Project(root).build(workers=None)
+        results = {"build_seconds": time.perf_counter() - start}
+        results["no_change_seconds"] = timeit(lambda: Project(root).build(), repeat=5)
+
+        path = os.path.join(root, "pkg0", "c50.vy")
+        with open(path, "a") as f:
+            f.write("y: uint256\n")
+        os.utime(path, ns=(1, 1))
+        start = time.perf_counter()
+        parsed = Project(root).build().parsed
+        results["one_change_seconds"] = time.perf_counter() - start
+
+    print(f"{'full build':>12} {results['build_seconds']:>10.4f}")
+    print(f"{'no change':>12} {results['no_change_seconds']:>10.4f}")
+    print(
+        f"{'one change':>12} {results['one_change_seconds']:>10.4f} "
+        f"({len(parsed)} parsed)"
+    )
+    return results
+
+
+
+@benchmark
+def daemon():
+    """
+    Round-trip latency of requests to a warm daemon.py, about a typical
+    contract that's open in it
+    """
+    import subprocess
+
+    from daemon import read_message, write_message
+
+    with open(os.path.join(CORPUS, "token.vy")) as f:
+        text = f.read()
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "daemon.py")
+    process = subprocess.Popen(
+        [sys.executable, path],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+    )
+
+    def call(method, **params):
+        request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        write_message(process.stdin, json.dumps(request).encode())
+        return json.loads(read_message(process.stdout))
+
+    try:
+        call("open", uri="token.vy", text=text)
+        end = text.index("\n") + 1
+        edit = [{"start": end, "end": end, "text": "#"}]
+        undo = [{"start": end, "end": end + 1, "text": ""}]
+
+        def change():
+            call("change", uri="token.vy", edits=edit)
+            call("change", uri="token.vy", edits=undo)
+
+        results = {
+            "open_seconds": percentile(
+                samples(lambda: call("open", uri="token.vy", text=text), repeat=50), 50
+            ),
+            "parse_seconds": percentile(
+                samples(lambda: call("parse", uri="token.vy"), repeat=50), 50
+            ),
+            "change_seconds": percentile(samples(change, repeat=50), 50) / 2,
+            "diagnostics_seconds": percentile(
+                samples(lambda: call("diagnostics", text=text[:-20]), repeat=50), 50
+            ),
+        }
+        call("shutdown")
+    finally:
+        process.stdin.close()
+        process.wait()
+
+    for name, seconds in results.items():
+        print(f"{name[: -len('_seconds')]:>12} {seconds * 1e3:>8.2f} ms")
+    return results
+
+
+
+@benchmark
+def memory():
+    """
+    Peak memory of tokenize() and parse() per byte of source over the
+    contract corpus, and where it goes: the tokens by pipeline stage and
+    the AST by node kind (for the largest file)
+    """
+    from memory import memory_report
+
+    results = {}
+    reports = {}
+    print(f"{'file':>20} {'bytes':>8} {'lex B/B':>8} {'parse B/B':>10} {'AST B/B':>8}")
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.vy"))):
+        with open(path) as f:
+            report = memory_report(f.read())
+        name = os.path.basename(path)
+        reports[name] = report
+        results[name] = {
+            "tokenize": {"peak_bytes_per_byte": report["tokenize"]["peak_bytes_per_byte"]},
+            "parse": {
+                "peak_bytes_per_byte": report["parse"]["peak_bytes_per_byte"],
+                "ast_bytes_per_byte": report["parse"]["ast_bytes_per_byte"],
+            },
+        }
+        print(
+            f"{name:>20} {report['source_bytes']:>8} "
+            f"{report['tokenize']['peak_bytes_per_byte']:>8.2f} "
+            f"{report['parse']['peak_bytes_per_byte']:>10.2f} "
+            f"{report['parse']['ast_bytes_per_byte']:>8.2f}"
+        )
+
+    largest = max(reports.values(), key=lambda report: report["source_bytes"])
+    for title, sizes in (
+        ("stage", largest["tokenize"]["stages"]),
+        ("node", largest["parse"]["nodes"]),
+    ):
+        print(f"{title:>20} {'bytes':>10} {'B/B':>8}")
+        for name, size in list(sizes.items())[:10]:
+            print(f"{name:>20} {size:>10} {size / largest['source_bytes']:>8.2f}")
+    return results
+
+
+@benchmark
+def startup():
+    """
+    Time for a new process to `import parse`, and to parse a first (tiny)
+    source, which builds the parser or loads its cached tables. The time
+    to start the interpreter alone is given too, and taken off the others.
+    """
+    import subprocess
+
+    from parse import parse
+
+    here = os.path.dirname(os.path.abspath(__file__))
+
+    def run(code):
+        return timeit(
+            lambda: subprocess.run([sys.executable, "-c", code], cwd=here, check=True),
+            repeat=10,
+        )
+
+    parse("x: uint256")  # So the parser tables are cached for the subprocesses
+    interpreter = run("pass")
+    results = {
+        "interpreter_seconds": interpreter,
+        "import_seconds": run("import parse") - interpreter,
+        "first_parse_seconds": run("import parse; parse.parse('x: uint256')")
+        - interpreter,
+    }
+    for name, seconds in results.items():
+        print(f"{name:>20} {seconds * 1e3:>8.2f} ms")
+    return results
+
+
+@benchmark
+def spans():
+    """
+    Cost of recording the span of every node while parsing, and of then
+    resolving the line and column of all of them, over the contract corpus
+    """
+    from parse import parse
+
+    results = {}
+    print(f"{'file':>20} {'parse ms':>9} {'spans ms':>9} {'overhead':>9} {'lines ms':>9}")
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.vy"))):
+        with open(path) as f:
+            text = f.read()
+        plain = timeit(lambda: parse(text))
+        spanned = timeit(lambda: parse(text, spans=True))
+        module, recorded = parse(text, nodes=True, spans=True)
+        nodes = []
+        stack = [module]
+        while stack:  # Every node, as a tool walking the tree would see them
+            value = stack.pop()
+            if isinstance(value, (list, tuple)):
+                stack.extend(value)
+            elif hasattr(value, "span"):
+                nodes.append(value)
+                stack.extend(getattr(value, field) for field in value.__slots__)
+        resolving = timeit(lambda: [(recorded.start(n), recorded.end(n)) for n in nodes])
+        name = os.path.basename(path)
+        results[name] = {
+            "parse_seconds": plain,
+            "parse_spans_seconds": spanned,
+            "resolve_seconds": resolving,
+        }
+        print(
+            f"{name:>20} {plain * 1e3:>9.2f} {spanned * 1e3:>9.2f} "
+            f"{spanned / plain - 1:>9.0%} {resolving * 1e3:>9.2f}"
+        )
+    return results
+
+
+@benchmark
+def scaling():
+    """
+    Throughput of tokenize() and parse() on generated contracts from 64KB
+    to 4MB, which should stay about the same as the size grows
+    """
+    from parse import parse
+    from synthetic import generate_contract
+
+    results = {}
+    print(f"{'bytes':>10} {'lex MB/s':>10} {'parse MB/s':>10}")
+    for target in (2 ** 16, 2 ** 18, 2 ** 20, 2 ** 22):
+        text = generate_contract(target)
+        size = len(text.encode())
+        lexing = timeit(lambda: consume(tokenize(text)), repeat=1)
+        metrics = {"tokenize_bytes_per_sec": size / lexing}
+        line = f"{size:>10} {size / lexing / 2 ** 20:>10.3f}"
+        # Parsing is much slower, so not the largest
+        if size < 2 ** 21:
+            parsing = timeit(lambda: parse(text), repeat=1)
+            metrics["parse_bytes_per_sec"] = size / parsing
+            line += f" {size / parsing / 2 ** 20:>10.3f}"
+        results[f"{target // 1024}KB"] = metrics
+        print(line)
+    return results
+
+
+CORPUS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+
+@benchmark
+def corpus():
+    """
+    Throughput and latency of tokenize() and parse() over the contract corpus
+    """
+    from parse import parse, parse_tokens
+
+    results = {}
+    print(
+        f"{'file':>20} {'bytes':>8} {'tokens':>7} {'lex tok/s':>10} "
+        f"{'parse tok/s':>11} {'MB/s':>6} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8}"
+    )
+    for path in sorted(glob.glob(os.path.join(CORPUS, "*.vy"))):
+        with open(path) as f:
+            text = f.read()
+        size = len(text.encode())
+        tokens = list(tokenize(text))
+        # Enough runs for stable percentiles, without taking forever on big files
+        repeat = max(5, min(100, 2 * 2 ** 20 // size))
+
+        lexing = percentile(samples(lambda: consume(tokenize(text)), repeat=repeat), 50)
+        parsing = percentile(
+            samples(lambda: parse_tokens(tokens, text), repeat=repeat), 50
+        )
+        latency = samples(lambda: parse(text), repeat=repeat)
+        metrics = {
+            "bytes": size,
+            "tokens": len(tokens),
+            "tokenize_tokens_per_sec": len(tokens) / lexing,
+            "tokenize_bytes_per_sec": size / lexing,
+            "parse_tokens_per_sec": len(tokens) / parsing,
+            "latency_p50_seconds": percentile(latency, 50),
+            "latency_p90_seconds": percentile(latency, 90),
+            "latency_p99_seconds": percentile(latency, 99),
+        }
+        results[os.path.basename(path)] = metrics
+        print(
+            f"{os.path.basename(path):>20} {size:>8} {len(tokens):>7} "
+            f"{metrics['tokenize_tokens_per_sec']:>10.0f} "
+            f"{metrics['parse_tokens_per_sec']:>11.0f} "
+            f"{size / metrics['latency_p50_seconds'] / 2 ** 20:>6.2f} "
+            f"{metrics['latency_p50_seconds'] * 1e3:>8.2f} "
+            f"{metrics['latency_p90_seconds'] * 1e3:>8.2f} "
+            f"{metrics['latency_p99_seconds'] * 1e3:>8.2f}"
+        )
+    return results
+
+
+def _flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(baseline, results, threshold):
+    """
+    Compare metrics against a baseline, returning `(metric, old, new, change)`
+    for every one that got worse by more than `threshold` (e.g. 0.1 = 10%).
+    Times (`*_seconds`) and memory (`*_per_byte`) should go down and rates
+    (`*_per_sec`) up, anything else is just informational. Metrics that
+    can't be compared as a ratio (a zero or missing value) are skipped.
+    """
+    baseline, results = _flatten(baseline), _flatten(results)
+    regressions = []
+    for metric in sorted(baseline.keys() & results.keys()):
+        old, new = baseline[metric], results[metric]
+        if metric.endswith(("_seconds", "_per_byte")):
+            worse, better = new, old
+        elif metric.endswith("_per_sec"):
+            worse, better = old, new
+        else:
+            continue
+        if not all(isinstance(v, (int, float)) and v > 0 for v in (old, new)):
+            continue
+        change = worse / better - 1
+        if change > threshold:
+            regressions.append((metric, old, new, change))
+    return regressions
+
+
+def over_limits(results, limits):
+    """
+    `(metric, value, limit)` for every metric over its limit, where each
+    limit is "METRIC=MAX" and METRIC can be a glob
+    """
+    flat = _flatten(results)
+    exceeded = []
+    for spec in limits:
+        pattern, _, limit = spec.rpartition("=")
+        limit = float(limit)
+        for metric in sorted(fnmatch.filter(flat, pattern)):
+            if flat[metric] > limit:
+                exceeded.append((metric, flat[metric], limit))
+    return exceeded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("names", nargs="*", help=", ".join(sorted(BENCHMARKS)))
+    parser.add_argument("--save", metavar="JSON", help="save the metrics as a baseline")
+    parser.add_argument(
+        "--compare", metavar="JSON", help="fail on regressions from this baseline"
+    )
+    parser.add_argument(
+        "--limit",
+        action="append",
+        default=[],
+        metavar="METRIC=MAX",
+        help="fail if a metric (a glob) is over MAX, e.g. memory.*.peak_bytes_per_byte=40",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown when comparing (default: 0.1, i.e. 10%%)",
+    )
+    args = parser.parse_args()
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown))}")
+
+    results = {}
+    for name in args.names or sorted(BENCHMARKS):
+        print(f"## {name}")
+        metrics = BENCHMARKS[name]()
+        if metrics is not None:
+            results[name] = metrics
+        print()
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        print(f"## compare ({len(regressions)} regressions)")
+        for metric, old, new, change in regressions:
+            print(f"{metric:>60} {old:>12.6g} {new:>12.6g} {change:>+8.1%}")
+        if regressions:
+            sys.exit(1)
+
+    if args.limit:
+        exceeded = over_limits(results, args.limit)
+        print(f"## limits ({len(exceeded)} exceeded)")
+        for metric, value, limit in exceeded:
+            print(f"{metric:>60} {value:>12.6g} > {limit:>12.6g}")
+        if exceeded:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""
+An opt-in, content-addressed cache around parse(), so unchanged sources
+aren't parsed again within a process (in-memory LRU) or across processes
+(on-disk store, safe to share between them).
+
+    cache = ParseCache()
+    ast = cache.parse(text)
+    cache.stats  # CacheStats(memory_hits=..., disk_hits=..., misses=...)
+"""
+import hashlib
+import importlib.util
+import os
+import pickle
+from collections import OrderedDict, namedtuple
+
+import sly
+
+from parse import TABLE_CACHE_DIR, _write_atomic, parse
+
+# Where parse results are kept between processes, next to the parser tables
+AST_CACHE_DIR = os.path.join(TABLE_CACHE_DIR, "ast") if TABLE_CACHE_DIR else ""
+
+# Bump this whenever the layout of the cached AST artifact changes
+AST_FORMAT_VERSION = 2
+
+CacheStats = namedtuple("CacheStats", "memory_hits disk_hits misses")
+
+_grammar_version = None
+
+
+def grammar_version():
+    """
+    Hash everything a parse result depends on: the lexer and the parser,
+    including the code that builds the AST (not just the productions),
+    and the version of sly that runs it
+    """
+    global _grammar_version
+    if _grammar_version is None:
+        h = hashlib.sha256(f"{AST_FORMAT_VERSION}:{sly.__version__}\n".encode())
+        # By file, so the parser isn't built just to find grammar.py
+        for module in ("lex", "parse", "grammar"):
+            with open(importlib.util.find_spec(module).origin, "rb") as f:
+                h.update(f.read())
+        _grammar_version = h.hexdigest()
+    return _grammar_version
+
+
+def source_key(text):
+    """
+    The cache key for a source: a hash of its text and the grammar version
+    """
+    h = hashlib.sha256(grammar_version().encode())
+    h.update(text.encode())
+    return h.hexdigest()
+
+
+class ParseCache:
+    """
+    Caches parse results by the hash of their source.
+    Holds up to `max_entries` results in memory, and up to about `max_bytes`
+    of them in `directory` (evicting the least recently used files first).
+    Pass `directory=""` for a memory-only cache.
+
+    Both tiers hold pickled results, so every hit returns a fresh copy
+    that the caller is free to modify.
+    """
+
+    def __init__(self, directory=None, max_entries=256, max_bytes=256 * 2 ** 20):
+        self.directory = AST_CACHE_DIR if directory is None else directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        self._disk_bytes = None  # Counted on the first write
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self):
+        return CacheStats(self._memory_hits, self._disk_hits, self._misses)
+
+    def parse(self, text):
+        """
+        Same as parse(text), but re-uses the result for a source seen before.
+        SyntaxErrors are not cached.
+        """
+        key = source_key(text)
+
+        data = self._memory.get(key)
+        if data is not None:
+            self._memory.move_to_end(key)
+            self._memory_hits += 1
+            return pickle.loads(data)
+
+        data = self._load(key)
+        if data is not None:
+            try:
+                ast = pickle.loads(data)
+            except (pickle.UnpicklingError, EOFError, AttributeError):
+                data = None  # Corrupted, so parse it again
+
+        if data is not None:
+            self._disk_hits += 1
+        else:
+            self._misses += 1
+            ast = parse(text)
+            data = pickle.dumps(ast, pickle.HIGHEST_PROTOCOL)
+            self._save(key, data)
+
+        self._remember(key, data)
+        return ast
+
+    def clear(self):
+        """
+        Empty both tiers (and reset the statistics)
+        """
+        self._memory.clear()
+        for path, _, _ in self._files():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._disk_bytes = 0
+        self._memory_hits = self._disk_hits = self._misses = 0
+
+    def _remember(self, key, data):
+        self._memory[key] = data
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], f"{key}.pickle")
+
+    def _load(self, key):
+        if not self.directory:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                header = f.readline()
+                data = f.read()
+        except OSError:
+            return None  # Missing, unreadable, or evicted by another process
+
+        if header != f"{key}\n".encode():
+            return None
+
+        try:
+            os.utime(path)  # Mark as recently used, for eviction
+        except OSError:
+            pass
+        return data
+
+    def _save(self, key, data):
+        if not self.directory:
+            return
+
+        data = f"{key}\n".encode() + data
+        try:
+            _write_atomic(self._path(key), data)
+        except OSError:
+            return  # Caching is best-effort, we already have the result
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(s for _, s, _ in self._files())
+        else:
+            self._disk_bytes += len(data)
+
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _files(self):
+        """
+        Yield `(path, size, last used)` of every cached file on disk
+        """
+        try:
+            subdirs = os.listdir(self.directory)
+        except OSError:
+            return
+        for subdir in subdirs:
+            try:
+                entries = os.scandir(os.path.join(self.directory, subdir))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if not entry.name.endswith(".pickle"):
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield entry.path, st.st_size, st.st_mtime
+
+    def _evict(self):
+        # Other processes may have added or removed files, so count again
+        files = sorted(self._files(), key=lambda f: f[2])
+        total = sum(size for _, size, _ in files)
+        # Evict down to 3/4 of the budget, so we don't rescan on every write
+        target = self.max_bytes * 3 // 4
+        for path, size, _ in files:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # Another process got to it first
+            total -= size
+        self._disk_bytes = total
@@ -0,0 +1,79 @@
+# An open auction, where the highest bid when it ends wins
+
+struct Bid:
+    bidder: address
+    amount: uint256
+
+event HighestBidIncreased:
+    bidder: indexed(address)
+    amount: uint256
+
+event AuctionEnded:
+    winner: address
+    amount: uint256
+
+beneficiary: public(address)
+auctionStart: public(uint256)
+auctionEnd: public(uint256)
+
+highestBidder: public(address)
+highestBid: public(uint256)
+ended: public(bool)
+
+pendingReturns: public(HashMap[address, uint256])
+bidCount: public(HashMap[address, uint256])
+
+
+@external
+def __init__(_beneficiary: address, _start: uint256, _duration: uint256):
+    self.beneficiary = _beneficiary
+    self.auctionStart = _start
+    self.auctionEnd = self.auctionStart + _duration
+    assert block.timestamp < self.auctionEnd, "Auction already over"
+
+
+@external
+@payable
+def bid():
+    assert block.timestamp > self.auctionStart, "Auction not started"
+    assert block.timestamp < self.auctionEnd, "Auction ended"
+    assert msg.value > self.highestBid, "Bid too low"
+    self.pendingReturns[self.highestBidder] += self.highestBid
+    self.highestBidder = msg.sender
+    self.highestBid = msg.value
+    self.bidCount[msg.sender] += 1
+    log HighestBidIncreased({bidder: msg.sender, amount: msg.value})
+
+
+@external
+def withdraw():
+    pending_amount: uint256 = self.pendingReturns[msg.sender]
+    if pending_amount == 0:
+        return
+    self.pendingReturns[msg.sender] = 0
+
+
+@view
+@external
+def timeLeft() -> uint256:
+    if block.timestamp > self.auctionEnd:
+        return 0
+    elif block.timestamp < self.auctionStart:
+        return self.auctionEnd - self.auctionStart
+    else:
+        return self.auctionEnd - block.timestamp
+
+
+@view
+@external
+def currentBid() -> Bid:
+    current: Bid = {bidder: self.highestBidder, amount: self.highestBid}
+    return current
+
+
+@external
+def endAuction():
+    assert block.timestamp > self.auctionEnd, "Auction not yet ended"
+    assert not self.ended, "Auction already ended"
+    self.ended = True
+    log AuctionEnded({winner: self.highestBidder, amount: self.highestBid})
@@ -0,0 +1,9465 @@
+# A registry of 160 markets, all sharing the same layout
+
+interface Oracle:
+    def price() -> uint256: view
+    def decimals() -> uint256: view
+
+struct Position:
+    owner: address
+    size: uint256
+    collateral: uint256
+    opened: uint256
+
+event Opened:
+    market: indexed(uint256)
+    owner: indexed(address)
+    size: uint256
+
+event Closed:
+    market: indexed(uint256)
+    owner: indexed(address)
+    profit: int128
+
+admin: public(address)
+paused: public(bool)
+FEE_DENOMINATOR: constant(uint256) = 10000
+
+market0_oracle: public(address)
+market0_fee: public(uint256)
+market0_open_interest: public(uint256)
+market0_positions: HashMap[address, Position]
+market0_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open0(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market0_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market0_positions[msg.sender] = position
+    self.market0_open_interest += size - fee
+    log Opened({market: 0, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close0(price: uint256) -> int128:
+    position: Position = self.market0_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market0_open_interest -= position.size
+    log Closed({market: 0, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits0(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market0_deposits[owner][n]
+        if total > 0x0001 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee0(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market0_fee = fee
+
+market1_oracle: public(address)
+market1_fee: public(uint256)
+market1_open_interest: public(uint256)
+market1_positions: HashMap[address, Position]
+market1_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open1(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market1_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market1_positions[msg.sender] = position
+    self.market1_open_interest += size - fee
+    log Opened({market: 1, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close1(price: uint256) -> int128:
+    position: Position = self.market1_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market1_open_interest -= position.size
+    log Closed({market: 1, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits1(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market1_deposits[owner][n]
+        if total > 0x0002 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee1(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market1_fee = fee
+
+market2_oracle: public(address)
+market2_fee: public(uint256)
+market2_open_interest: public(uint256)
+market2_positions: HashMap[address, Position]
+market2_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open2(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market2_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market2_positions[msg.sender] = position
+    self.market2_open_interest += size - fee
+    log Opened({market: 2, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close2(price: uint256) -> int128:
+    position: Position = self.market2_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market2_open_interest -= position.size
+    log Closed({market: 2, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits2(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market2_deposits[owner][n]
+        if total > 0x0003 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee2(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market2_fee = fee
+
+market3_oracle: public(address)
+market3_fee: public(uint256)
+market3_open_interest: public(uint256)
+market3_positions: HashMap[address, Position]
+market3_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open3(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market3_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market3_positions[msg.sender] = position
+    self.market3_open_interest += size - fee
+    log Opened({market: 3, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close3(price: uint256) -> int128:
+    position: Position = self.market3_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market3_open_interest -= position.size
+    log Closed({market: 3, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits3(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market3_deposits[owner][n]
+        if total > 0x0004 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee3(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market3_fee = fee
+
+market4_oracle: public(address)
+market4_fee: public(uint256)
+market4_open_interest: public(uint256)
+market4_positions: HashMap[address, Position]
+market4_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open4(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market4_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market4_positions[msg.sender] = position
+    self.market4_open_interest += size - fee
+    log Opened({market: 4, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close4(price: uint256) -> int128:
+    position: Position = self.market4_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market4_open_interest -= position.size
+    log Closed({market: 4, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits4(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market4_deposits[owner][n]
+        if total > 0x0005 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee4(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market4_fee = fee
+
+market5_oracle: public(address)
+market5_fee: public(uint256)
+market5_open_interest: public(uint256)
+market5_positions: HashMap[address, Position]
+market5_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open5(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market5_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market5_positions[msg.sender] = position
+    self.market5_open_interest += size - fee
+    log Opened({market: 5, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close5(price: uint256) -> int128:
+    position: Position = self.market5_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market5_open_interest -= position.size
+    log Closed({market: 5, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits5(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market5_deposits[owner][n]
+        if total > 0x0006 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee5(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market5_fee = fee
+
+market6_oracle: public(address)
+market6_fee: public(uint256)
+market6_open_interest: public(uint256)
+market6_positions: HashMap[address, Position]
+market6_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open6(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market6_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market6_positions[msg.sender] = position
+    self.market6_open_interest += size - fee
+    log Opened({market: 6, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close6(price: uint256) -> int128:
+    position: Position = self.market6_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market6_open_interest -= position.size
+    log Closed({market: 6, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits6(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market6_deposits[owner][n]
+        if total > 0x0007 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee6(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market6_fee = fee
+
+market7_oracle: public(address)
+market7_fee: public(uint256)
+market7_open_interest: public(uint256)
+market7_positions: HashMap[address, Position]
+market7_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open7(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market7_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market7_positions[msg.sender] = position
+    self.market7_open_interest += size - fee
+    log Opened({market: 7, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close7(price: uint256) -> int128:
+    position: Position = self.market7_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market7_open_interest -= position.size
+    log Closed({market: 7, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits7(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market7_deposits[owner][n]
+        if total > 0x0008 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee7(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market7_fee = fee
+
+market8_oracle: public(address)
+market8_fee: public(uint256)
+market8_open_interest: public(uint256)
+market8_positions: HashMap[address, Position]
+market8_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open8(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market8_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market8_positions[msg.sender] = position
+    self.market8_open_interest += size - fee
+    log Opened({market: 8, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close8(price: uint256) -> int128:
+    position: Position = self.market8_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market8_open_interest -= position.size
+    log Closed({market: 8, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits8(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market8_deposits[owner][n]
+        if total > 0x0009 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee8(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market8_fee = fee
+
+market9_oracle: public(address)
+market9_fee: public(uint256)
+market9_open_interest: public(uint256)
+market9_positions: HashMap[address, Position]
+market9_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open9(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market9_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market9_positions[msg.sender] = position
+    self.market9_open_interest += size - fee
+    log Opened({market: 9, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close9(price: uint256) -> int128:
+    position: Position = self.market9_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market9_open_interest -= position.size
+    log Closed({market: 9, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits9(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market9_deposits[owner][n]
+        if total > 0x000a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee9(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market9_fee = fee
+
+market10_oracle: public(address)
+market10_fee: public(uint256)
+market10_open_interest: public(uint256)
+market10_positions: HashMap[address, Position]
+market10_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open10(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market10_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market10_positions[msg.sender] = position
+    self.market10_open_interest += size - fee
+    log Opened({market: 10, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close10(price: uint256) -> int128:
+    position: Position = self.market10_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market10_open_interest -= position.size
+    log Closed({market: 10, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits10(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market10_deposits[owner][n]
+        if total > 0x000b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee10(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market10_fee = fee
+
+market11_oracle: public(address)
+market11_fee: public(uint256)
+market11_open_interest: public(uint256)
+market11_positions: HashMap[address, Position]
+market11_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open11(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market11_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market11_positions[msg.sender] = position
+    self.market11_open_interest += size - fee
+    log Opened({market: 11, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close11(price: uint256) -> int128:
+    position: Position = self.market11_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market11_open_interest -= position.size
+    log Closed({market: 11, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits11(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market11_deposits[owner][n]
+        if total > 0x000c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee11(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market11_fee = fee
+
+market12_oracle: public(address)
+market12_fee: public(uint256)
+market12_open_interest: public(uint256)
+market12_positions: HashMap[address, Position]
+market12_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open12(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market12_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market12_positions[msg.sender] = position
+    self.market12_open_interest += size - fee
+    log Opened({market: 12, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close12(price: uint256) -> int128:
+    position: Position = self.market12_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market12_open_interest -= position.size
+    log Closed({market: 12, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits12(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market12_deposits[owner][n]
+        if total > 0x000d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee12(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market12_fee = fee
+
+market13_oracle: public(address)
+market13_fee: public(uint256)
+market13_open_interest: public(uint256)
+market13_positions: HashMap[address, Position]
+market13_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open13(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market13_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market13_positions[msg.sender] = position
+    self.market13_open_interest += size - fee
+    log Opened({market: 13, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close13(price: uint256) -> int128:
+    position: Position = self.market13_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market13_open_interest -= position.size
+    log Closed({market: 13, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits13(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market13_deposits[owner][n]
+        if total > 0x000e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee13(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market13_fee = fee
+
+market14_oracle: public(address)
+market14_fee: public(uint256)
+market14_open_interest: public(uint256)
+market14_positions: HashMap[address, Position]
+market14_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open14(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market14_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market14_positions[msg.sender] = position
+    self.market14_open_interest += size - fee
+    log Opened({market: 14, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close14(price: uint256) -> int128:
+    position: Position = self.market14_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market14_open_interest -= position.size
+    log Closed({market: 14, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits14(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market14_deposits[owner][n]
+        if total > 0x000f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee14(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market14_fee = fee
+
+market15_oracle: public(address)
+market15_fee: public(uint256)
+market15_open_interest: public(uint256)
+market15_positions: HashMap[address, Position]
+market15_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open15(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market15_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market15_positions[msg.sender] = position
+    self.market15_open_interest += size - fee
+    log Opened({market: 15, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close15(price: uint256) -> int128:
+    position: Position = self.market15_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market15_open_interest -= position.size
+    log Closed({market: 15, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits15(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market15_deposits[owner][n]
+        if total > 0x0010 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee15(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market15_fee = fee
+
+market16_oracle: public(address)
+market16_fee: public(uint256)
+market16_open_interest: public(uint256)
+market16_positions: HashMap[address, Position]
+market16_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open16(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market16_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market16_positions[msg.sender] = position
+    self.market16_open_interest += size - fee
+    log Opened({market: 16, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close16(price: uint256) -> int128:
+    position: Position = self.market16_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market16_open_interest -= position.size
+    log Closed({market: 16, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits16(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market16_deposits[owner][n]
+        if total > 0x0011 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee16(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market16_fee = fee
+
+market17_oracle: public(address)
+market17_fee: public(uint256)
+market17_open_interest: public(uint256)
+market17_positions: HashMap[address, Position]
+market17_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open17(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market17_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market17_positions[msg.sender] = position
+    self.market17_open_interest += size - fee
+    log Opened({market: 17, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close17(price: uint256) -> int128:
+    position: Position = self.market17_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market17_open_interest -= position.size
+    log Closed({market: 17, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits17(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market17_deposits[owner][n]
+        if total > 0x0012 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee17(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market17_fee = fee
+
+market18_oracle: public(address)
+market18_fee: public(uint256)
+market18_open_interest: public(uint256)
+market18_positions: HashMap[address, Position]
+market18_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open18(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market18_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market18_positions[msg.sender] = position
+    self.market18_open_interest += size - fee
+    log Opened({market: 18, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close18(price: uint256) -> int128:
+    position: Position = self.market18_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market18_open_interest -= position.size
+    log Closed({market: 18, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits18(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market18_deposits[owner][n]
+        if total > 0x0013 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee18(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market18_fee = fee
+
+market19_oracle: public(address)
+market19_fee: public(uint256)
+market19_open_interest: public(uint256)
+market19_positions: HashMap[address, Position]
+market19_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open19(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market19_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market19_positions[msg.sender] = position
+    self.market19_open_interest += size - fee
+    log Opened({market: 19, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close19(price: uint256) -> int128:
+    position: Position = self.market19_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market19_open_interest -= position.size
+    log Closed({market: 19, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits19(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market19_deposits[owner][n]
+        if total > 0x0014 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee19(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market19_fee = fee
+
+market20_oracle: public(address)
+market20_fee: public(uint256)
+market20_open_interest: public(uint256)
+market20_positions: HashMap[address, Position]
+market20_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open20(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market20_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market20_positions[msg.sender] = position
+    self.market20_open_interest += size - fee
+    log Opened({market: 20, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close20(price: uint256) -> int128:
+    position: Position = self.market20_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market20_open_interest -= position.size
+    log Closed({market: 20, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits20(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market20_deposits[owner][n]
+        if total > 0x0015 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee20(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market20_fee = fee
+
+market21_oracle: public(address)
+market21_fee: public(uint256)
+market21_open_interest: public(uint256)
+market21_positions: HashMap[address, Position]
+market21_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open21(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market21_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market21_positions[msg.sender] = position
+    self.market21_open_interest += size - fee
+    log Opened({market: 21, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close21(price: uint256) -> int128:
+    position: Position = self.market21_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market21_open_interest -= position.size
+    log Closed({market: 21, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits21(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market21_deposits[owner][n]
+        if total > 0x0016 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee21(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market21_fee = fee
+
+market22_oracle: public(address)
+market22_fee: public(uint256)
+market22_open_interest: public(uint256)
+market22_positions: HashMap[address, Position]
+market22_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open22(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market22_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market22_positions[msg.sender] = position
+    self.market22_open_interest += size - fee
+    log Opened({market: 22, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close22(price: uint256) -> int128:
+    position: Position = self.market22_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market22_open_interest -= position.size
+    log Closed({market: 22, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits22(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market22_deposits[owner][n]
+        if total > 0x0017 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee22(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market22_fee = fee
+
+market23_oracle: public(address)
+market23_fee: public(uint256)
+market23_open_interest: public(uint256)
+market23_positions: HashMap[address, Position]
+market23_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open23(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market23_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market23_positions[msg.sender] = position
+    self.market23_open_interest += size - fee
+    log Opened({market: 23, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close23(price: uint256) -> int128:
+    position: Position = self.market23_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market23_open_interest -= position.size
+    log Closed({market: 23, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits23(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market23_deposits[owner][n]
+        if total > 0x0018 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee23(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market23_fee = fee
+
+market24_oracle: public(address)
+market24_fee: public(uint256)
+market24_open_interest: public(uint256)
+market24_positions: HashMap[address, Position]
+market24_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open24(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market24_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market24_positions[msg.sender] = position
+    self.market24_open_interest += size - fee
+    log Opened({market: 24, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close24(price: uint256) -> int128:
+    position: Position = self.market24_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market24_open_interest -= position.size
+    log Closed({market: 24, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits24(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market24_deposits[owner][n]
+        if total > 0x0019 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee24(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market24_fee = fee
+
+market25_oracle: public(address)
+market25_fee: public(uint256)
+market25_open_interest: public(uint256)
+market25_positions: HashMap[address, Position]
+market25_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open25(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market25_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market25_positions[msg.sender] = position
+    self.market25_open_interest += size - fee
+    log Opened({market: 25, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close25(price: uint256) -> int128:
+    position: Position = self.market25_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market25_open_interest -= position.size
+    log Closed({market: 25, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits25(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market25_deposits[owner][n]
+        if total > 0x001a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee25(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market25_fee = fee
+
+market26_oracle: public(address)
+market26_fee: public(uint256)
+market26_open_interest: public(uint256)
+market26_positions: HashMap[address, Position]
+market26_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open26(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market26_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market26_positions[msg.sender] = position
+    self.market26_open_interest += size - fee
+    log Opened({market: 26, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close26(price: uint256) -> int128:
+    position: Position = self.market26_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market26_open_interest -= position.size
+    log Closed({market: 26, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits26(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market26_deposits[owner][n]
+        if total > 0x001b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee26(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market26_fee = fee
+
+market27_oracle: public(address)
+market27_fee: public(uint256)
+market27_open_interest: public(uint256)
+market27_positions: HashMap[address, Position]
+market27_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open27(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market27_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market27_positions[msg.sender] = position
+    self.market27_open_interest += size - fee
+    log Opened({market: 27, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close27(price: uint256) -> int128:
+    position: Position = self.market27_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market27_open_interest -= position.size
+    log Closed({market: 27, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits27(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market27_deposits[owner][n]
+        if total > 0x001c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee27(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market27_fee = fee
+
+market28_oracle: public(address)
+market28_fee: public(uint256)
+market28_open_interest: public(uint256)
+market28_positions: HashMap[address, Position]
+market28_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open28(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market28_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market28_positions[msg.sender] = position
+    self.market28_open_interest += size - fee
+    log Opened({market: 28, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close28(price: uint256) -> int128:
+    position: Position = self.market28_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market28_open_interest -= position.size
+    log Closed({market: 28, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits28(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market28_deposits[owner][n]
+        if total > 0x001d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee28(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market28_fee = fee
+
+market29_oracle: public(address)
+market29_fee: public(uint256)
+market29_open_interest: public(uint256)
+market29_positions: HashMap[address, Position]
+market29_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open29(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market29_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market29_positions[msg.sender] = position
+    self.market29_open_interest += size - fee
+    log Opened({market: 29, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close29(price: uint256) -> int128:
+    position: Position = self.market29_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market29_open_interest -= position.size
+    log Closed({market: 29, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits29(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market29_deposits[owner][n]
+        if total > 0x001e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee29(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market29_fee = fee
+
+market30_oracle: public(address)
+market30_fee: public(uint256)
+market30_open_interest: public(uint256)
+market30_positions: HashMap[address, Position]
+market30_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open30(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market30_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market30_positions[msg.sender] = position
+    self.market30_open_interest += size - fee
+    log Opened({market: 30, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close30(price: uint256) -> int128:
+    position: Position = self.market30_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market30_open_interest -= position.size
+    log Closed({market: 30, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits30(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market30_deposits[owner][n]
+        if total > 0x001f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee30(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market30_fee = fee
+
+market31_oracle: public(address)
+market31_fee: public(uint256)
+market31_open_interest: public(uint256)
+market31_positions: HashMap[address, Position]
+market31_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open31(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market31_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market31_positions[msg.sender] = position
+    self.market31_open_interest += size - fee
+    log Opened({market: 31, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close31(price: uint256) -> int128:
+    position: Position = self.market31_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market31_open_interest -= position.size
+    log Closed({market: 31, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits31(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market31_deposits[owner][n]
+        if total > 0x0020 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee31(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market31_fee = fee
+
+market32_oracle: public(address)
+market32_fee: public(uint256)
+market32_open_interest: public(uint256)
+market32_positions: HashMap[address, Position]
+market32_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open32(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market32_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market32_positions[msg.sender] = position
+    self.market32_open_interest += size - fee
+    log Opened({market: 32, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close32(price: uint256) -> int128:
+    position: Position = self.market32_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market32_open_interest -= position.size
+    log Closed({market: 32, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits32(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market32_deposits[owner][n]
+        if total > 0x0021 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee32(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market32_fee = fee
+
+market33_oracle: public(address)
+market33_fee: public(uint256)
+market33_open_interest: public(uint256)
+market33_positions: HashMap[address, Position]
+market33_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open33(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market33_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market33_positions[msg.sender] = position
+    self.market33_open_interest += size - fee
+    log Opened({market: 33, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close33(price: uint256) -> int128:
+    position: Position = self.market33_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market33_open_interest -= position.size
+    log Closed({market: 33, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits33(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market33_deposits[owner][n]
+        if total > 0x0022 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee33(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market33_fee = fee
+
+market34_oracle: public(address)
+market34_fee: public(uint256)
+market34_open_interest: public(uint256)
+market34_positions: HashMap[address, Position]
+market34_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open34(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market34_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market34_positions[msg.sender] = position
+    self.market34_open_interest += size - fee
+    log Opened({market: 34, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close34(price: uint256) -> int128:
+    position: Position = self.market34_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market34_open_interest -= position.size
+    log Closed({market: 34, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits34(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market34_deposits[owner][n]
+        if total > 0x0023 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee34(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market34_fee = fee
+
+market35_oracle: public(address)
+market35_fee: public(uint256)
+market35_open_interest: public(uint256)
+market35_positions: HashMap[address, Position]
+market35_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open35(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market35_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market35_positions[msg.sender] = position
+    self.market35_open_interest += size - fee
+    log Opened({market: 35, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close35(price: uint256) -> int128:
+    position: Position = self.market35_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market35_open_interest -= position.size
+    log Closed({market: 35, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits35(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market35_deposits[owner][n]
+        if total > 0x0024 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee35(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market35_fee = fee
+
+market36_oracle: public(address)
+market36_fee: public(uint256)
+market36_open_interest: public(uint256)
+market36_positions: HashMap[address, Position]
+market36_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open36(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market36_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market36_positions[msg.sender] = position
+    self.market36_open_interest += size - fee
+    log Opened({market: 36, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close36(price: uint256) -> int128:
+    position: Position = self.market36_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market36_open_interest -= position.size
+    log Closed({market: 36, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits36(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market36_deposits[owner][n]
+        if total > 0x0025 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee36(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market36_fee = fee
+
+market37_oracle: public(address)
+market37_fee: public(uint256)
+market37_open_interest: public(uint256)
+market37_positions: HashMap[address, Position]
+market37_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open37(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market37_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market37_positions[msg.sender] = position
+    self.market37_open_interest += size - fee
+    log Opened({market: 37, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close37(price: uint256) -> int128:
+    position: Position = self.market37_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market37_open_interest -= position.size
+    log Closed({market: 37, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits37(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market37_deposits[owner][n]
+        if total > 0x0026 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee37(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market37_fee = fee
+
+market38_oracle: public(address)
+market38_fee: public(uint256)
+market38_open_interest: public(uint256)
+market38_positions: HashMap[address, Position]
+market38_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open38(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market38_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market38_positions[msg.sender] = position
+    self.market38_open_interest += size - fee
+    log Opened({market: 38, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close38(price: uint256) -> int128:
+    position: Position = self.market38_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market38_open_interest -= position.size
+    log Closed({market: 38, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits38(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market38_deposits[owner][n]
+        if total > 0x0027 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee38(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market38_fee = fee
+
+market39_oracle: public(address)
+market39_fee: public(uint256)
+market39_open_interest: public(uint256)
+market39_positions: HashMap[address, Position]
+market39_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open39(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market39_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market39_positions[msg.sender] = position
+    self.market39_open_interest += size - fee
+    log Opened({market: 39, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close39(price: uint256) -> int128:
+    position: Position = self.market39_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market39_open_interest -= position.size
+    log Closed({market: 39, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits39(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market39_deposits[owner][n]
+        if total > 0x0028 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee39(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market39_fee = fee
+
+market40_oracle: public(address)
+market40_fee: public(uint256)
+market40_open_interest: public(uint256)
+market40_positions: HashMap[address, Position]
+market40_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open40(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market40_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market40_positions[msg.sender] = position
+    self.market40_open_interest += size - fee
+    log Opened({market: 40, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close40(price: uint256) -> int128:
+    position: Position = self.market40_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market40_open_interest -= position.size
+    log Closed({market: 40, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits40(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market40_deposits[owner][n]
+        if total > 0x0029 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee40(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market40_fee = fee
+
+market41_oracle: public(address)
+market41_fee: public(uint256)
+market41_open_interest: public(uint256)
+market41_positions: HashMap[address, Position]
+market41_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open41(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market41_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market41_positions[msg.sender] = position
+    self.market41_open_interest += size - fee
+    log Opened({market: 41, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close41(price: uint256) -> int128:
+    position: Position = self.market41_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market41_open_interest -= position.size
+    log Closed({market: 41, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits41(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market41_deposits[owner][n]
+        if total > 0x002a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee41(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market41_fee = fee
+
+market42_oracle: public(address)
+market42_fee: public(uint256)
+market42_open_interest: public(uint256)
+market42_positions: HashMap[address, Position]
+market42_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open42(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market42_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market42_positions[msg.sender] = position
+    self.market42_open_interest += size - fee
+    log Opened({market: 42, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close42(price: uint256) -> int128:
+    position: Position = self.market42_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market42_open_interest -= position.size
+    log Closed({market: 42, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits42(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market42_deposits[owner][n]
+        if total > 0x002b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee42(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market42_fee = fee
+
+market43_oracle: public(address)
+market43_fee: public(uint256)
+market43_open_interest: public(uint256)
+market43_positions: HashMap[address, Position]
+market43_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open43(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market43_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market43_positions[msg.sender] = position
+    self.market43_open_interest += size - fee
+    log Opened({market: 43, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close43(price: uint256) -> int128:
+    position: Position = self.market43_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market43_open_interest -= position.size
+    log Closed({market: 43, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits43(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market43_deposits[owner][n]
+        if total > 0x002c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee43(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market43_fee = fee
+
+market44_oracle: public(address)
+market44_fee: public(uint256)
+market44_open_interest: public(uint256)
+market44_positions: HashMap[address, Position]
+market44_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open44(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market44_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market44_positions[msg.sender] = position
+    self.market44_open_interest += size - fee
+    log Opened({market: 44, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close44(price: uint256) -> int128:
+    position: Position = self.market44_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market44_open_interest -= position.size
+    log Closed({market: 44, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits44(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market44_deposits[owner][n]
+        if total > 0x002d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee44(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market44_fee = fee
+
+market45_oracle: public(address)
+market45_fee: public(uint256)
+market45_open_interest: public(uint256)
+market45_positions: HashMap[address, Position]
+market45_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open45(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market45_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market45_positions[msg.sender] = position
+    self.market45_open_interest += size - fee
+    log Opened({market: 45, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close45(price: uint256) -> int128:
+    position: Position = self.market45_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market45_open_interest -= position.size
+    log Closed({market: 45, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits45(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market45_deposits[owner][n]
+        if total > 0x002e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee45(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market45_fee = fee
+
+market46_oracle: public(address)
+market46_fee: public(uint256)
+market46_open_interest: public(uint256)
+market46_positions: HashMap[address, Position]
+market46_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open46(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market46_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market46_positions[msg.sender] = position
+    self.market46_open_interest += size - fee
+    log Opened({market: 46, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close46(price: uint256) -> int128:
+    position: Position = self.market46_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market46_open_interest -= position.size
+    log Closed({market: 46, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits46(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market46_deposits[owner][n]
+        if total > 0x002f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee46(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market46_fee = fee
+
+market47_oracle: public(address)
+market47_fee: public(uint256)
+market47_open_interest: public(uint256)
+market47_positions: HashMap[address, Position]
+market47_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open47(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market47_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market47_positions[msg.sender] = position
+    self.market47_open_interest += size - fee
+    log Opened({market: 47, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close47(price: uint256) -> int128:
+    position: Position = self.market47_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market47_open_interest -= position.size
+    log Closed({market: 47, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits47(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market47_deposits[owner][n]
+        if total > 0x0030 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee47(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market47_fee = fee
+
+market48_oracle: public(address)
+market48_fee: public(uint256)
+market48_open_interest: public(uint256)
+market48_positions: HashMap[address, Position]
+market48_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open48(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market48_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market48_positions[msg.sender] = position
+    self.market48_open_interest += size - fee
+    log Opened({market: 48, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close48(price: uint256) -> int128:
+    position: Position = self.market48_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market48_open_interest -= position.size
+    log Closed({market: 48, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits48(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market48_deposits[owner][n]
+        if total > 0x0031 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee48(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market48_fee = fee
+
+market49_oracle: public(address)
+market49_fee: public(uint256)
+market49_open_interest: public(uint256)
+market49_positions: HashMap[address, Position]
+market49_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open49(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market49_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market49_positions[msg.sender] = position
+    self.market49_open_interest += size - fee
+    log Opened({market: 49, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close49(price: uint256) -> int128:
+    position: Position = self.market49_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market49_open_interest -= position.size
+    log Closed({market: 49, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits49(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market49_deposits[owner][n]
+        if total > 0x0032 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee49(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market49_fee = fee
+
+market50_oracle: public(address)
+market50_fee: public(uint256)
+market50_open_interest: public(uint256)
+market50_positions: HashMap[address, Position]
+market50_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open50(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market50_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market50_positions[msg.sender] = position
+    self.market50_open_interest += size - fee
+    log Opened({market: 50, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close50(price: uint256) -> int128:
+    position: Position = self.market50_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market50_open_interest -= position.size
+    log Closed({market: 50, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits50(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market50_deposits[owner][n]
+        if total > 0x0033 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee50(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market50_fee = fee
+
+market51_oracle: public(address)
+market51_fee: public(uint256)
+market51_open_interest: public(uint256)
+market51_positions: HashMap[address, Position]
+market51_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open51(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market51_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market51_positions[msg.sender] = position
+    self.market51_open_interest += size - fee
+    log Opened({market: 51, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close51(price: uint256) -> int128:
+    position: Position = self.market51_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market51_open_interest -= position.size
+    log Closed({market: 51, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits51(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market51_deposits[owner][n]
+        if total > 0x0034 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee51(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market51_fee = fee
+
+market52_oracle: public(address)
+market52_fee: public(uint256)
+market52_open_interest: public(uint256)
+market52_positions: HashMap[address, Position]
+market52_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open52(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market52_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market52_positions[msg.sender] = position
+    self.market52_open_interest += size - fee
+    log Opened({market: 52, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close52(price: uint256) -> int128:
+    position: Position = self.market52_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market52_open_interest -= position.size
+    log Closed({market: 52, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits52(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market52_deposits[owner][n]
+        if total > 0x0035 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee52(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market52_fee = fee
+
+market53_oracle: public(address)
+market53_fee: public(uint256)
+market53_open_interest: public(uint256)
+market53_positions: HashMap[address, Position]
+market53_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open53(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market53_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market53_positions[msg.sender] = position
+    self.market53_open_interest += size - fee
+    log Opened({market: 53, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close53(price: uint256) -> int128:
+    position: Position = self.market53_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market53_open_interest -= position.size
+    log Closed({market: 53, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits53(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market53_deposits[owner][n]
+        if total > 0x0036 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee53(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market53_fee = fee
+
+market54_oracle: public(address)
+market54_fee: public(uint256)
+market54_open_interest: public(uint256)
+market54_positions: HashMap[address, Position]
+market54_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open54(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market54_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market54_positions[msg.sender] = position
+    self.market54_open_interest += size - fee
+    log Opened({market: 54, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close54(price: uint256) -> int128:
+    position: Position = self.market54_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market54_open_interest -= position.size
+    log Closed({market: 54, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits54(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market54_deposits[owner][n]
+        if total > 0x0037 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee54(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market54_fee = fee
+
+market55_oracle: public(address)
+market55_fee: public(uint256)
+market55_open_interest: public(uint256)
+market55_positions: HashMap[address, Position]
+market55_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open55(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market55_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market55_positions[msg.sender] = position
+    self.market55_open_interest += size - fee
+    log Opened({market: 55, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close55(price: uint256) -> int128:
+    position: Position = self.market55_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market55_open_interest -= position.size
+    log Closed({market: 55, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits55(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market55_deposits[owner][n]
+        if total > 0x0038 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee55(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market55_fee = fee
+
+market56_oracle: public(address)
+market56_fee: public(uint256)
+market56_open_interest: public(uint256)
+market56_positions: HashMap[address, Position]
+market56_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open56(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market56_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market56_positions[msg.sender] = position
+    self.market56_open_interest += size - fee
+    log Opened({market: 56, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close56(price: uint256) -> int128:
+    position: Position = self.market56_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market56_open_interest -= position.size
+    log Closed({market: 56, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits56(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market56_deposits[owner][n]
+        if total > 0x0039 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee56(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market56_fee = fee
+
+market57_oracle: public(address)
+market57_fee: public(uint256)
+market57_open_interest: public(uint256)
+market57_positions: HashMap[address, Position]
+market57_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open57(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market57_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market57_positions[msg.sender] = position
+    self.market57_open_interest += size - fee
+    log Opened({market: 57, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close57(price: uint256) -> int128:
+    position: Position = self.market57_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market57_open_interest -= position.size
+    log Closed({market: 57, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits57(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market57_deposits[owner][n]
+        if total > 0x003a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee57(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market57_fee = fee
+
+market58_oracle: public(address)
+market58_fee: public(uint256)
+market58_open_interest: public(uint256)
+market58_positions: HashMap[address, Position]
+market58_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open58(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market58_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market58_positions[msg.sender] = position
+    self.market58_open_interest += size - fee
+    log Opened({market: 58, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close58(price: uint256) -> int128:
+    position: Position = self.market58_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market58_open_interest -= position.size
+    log Closed({market: 58, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits58(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market58_deposits[owner][n]
+        if total > 0x003b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee58(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market58_fee = fee
+
+market59_oracle: public(address)
+market59_fee: public(uint256)
+market59_open_interest: public(uint256)
+market59_positions: HashMap[address, Position]
+market59_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open59(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market59_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market59_positions[msg.sender] = position
+    self.market59_open_interest += size - fee
+    log Opened({market: 59, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close59(price: uint256) -> int128:
+    position: Position = self.market59_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market59_open_interest -= position.size
+    log Closed({market: 59, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits59(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market59_deposits[owner][n]
+        if total > 0x003c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee59(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market59_fee = fee
+
+market60_oracle: public(address)
+market60_fee: public(uint256)
+market60_open_interest: public(uint256)
+market60_positions: HashMap[address, Position]
+market60_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open60(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market60_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market60_positions[msg.sender] = position
+    self.market60_open_interest += size - fee
+    log Opened({market: 60, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close60(price: uint256) -> int128:
+    position: Position = self.market60_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market60_open_interest -= position.size
+    log Closed({market: 60, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits60(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market60_deposits[owner][n]
+        if total > 0x003d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee60(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market60_fee = fee
+
+market61_oracle: public(address)
+market61_fee: public(uint256)
+market61_open_interest: public(uint256)
+market61_positions: HashMap[address, Position]
+market61_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open61(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market61_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market61_positions[msg.sender] = position
+    self.market61_open_interest += size - fee
+    log Opened({market: 61, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close61(price: uint256) -> int128:
+    position: Position = self.market61_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market61_open_interest -= position.size
+    log Closed({market: 61, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits61(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market61_deposits[owner][n]
+        if total > 0x003e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee61(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market61_fee = fee
+
+market62_oracle: public(address)
+market62_fee: public(uint256)
+market62_open_interest: public(uint256)
+market62_positions: HashMap[address, Position]
+market62_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open62(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market62_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market62_positions[msg.sender] = position
+    self.market62_open_interest += size - fee
+    log Opened({market: 62, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close62(price: uint256) -> int128:
+    position: Position = self.market62_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market62_open_interest -= position.size
+    log Closed({market: 62, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits62(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market62_deposits[owner][n]
+        if total > 0x003f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee62(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market62_fee = fee
+
+market63_oracle: public(address)
+market63_fee: public(uint256)
+market63_open_interest: public(uint256)
+market63_positions: HashMap[address, Position]
+market63_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open63(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market63_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market63_positions[msg.sender] = position
+    self.market63_open_interest += size - fee
+    log Opened({market: 63, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close63(price: uint256) -> int128:
+    position: Position = self.market63_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market63_open_interest -= position.size
+    log Closed({market: 63, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits63(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market63_deposits[owner][n]
+        if total > 0x0040 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee63(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market63_fee = fee
+
+market64_oracle: public(address)
+market64_fee: public(uint256)
+market64_open_interest: public(uint256)
+market64_positions: HashMap[address, Position]
+market64_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open64(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market64_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market64_positions[msg.sender] = position
+    self.market64_open_interest += size - fee
+    log Opened({market: 64, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close64(price: uint256) -> int128:
+    position: Position = self.market64_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market64_open_interest -= position.size
+    log Closed({market: 64, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits64(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market64_deposits[owner][n]
+        if total > 0x0041 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee64(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market64_fee = fee
+
+market65_oracle: public(address)
+market65_fee: public(uint256)
+market65_open_interest: public(uint256)
+market65_positions: HashMap[address, Position]
+market65_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open65(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market65_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market65_positions[msg.sender] = position
+    self.market65_open_interest += size - fee
+    log Opened({market: 65, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close65(price: uint256) -> int128:
+    position: Position = self.market65_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market65_open_interest -= position.size
+    log Closed({market: 65, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits65(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market65_deposits[owner][n]
+        if total > 0x0042 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee65(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market65_fee = fee
+
+market66_oracle: public(address)
+market66_fee: public(uint256)
+market66_open_interest: public(uint256)
+market66_positions: HashMap[address, Position]
+market66_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open66(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market66_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market66_positions[msg.sender] = position
+    self.market66_open_interest += size - fee
+    log Opened({market: 66, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close66(price: uint256) -> int128:
+    position: Position = self.market66_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market66_open_interest -= position.size
+    log Closed({market: 66, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits66(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market66_deposits[owner][n]
+        if total > 0x0043 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee66(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market66_fee = fee
+
+market67_oracle: public(address)
+market67_fee: public(uint256)
+market67_open_interest: public(uint256)
+market67_positions: HashMap[address, Position]
+market67_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open67(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market67_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market67_positions[msg.sender] = position
+    self.market67_open_interest += size - fee
+    log Opened({market: 67, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close67(price: uint256) -> int128:
+    position: Position = self.market67_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market67_open_interest -= position.size
+    log Closed({market: 67, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits67(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market67_deposits[owner][n]
+        if total > 0x0044 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee67(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market67_fee = fee
+
+market68_oracle: public(address)
+market68_fee: public(uint256)
+market68_open_interest: public(uint256)
+market68_positions: HashMap[address, Position]
+market68_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open68(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market68_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market68_positions[msg.sender] = position
+    self.market68_open_interest += size - fee
+    log Opened({market: 68, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close68(price: uint256) -> int128:
+    position: Position = self.market68_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market68_open_interest -= position.size
+    log Closed({market: 68, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits68(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market68_deposits[owner][n]
+        if total > 0x0045 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee68(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market68_fee = fee
+
+market69_oracle: public(address)
+market69_fee: public(uint256)
+market69_open_interest: public(uint256)
+market69_positions: HashMap[address, Position]
+market69_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open69(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market69_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market69_positions[msg.sender] = position
+    self.market69_open_interest += size - fee
+    log Opened({market: 69, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close69(price: uint256) -> int128:
+    position: Position = self.market69_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market69_open_interest -= position.size
+    log Closed({market: 69, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits69(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market69_deposits[owner][n]
+        if total > 0x0046 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee69(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market69_fee = fee
+
+market70_oracle: public(address)
+market70_fee: public(uint256)
+market70_open_interest: public(uint256)
+market70_positions: HashMap[address, Position]
+market70_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open70(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market70_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market70_positions[msg.sender] = position
+    self.market70_open_interest += size - fee
+    log Opened({market: 70, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close70(price: uint256) -> int128:
+    position: Position = self.market70_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market70_open_interest -= position.size
+    log Closed({market: 70, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits70(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market70_deposits[owner][n]
+        if total > 0x0047 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee70(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market70_fee = fee
+
+market71_oracle: public(address)
+market71_fee: public(uint256)
+market71_open_interest: public(uint256)
+market71_positions: HashMap[address, Position]
+market71_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open71(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market71_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market71_positions[msg.sender] = position
+    self.market71_open_interest += size - fee
+    log Opened({market: 71, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close71(price: uint256) -> int128:
+    position: Position = self.market71_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market71_open_interest -= position.size
+    log Closed({market: 71, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits71(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market71_deposits[owner][n]
+        if total > 0x0048 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee71(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market71_fee = fee
+
+market72_oracle: public(address)
+market72_fee: public(uint256)
+market72_open_interest: public(uint256)
+market72_positions: HashMap[address, Position]
+market72_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open72(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market72_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market72_positions[msg.sender] = position
+    self.market72_open_interest += size - fee
+    log Opened({market: 72, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close72(price: uint256) -> int128:
+    position: Position = self.market72_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market72_open_interest -= position.size
+    log Closed({market: 72, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits72(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market72_deposits[owner][n]
+        if total > 0x0049 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee72(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market72_fee = fee
+
+market73_oracle: public(address)
+market73_fee: public(uint256)
+market73_open_interest: public(uint256)
+market73_positions: HashMap[address, Position]
+market73_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open73(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market73_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market73_positions[msg.sender] = position
+    self.market73_open_interest += size - fee
+    log Opened({market: 73, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close73(price: uint256) -> int128:
+    position: Position = self.market73_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market73_open_interest -= position.size
+    log Closed({market: 73, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits73(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market73_deposits[owner][n]
+        if total > 0x004a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee73(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market73_fee = fee
+
+market74_oracle: public(address)
+market74_fee: public(uint256)
+market74_open_interest: public(uint256)
+market74_positions: HashMap[address, Position]
+market74_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open74(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market74_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market74_positions[msg.sender] = position
+    self.market74_open_interest += size - fee
+    log Opened({market: 74, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close74(price: uint256) -> int128:
+    position: Position = self.market74_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market74_open_interest -= position.size
+    log Closed({market: 74, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits74(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market74_deposits[owner][n]
+        if total > 0x004b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee74(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market74_fee = fee
+
+market75_oracle: public(address)
+market75_fee: public(uint256)
+market75_open_interest: public(uint256)
+market75_positions: HashMap[address, Position]
+market75_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open75(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market75_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market75_positions[msg.sender] = position
+    self.market75_open_interest += size - fee
+    log Opened({market: 75, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close75(price: uint256) -> int128:
+    position: Position = self.market75_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market75_open_interest -= position.size
+    log Closed({market: 75, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits75(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market75_deposits[owner][n]
+        if total > 0x004c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee75(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market75_fee = fee
+
+market76_oracle: public(address)
+market76_fee: public(uint256)
+market76_open_interest: public(uint256)
+market76_positions: HashMap[address, Position]
+market76_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open76(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market76_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market76_positions[msg.sender] = position
+    self.market76_open_interest += size - fee
+    log Opened({market: 76, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close76(price: uint256) -> int128:
+    position: Position = self.market76_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market76_open_interest -= position.size
+    log Closed({market: 76, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits76(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market76_deposits[owner][n]
+        if total > 0x004d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee76(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market76_fee = fee
+
+market77_oracle: public(address)
+market77_fee: public(uint256)
+market77_open_interest: public(uint256)
+market77_positions: HashMap[address, Position]
+market77_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open77(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market77_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market77_positions[msg.sender] = position
+    self.market77_open_interest += size - fee
+    log Opened({market: 77, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close77(price: uint256) -> int128:
+    position: Position = self.market77_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market77_open_interest -= position.size
+    log Closed({market: 77, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits77(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market77_deposits[owner][n]
+        if total > 0x004e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee77(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market77_fee = fee
+
+market78_oracle: public(address)
+market78_fee: public(uint256)
+market78_open_interest: public(uint256)
+market78_positions: HashMap[address, Position]
+market78_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open78(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market78_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market78_positions[msg.sender] = position
+    self.market78_open_interest += size - fee
+    log Opened({market: 78, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close78(price: uint256) -> int128:
+    position: Position = self.market78_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market78_open_interest -= position.size
+    log Closed({market: 78, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits78(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market78_deposits[owner][n]
+        if total > 0x004f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee78(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market78_fee = fee
+
+market79_oracle: public(address)
+market79_fee: public(uint256)
+market79_open_interest: public(uint256)
+market79_positions: HashMap[address, Position]
+market79_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open79(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market79_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market79_positions[msg.sender] = position
+    self.market79_open_interest += size - fee
+    log Opened({market: 79, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close79(price: uint256) -> int128:
+    position: Position = self.market79_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market79_open_interest -= position.size
+    log Closed({market: 79, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits79(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market79_deposits[owner][n]
+        if total > 0x0050 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee79(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market79_fee = fee
+
+market80_oracle: public(address)
+market80_fee: public(uint256)
+market80_open_interest: public(uint256)
+market80_positions: HashMap[address, Position]
+market80_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open80(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market80_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market80_positions[msg.sender] = position
+    self.market80_open_interest += size - fee
+    log Opened({market: 80, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close80(price: uint256) -> int128:
+    position: Position = self.market80_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market80_open_interest -= position.size
+    log Closed({market: 80, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits80(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market80_deposits[owner][n]
+        if total > 0x0051 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee80(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market80_fee = fee
+
+market81_oracle: public(address)
+market81_fee: public(uint256)
+market81_open_interest: public(uint256)
+market81_positions: HashMap[address, Position]
+market81_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open81(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market81_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market81_positions[msg.sender] = position
+    self.market81_open_interest += size - fee
+    log Opened({market: 81, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close81(price: uint256) -> int128:
+    position: Position = self.market81_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market81_open_interest -= position.size
+    log Closed({market: 81, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits81(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market81_deposits[owner][n]
+        if total > 0x0052 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee81(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market81_fee = fee
+
+market82_oracle: public(address)
+market82_fee: public(uint256)
+market82_open_interest: public(uint256)
+market82_positions: HashMap[address, Position]
+market82_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open82(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market82_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market82_positions[msg.sender] = position
+    self.market82_open_interest += size - fee
+    log Opened({market: 82, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close82(price: uint256) -> int128:
+    position: Position = self.market82_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market82_open_interest -= position.size
+    log Closed({market: 82, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits82(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market82_deposits[owner][n]
+        if total > 0x0053 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee82(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market82_fee = fee
+
+market83_oracle: public(address)
+market83_fee: public(uint256)
+market83_open_interest: public(uint256)
+market83_positions: HashMap[address, Position]
+market83_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open83(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market83_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market83_positions[msg.sender] = position
+    self.market83_open_interest += size - fee
+    log Opened({market: 83, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close83(price: uint256) -> int128:
+    position: Position = self.market83_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market83_open_interest -= position.size
+    log Closed({market: 83, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits83(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market83_deposits[owner][n]
+        if total > 0x0054 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee83(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market83_fee = fee
+
+market84_oracle: public(address)
+market84_fee: public(uint256)
+market84_open_interest: public(uint256)
+market84_positions: HashMap[address, Position]
+market84_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open84(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market84_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market84_positions[msg.sender] = position
+    self.market84_open_interest += size - fee
+    log Opened({market: 84, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close84(price: uint256) -> int128:
+    position: Position = self.market84_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market84_open_interest -= position.size
+    log Closed({market: 84, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits84(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market84_deposits[owner][n]
+        if total > 0x0055 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee84(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market84_fee = fee
+
+market85_oracle: public(address)
+market85_fee: public(uint256)
+market85_open_interest: public(uint256)
+market85_positions: HashMap[address, Position]
+market85_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open85(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market85_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market85_positions[msg.sender] = position
+    self.market85_open_interest += size - fee
+    log Opened({market: 85, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close85(price: uint256) -> int128:
+    position: Position = self.market85_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market85_open_interest -= position.size
+    log Closed({market: 85, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits85(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market85_deposits[owner][n]
+        if total > 0x0056 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee85(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market85_fee = fee
+
+market86_oracle: public(address)
+market86_fee: public(uint256)
+market86_open_interest: public(uint256)
+market86_positions: HashMap[address, Position]
+market86_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open86(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market86_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market86_positions[msg.sender] = position
+    self.market86_open_interest += size - fee
+    log Opened({market: 86, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close86(price: uint256) -> int128:
+    position: Position = self.market86_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market86_open_interest -= position.size
+    log Closed({market: 86, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits86(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market86_deposits[owner][n]
+        if total > 0x0057 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee86(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market86_fee = fee
+
+market87_oracle: public(address)
+market87_fee: public(uint256)
+market87_open_interest: public(uint256)
+market87_positions: HashMap[address, Position]
+market87_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open87(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market87_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market87_positions[msg.sender] = position
+    self.market87_open_interest += size - fee
+    log Opened({market: 87, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close87(price: uint256) -> int128:
+    position: Position = self.market87_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market87_open_interest -= position.size
+    log Closed({market: 87, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits87(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market87_deposits[owner][n]
+        if total > 0x0058 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee87(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market87_fee = fee
+
+market88_oracle: public(address)
+market88_fee: public(uint256)
+market88_open_interest: public(uint256)
+market88_positions: HashMap[address, Position]
+market88_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open88(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market88_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market88_positions[msg.sender] = position
+    self.market88_open_interest += size - fee
+    log Opened({market: 88, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close88(price: uint256) -> int128:
+    position: Position = self.market88_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market88_open_interest -= position.size
+    log Closed({market: 88, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits88(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market88_deposits[owner][n]
+        if total > 0x0059 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee88(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market88_fee = fee
+
+market89_oracle: public(address)
+market89_fee: public(uint256)
+market89_open_interest: public(uint256)
+market89_positions: HashMap[address, Position]
+market89_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open89(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market89_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market89_positions[msg.sender] = position
+    self.market89_open_interest += size - fee
+    log Opened({market: 89, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close89(price: uint256) -> int128:
+    position: Position = self.market89_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market89_open_interest -= position.size
+    log Closed({market: 89, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits89(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market89_deposits[owner][n]
+        if total > 0x005a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee89(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market89_fee = fee
+
+market90_oracle: public(address)
+market90_fee: public(uint256)
+market90_open_interest: public(uint256)
+market90_positions: HashMap[address, Position]
+market90_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open90(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market90_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market90_positions[msg.sender] = position
+    self.market90_open_interest += size - fee
+    log Opened({market: 90, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close90(price: uint256) -> int128:
+    position: Position = self.market90_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market90_open_interest -= position.size
+    log Closed({market: 90, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits90(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market90_deposits[owner][n]
+        if total > 0x005b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee90(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market90_fee = fee
+
+market91_oracle: public(address)
+market91_fee: public(uint256)
+market91_open_interest: public(uint256)
+market91_positions: HashMap[address, Position]
+market91_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open91(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market91_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market91_positions[msg.sender] = position
+    self.market91_open_interest += size - fee
+    log Opened({market: 91, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close91(price: uint256) -> int128:
+    position: Position = self.market91_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market91_open_interest -= position.size
+    log Closed({market: 91, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits91(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market91_deposits[owner][n]
+        if total > 0x005c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee91(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market91_fee = fee
+
+market92_oracle: public(address)
+market92_fee: public(uint256)
+market92_open_interest: public(uint256)
+market92_positions: HashMap[address, Position]
+market92_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open92(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market92_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market92_positions[msg.sender] = position
+    self.market92_open_interest += size - fee
+    log Opened({market: 92, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close92(price: uint256) -> int128:
+    position: Position = self.market92_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market92_open_interest -= position.size
+    log Closed({market: 92, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits92(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market92_deposits[owner][n]
+        if total > 0x005d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee92(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market92_fee = fee
+
+market93_oracle: public(address)
+market93_fee: public(uint256)
+market93_open_interest: public(uint256)
+market93_positions: HashMap[address, Position]
+market93_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open93(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market93_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market93_positions[msg.sender] = position
+    self.market93_open_interest += size - fee
+    log Opened({market: 93, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close93(price: uint256) -> int128:
+    position: Position = self.market93_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market93_open_interest -= position.size
+    log Closed({market: 93, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits93(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market93_deposits[owner][n]
+        if total > 0x005e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee93(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market93_fee = fee
+
+market94_oracle: public(address)
+market94_fee: public(uint256)
+market94_open_interest: public(uint256)
+market94_positions: HashMap[address, Position]
+market94_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open94(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market94_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market94_positions[msg.sender] = position
+    self.market94_open_interest += size - fee
+    log Opened({market: 94, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close94(price: uint256) -> int128:
+    position: Position = self.market94_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market94_open_interest -= position.size
+    log Closed({market: 94, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits94(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market94_deposits[owner][n]
+        if total > 0x005f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee94(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market94_fee = fee
+
+market95_oracle: public(address)
+market95_fee: public(uint256)
+market95_open_interest: public(uint256)
+market95_positions: HashMap[address, Position]
+market95_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open95(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market95_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market95_positions[msg.sender] = position
+    self.market95_open_interest += size - fee
+    log Opened({market: 95, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close95(price: uint256) -> int128:
+    position: Position = self.market95_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market95_open_interest -= position.size
+    log Closed({market: 95, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits95(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market95_deposits[owner][n]
+        if total > 0x0060 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee95(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market95_fee = fee
+
+market96_oracle: public(address)
+market96_fee: public(uint256)
+market96_open_interest: public(uint256)
+market96_positions: HashMap[address, Position]
+market96_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open96(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market96_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market96_positions[msg.sender] = position
+    self.market96_open_interest += size - fee
+    log Opened({market: 96, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close96(price: uint256) -> int128:
+    position: Position = self.market96_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market96_open_interest -= position.size
+    log Closed({market: 96, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits96(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market96_deposits[owner][n]
+        if total > 0x0061 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee96(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market96_fee = fee
+
+market97_oracle: public(address)
+market97_fee: public(uint256)
+market97_open_interest: public(uint256)
+market97_positions: HashMap[address, Position]
+market97_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open97(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market97_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market97_positions[msg.sender] = position
+    self.market97_open_interest += size - fee
+    log Opened({market: 97, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close97(price: uint256) -> int128:
+    position: Position = self.market97_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market97_open_interest -= position.size
+    log Closed({market: 97, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits97(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market97_deposits[owner][n]
+        if total > 0x0062 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee97(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market97_fee = fee
+
+market98_oracle: public(address)
+market98_fee: public(uint256)
+market98_open_interest: public(uint256)
+market98_positions: HashMap[address, Position]
+market98_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open98(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market98_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market98_positions[msg.sender] = position
+    self.market98_open_interest += size - fee
+    log Opened({market: 98, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close98(price: uint256) -> int128:
+    position: Position = self.market98_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market98_open_interest -= position.size
+    log Closed({market: 98, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits98(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market98_deposits[owner][n]
+        if total > 0x0063 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee98(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market98_fee = fee
+
+market99_oracle: public(address)
+market99_fee: public(uint256)
+market99_open_interest: public(uint256)
+market99_positions: HashMap[address, Position]
+market99_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open99(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market99_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market99_positions[msg.sender] = position
+    self.market99_open_interest += size - fee
+    log Opened({market: 99, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close99(price: uint256) -> int128:
+    position: Position = self.market99_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market99_open_interest -= position.size
+    log Closed({market: 99, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits99(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market99_deposits[owner][n]
+        if total > 0x0064 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee99(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market99_fee = fee
+
+market100_oracle: public(address)
+market100_fee: public(uint256)
+market100_open_interest: public(uint256)
+market100_positions: HashMap[address, Position]
+market100_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open100(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market100_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market100_positions[msg.sender] = position
+    self.market100_open_interest += size - fee
+    log Opened({market: 100, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close100(price: uint256) -> int128:
+    position: Position = self.market100_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market100_open_interest -= position.size
+    log Closed({market: 100, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits100(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market100_deposits[owner][n]
+        if total > 0x0065 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee100(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market100_fee = fee
+
+market101_oracle: public(address)
+market101_fee: public(uint256)
+market101_open_interest: public(uint256)
+market101_positions: HashMap[address, Position]
+market101_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open101(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market101_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market101_positions[msg.sender] = position
+    self.market101_open_interest += size - fee
+    log Opened({market: 101, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close101(price: uint256) -> int128:
+    position: Position = self.market101_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market101_open_interest -= position.size
+    log Closed({market: 101, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits101(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market101_deposits[owner][n]
+        if total > 0x0066 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee101(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market101_fee = fee
+
+market102_oracle: public(address)
+market102_fee: public(uint256)
+market102_open_interest: public(uint256)
+market102_positions: HashMap[address, Position]
+market102_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open102(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market102_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market102_positions[msg.sender] = position
+    self.market102_open_interest += size - fee
+    log Opened({market: 102, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close102(price: uint256) -> int128:
+    position: Position = self.market102_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market102_open_interest -= position.size
+    log Closed({market: 102, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits102(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market102_deposits[owner][n]
+        if total > 0x0067 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee102(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market102_fee = fee
+
+market103_oracle: public(address)
+market103_fee: public(uint256)
+market103_open_interest: public(uint256)
+market103_positions: HashMap[address, Position]
+market103_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open103(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market103_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market103_positions[msg.sender] = position
+    self.market103_open_interest += size - fee
+    log Opened({market: 103, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close103(price: uint256) -> int128:
+    position: Position = self.market103_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market103_open_interest -= position.size
+    log Closed({market: 103, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits103(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market103_deposits[owner][n]
+        if total > 0x0068 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee103(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market103_fee = fee
+
+market104_oracle: public(address)
+market104_fee: public(uint256)
+market104_open_interest: public(uint256)
+market104_positions: HashMap[address, Position]
+market104_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open104(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market104_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market104_positions[msg.sender] = position
+    self.market104_open_interest += size - fee
+    log Opened({market: 104, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close104(price: uint256) -> int128:
+    position: Position = self.market104_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market104_open_interest -= position.size
+    log Closed({market: 104, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits104(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market104_deposits[owner][n]
+        if total > 0x0069 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee104(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market104_fee = fee
+
+market105_oracle: public(address)
+market105_fee: public(uint256)
+market105_open_interest: public(uint256)
+market105_positions: HashMap[address, Position]
+market105_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open105(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market105_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market105_positions[msg.sender] = position
+    self.market105_open_interest += size - fee
+    log Opened({market: 105, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close105(price: uint256) -> int128:
+    position: Position = self.market105_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market105_open_interest -= position.size
+    log Closed({market: 105, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits105(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market105_deposits[owner][n]
+        if total > 0x006a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee105(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market105_fee = fee
+
+market106_oracle: public(address)
+market106_fee: public(uint256)
+market106_open_interest: public(uint256)
+market106_positions: HashMap[address, Position]
+market106_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open106(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market106_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market106_positions[msg.sender] = position
+    self.market106_open_interest += size - fee
+    log Opened({market: 106, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close106(price: uint256) -> int128:
+    position: Position = self.market106_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market106_open_interest -= position.size
+    log Closed({market: 106, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits106(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market106_deposits[owner][n]
+        if total > 0x006b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee106(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market106_fee = fee
+
+market107_oracle: public(address)
+market107_fee: public(uint256)
+market107_open_interest: public(uint256)
+market107_positions: HashMap[address, Position]
+market107_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open107(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market107_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market107_positions[msg.sender] = position
+    self.market107_open_interest += size - fee
+    log Opened({market: 107, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close107(price: uint256) -> int128:
+    position: Position = self.market107_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market107_open_interest -= position.size
+    log Closed({market: 107, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits107(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market107_deposits[owner][n]
+        if total > 0x006c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee107(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market107_fee = fee
+
+market108_oracle: public(address)
+market108_fee: public(uint256)
+market108_open_interest: public(uint256)
+market108_positions: HashMap[address, Position]
+market108_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open108(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market108_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market108_positions[msg.sender] = position
+    self.market108_open_interest += size - fee
+    log Opened({market: 108, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close108(price: uint256) -> int128:
+    position: Position = self.market108_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market108_open_interest -= position.size
+    log Closed({market: 108, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits108(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market108_deposits[owner][n]
+        if total > 0x006d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee108(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market108_fee = fee
+
+market109_oracle: public(address)
+market109_fee: public(uint256)
+market109_open_interest: public(uint256)
+market109_positions: HashMap[address, Position]
+market109_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open109(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market109_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market109_positions[msg.sender] = position
+    self.market109_open_interest += size - fee
+    log Opened({market: 109, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close109(price: uint256) -> int128:
+    position: Position = self.market109_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market109_open_interest -= position.size
+    log Closed({market: 109, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits109(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market109_deposits[owner][n]
+        if total > 0x006e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee109(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market109_fee = fee
+
+market110_oracle: public(address)
+market110_fee: public(uint256)
+market110_open_interest: public(uint256)
+market110_positions: HashMap[address, Position]
+market110_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open110(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market110_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market110_positions[msg.sender] = position
+    self.market110_open_interest += size - fee
+    log Opened({market: 110, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close110(price: uint256) -> int128:
+    position: Position = self.market110_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market110_open_interest -= position.size
+    log Closed({market: 110, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits110(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market110_deposits[owner][n]
+        if total > 0x006f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee110(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market110_fee = fee
+
+market111_oracle: public(address)
+market111_fee: public(uint256)
+market111_open_interest: public(uint256)
+market111_positions: HashMap[address, Position]
+market111_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open111(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market111_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market111_positions[msg.sender] = position
+    self.market111_open_interest += size - fee
+    log Opened({market: 111, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close111(price: uint256) -> int128:
+    position: Position = self.market111_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market111_open_interest -= position.size
+    log Closed({market: 111, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits111(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market111_deposits[owner][n]
+        if total > 0x0070 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee111(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market111_fee = fee
+
+market112_oracle: public(address)
+market112_fee: public(uint256)
+market112_open_interest: public(uint256)
+market112_positions: HashMap[address, Position]
+market112_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open112(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market112_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market112_positions[msg.sender] = position
+    self.market112_open_interest += size - fee
+    log Opened({market: 112, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close112(price: uint256) -> int128:
+    position: Position = self.market112_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market112_open_interest -= position.size
+    log Closed({market: 112, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits112(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market112_deposits[owner][n]
+        if total > 0x0071 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee112(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market112_fee = fee
+
+market113_oracle: public(address)
+market113_fee: public(uint256)
+market113_open_interest: public(uint256)
+market113_positions: HashMap[address, Position]
+market113_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open113(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market113_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market113_positions[msg.sender] = position
+    self.market113_open_interest += size - fee
+    log Opened({market: 113, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close113(price: uint256) -> int128:
+    position: Position = self.market113_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market113_open_interest -= position.size
+    log Closed({market: 113, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits113(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market113_deposits[owner][n]
+        if total > 0x0072 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee113(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market113_fee = fee
+
+market114_oracle: public(address)
+market114_fee: public(uint256)
+market114_open_interest: public(uint256)
+market114_positions: HashMap[address, Position]
+market114_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open114(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market114_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market114_positions[msg.sender] = position
+    self.market114_open_interest += size - fee
+    log Opened({market: 114, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close114(price: uint256) -> int128:
+    position: Position = self.market114_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market114_open_interest -= position.size
+    log Closed({market: 114, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits114(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market114_deposits[owner][n]
+        if total > 0x0073 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee114(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market114_fee = fee
+
+market115_oracle: public(address)
+market115_fee: public(uint256)
+market115_open_interest: public(uint256)
+market115_positions: HashMap[address, Position]
+market115_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open115(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market115_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market115_positions[msg.sender] = position
+    self.market115_open_interest += size - fee
+    log Opened({market: 115, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close115(price: uint256) -> int128:
+    position: Position = self.market115_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market115_open_interest -= position.size
+    log Closed({market: 115, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits115(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market115_deposits[owner][n]
+        if total > 0x0074 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee115(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market115_fee = fee
+
+market116_oracle: public(address)
+market116_fee: public(uint256)
+market116_open_interest: public(uint256)
+market116_positions: HashMap[address, Position]
+market116_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open116(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market116_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market116_positions[msg.sender] = position
+    self.market116_open_interest += size - fee
+    log Opened({market: 116, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close116(price: uint256) -> int128:
+    position: Position = self.market116_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market116_open_interest -= position.size
+    log Closed({market: 116, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits116(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market116_deposits[owner][n]
+        if total > 0x0075 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee116(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market116_fee = fee
+
+market117_oracle: public(address)
+market117_fee: public(uint256)
+market117_open_interest: public(uint256)
+market117_positions: HashMap[address, Position]
+market117_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open117(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market117_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market117_positions[msg.sender] = position
+    self.market117_open_interest += size - fee
+    log Opened({market: 117, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close117(price: uint256) -> int128:
+    position: Position = self.market117_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market117_open_interest -= position.size
+    log Closed({market: 117, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits117(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market117_deposits[owner][n]
+        if total > 0x0076 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee117(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market117_fee = fee
+
+market118_oracle: public(address)
+market118_fee: public(uint256)
+market118_open_interest: public(uint256)
+market118_positions: HashMap[address, Position]
+market118_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open118(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market118_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market118_positions[msg.sender] = position
+    self.market118_open_interest += size - fee
+    log Opened({market: 118, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close118(price: uint256) -> int128:
+    position: Position = self.market118_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market118_open_interest -= position.size
+    log Closed({market: 118, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits118(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market118_deposits[owner][n]
+        if total > 0x0077 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee118(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market118_fee = fee
+
+market119_oracle: public(address)
+market119_fee: public(uint256)
+market119_open_interest: public(uint256)
+market119_positions: HashMap[address, Position]
+market119_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open119(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market119_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market119_positions[msg.sender] = position
+    self.market119_open_interest += size - fee
+    log Opened({market: 119, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close119(price: uint256) -> int128:
+    position: Position = self.market119_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market119_open_interest -= position.size
+    log Closed({market: 119, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits119(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market119_deposits[owner][n]
+        if total > 0x0078 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee119(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market119_fee = fee
+
+market120_oracle: public(address)
+market120_fee: public(uint256)
+market120_open_interest: public(uint256)
+market120_positions: HashMap[address, Position]
+market120_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open120(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market120_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market120_positions[msg.sender] = position
+    self.market120_open_interest += size - fee
+    log Opened({market: 120, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close120(price: uint256) -> int128:
+    position: Position = self.market120_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market120_open_interest -= position.size
+    log Closed({market: 120, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits120(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market120_deposits[owner][n]
+        if total > 0x0079 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee120(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market120_fee = fee
+
+market121_oracle: public(address)
+market121_fee: public(uint256)
+market121_open_interest: public(uint256)
+market121_positions: HashMap[address, Position]
+market121_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open121(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market121_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market121_positions[msg.sender] = position
+    self.market121_open_interest += size - fee
+    log Opened({market: 121, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close121(price: uint256) -> int128:
+    position: Position = self.market121_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market121_open_interest -= position.size
+    log Closed({market: 121, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits121(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market121_deposits[owner][n]
+        if total > 0x007a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee121(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market121_fee = fee
+
+market122_oracle: public(address)
+market122_fee: public(uint256)
+market122_open_interest: public(uint256)
+market122_positions: HashMap[address, Position]
+market122_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open122(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market122_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market122_positions[msg.sender] = position
+    self.market122_open_interest += size - fee
+    log Opened({market: 122, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close122(price: uint256) -> int128:
+    position: Position = self.market122_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market122_open_interest -= position.size
+    log Closed({market: 122, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits122(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market122_deposits[owner][n]
+        if total > 0x007b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee122(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market122_fee = fee
+
+market123_oracle: public(address)
+market123_fee: public(uint256)
+market123_open_interest: public(uint256)
+market123_positions: HashMap[address, Position]
+market123_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open123(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market123_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market123_positions[msg.sender] = position
+    self.market123_open_interest += size - fee
+    log Opened({market: 123, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close123(price: uint256) -> int128:
+    position: Position = self.market123_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market123_open_interest -= position.size
+    log Closed({market: 123, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits123(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market123_deposits[owner][n]
+        if total > 0x007c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee123(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market123_fee = fee
+
+market124_oracle: public(address)
+market124_fee: public(uint256)
+market124_open_interest: public(uint256)
+market124_positions: HashMap[address, Position]
+market124_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open124(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market124_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market124_positions[msg.sender] = position
+    self.market124_open_interest += size - fee
+    log Opened({market: 124, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close124(price: uint256) -> int128:
+    position: Position = self.market124_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market124_open_interest -= position.size
+    log Closed({market: 124, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits124(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market124_deposits[owner][n]
+        if total > 0x007d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee124(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market124_fee = fee
+
+market125_oracle: public(address)
+market125_fee: public(uint256)
+market125_open_interest: public(uint256)
+market125_positions: HashMap[address, Position]
+market125_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open125(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market125_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market125_positions[msg.sender] = position
+    self.market125_open_interest += size - fee
+    log Opened({market: 125, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close125(price: uint256) -> int128:
+    position: Position = self.market125_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market125_open_interest -= position.size
+    log Closed({market: 125, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits125(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market125_deposits[owner][n]
+        if total > 0x007e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee125(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market125_fee = fee
+
+market126_oracle: public(address)
+market126_fee: public(uint256)
+market126_open_interest: public(uint256)
+market126_positions: HashMap[address, Position]
+market126_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open126(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market126_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market126_positions[msg.sender] = position
+    self.market126_open_interest += size - fee
+    log Opened({market: 126, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close126(price: uint256) -> int128:
+    position: Position = self.market126_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market126_open_interest -= position.size
+    log Closed({market: 126, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits126(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market126_deposits[owner][n]
+        if total > 0x007f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee126(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market126_fee = fee
+
+market127_oracle: public(address)
+market127_fee: public(uint256)
+market127_open_interest: public(uint256)
+market127_positions: HashMap[address, Position]
+market127_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open127(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market127_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market127_positions[msg.sender] = position
+    self.market127_open_interest += size - fee
+    log Opened({market: 127, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close127(price: uint256) -> int128:
+    position: Position = self.market127_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market127_open_interest -= position.size
+    log Closed({market: 127, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits127(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market127_deposits[owner][n]
+        if total > 0x0080 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee127(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market127_fee = fee
+
+market128_oracle: public(address)
+market128_fee: public(uint256)
+market128_open_interest: public(uint256)
+market128_positions: HashMap[address, Position]
+market128_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open128(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market128_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market128_positions[msg.sender] = position
+    self.market128_open_interest += size - fee
+    log Opened({market: 128, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close128(price: uint256) -> int128:
+    position: Position = self.market128_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market128_open_interest -= position.size
+    log Closed({market: 128, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits128(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market128_deposits[owner][n]
+        if total > 0x0081 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee128(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market128_fee = fee
+
+market129_oracle: public(address)
+market129_fee: public(uint256)
+market129_open_interest: public(uint256)
+market129_positions: HashMap[address, Position]
+market129_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open129(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market129_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market129_positions[msg.sender] = position
+    self.market129_open_interest += size - fee
+    log Opened({market: 129, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close129(price: uint256) -> int128:
+    position: Position = self.market129_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market129_open_interest -= position.size
+    log Closed({market: 129, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits129(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market129_deposits[owner][n]
+        if total > 0x0082 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee129(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market129_fee = fee
+
+market130_oracle: public(address)
+market130_fee: public(uint256)
+market130_open_interest: public(uint256)
+market130_positions: HashMap[address, Position]
+market130_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open130(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market130_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market130_positions[msg.sender] = position
+    self.market130_open_interest += size - fee
+    log Opened({market: 130, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close130(price: uint256) -> int128:
+    position: Position = self.market130_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market130_open_interest -= position.size
+    log Closed({market: 130, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits130(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market130_deposits[owner][n]
+        if total > 0x0083 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee130(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market130_fee = fee
+
+market131_oracle: public(address)
+market131_fee: public(uint256)
+market131_open_interest: public(uint256)
+market131_positions: HashMap[address, Position]
+market131_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open131(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market131_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market131_positions[msg.sender] = position
+    self.market131_open_interest += size - fee
+    log Opened({market: 131, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close131(price: uint256) -> int128:
+    position: Position = self.market131_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market131_open_interest -= position.size
+    log Closed({market: 131, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits131(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market131_deposits[owner][n]
+        if total > 0x0084 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee131(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market131_fee = fee
+
+market132_oracle: public(address)
+market132_fee: public(uint256)
+market132_open_interest: public(uint256)
+market132_positions: HashMap[address, Position]
+market132_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open132(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market132_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market132_positions[msg.sender] = position
+    self.market132_open_interest += size - fee
+    log Opened({market: 132, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close132(price: uint256) -> int128:
+    position: Position = self.market132_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market132_open_interest -= position.size
+    log Closed({market: 132, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits132(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market132_deposits[owner][n]
+        if total > 0x0085 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee132(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market132_fee = fee
+
+market133_oracle: public(address)
+market133_fee: public(uint256)
+market133_open_interest: public(uint256)
+market133_positions: HashMap[address, Position]
+market133_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open133(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market133_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market133_positions[msg.sender] = position
+    self.market133_open_interest += size - fee
+    log Opened({market: 133, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close133(price: uint256) -> int128:
+    position: Position = self.market133_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market133_open_interest -= position.size
+    log Closed({market: 133, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits133(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market133_deposits[owner][n]
+        if total > 0x0086 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee133(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market133_fee = fee
+
+market134_oracle: public(address)
+market134_fee: public(uint256)
+market134_open_interest: public(uint256)
+market134_positions: HashMap[address, Position]
+market134_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open134(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market134_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market134_positions[msg.sender] = position
+    self.market134_open_interest += size - fee
+    log Opened({market: 134, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close134(price: uint256) -> int128:
+    position: Position = self.market134_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market134_open_interest -= position.size
+    log Closed({market: 134, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits134(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market134_deposits[owner][n]
+        if total > 0x0087 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee134(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market134_fee = fee
+
+market135_oracle: public(address)
+market135_fee: public(uint256)
+market135_open_interest: public(uint256)
+market135_positions: HashMap[address, Position]
+market135_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open135(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market135_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market135_positions[msg.sender] = position
+    self.market135_open_interest += size - fee
+    log Opened({market: 135, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close135(price: uint256) -> int128:
+    position: Position = self.market135_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market135_open_interest -= position.size
+    log Closed({market: 135, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits135(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market135_deposits[owner][n]
+        if total > 0x0088 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee135(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market135_fee = fee
+
+market136_oracle: public(address)
+market136_fee: public(uint256)
+market136_open_interest: public(uint256)
+market136_positions: HashMap[address, Position]
+market136_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open136(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market136_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market136_positions[msg.sender] = position
+    self.market136_open_interest += size - fee
+    log Opened({market: 136, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close136(price: uint256) -> int128:
+    position: Position = self.market136_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market136_open_interest -= position.size
+    log Closed({market: 136, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits136(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market136_deposits[owner][n]
+        if total > 0x0089 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee136(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market136_fee = fee
+
+market137_oracle: public(address)
+market137_fee: public(uint256)
+market137_open_interest: public(uint256)
+market137_positions: HashMap[address, Position]
+market137_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open137(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market137_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market137_positions[msg.sender] = position
+    self.market137_open_interest += size - fee
+    log Opened({market: 137, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close137(price: uint256) -> int128:
+    position: Position = self.market137_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market137_open_interest -= position.size
+    log Closed({market: 137, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits137(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market137_deposits[owner][n]
+        if total > 0x008a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee137(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market137_fee = fee
+
+market138_oracle: public(address)
+market138_fee: public(uint256)
+market138_open_interest: public(uint256)
+market138_positions: HashMap[address, Position]
+market138_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open138(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market138_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market138_positions[msg.sender] = position
+    self.market138_open_interest += size - fee
+    log Opened({market: 138, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close138(price: uint256) -> int128:
+    position: Position = self.market138_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market138_open_interest -= position.size
+    log Closed({market: 138, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits138(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market138_deposits[owner][n]
+        if total > 0x008b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee138(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market138_fee = fee
+
+market139_oracle: public(address)
+market139_fee: public(uint256)
+market139_open_interest: public(uint256)
+market139_positions: HashMap[address, Position]
+market139_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open139(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market139_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market139_positions[msg.sender] = position
+    self.market139_open_interest += size - fee
+    log Opened({market: 139, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close139(price: uint256) -> int128:
+    position: Position = self.market139_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market139_open_interest -= position.size
+    log Closed({market: 139, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits139(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market139_deposits[owner][n]
+        if total > 0x008c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee139(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market139_fee = fee
+
+market140_oracle: public(address)
+market140_fee: public(uint256)
+market140_open_interest: public(uint256)
+market140_positions: HashMap[address, Position]
+market140_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open140(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market140_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market140_positions[msg.sender] = position
+    self.market140_open_interest += size - fee
+    log Opened({market: 140, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close140(price: uint256) -> int128:
+    position: Position = self.market140_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market140_open_interest -= position.size
+    log Closed({market: 140, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits140(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market140_deposits[owner][n]
+        if total > 0x008d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee140(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market140_fee = fee
+
+market141_oracle: public(address)
+market141_fee: public(uint256)
+market141_open_interest: public(uint256)
+market141_positions: HashMap[address, Position]
+market141_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open141(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market141_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market141_positions[msg.sender] = position
+    self.market141_open_interest += size - fee
+    log Opened({market: 141, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close141(price: uint256) -> int128:
+    position: Position = self.market141_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market141_open_interest -= position.size
+    log Closed({market: 141, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits141(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market141_deposits[owner][n]
+        if total > 0x008e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee141(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market141_fee = fee
+
+market142_oracle: public(address)
+market142_fee: public(uint256)
+market142_open_interest: public(uint256)
+market142_positions: HashMap[address, Position]
+market142_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open142(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market142_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market142_positions[msg.sender] = position
+    self.market142_open_interest += size - fee
+    log Opened({market: 142, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close142(price: uint256) -> int128:
+    position: Position = self.market142_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market142_open_interest -= position.size
+    log Closed({market: 142, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits142(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market142_deposits[owner][n]
+        if total > 0x008f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee142(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market142_fee = fee
+
+market143_oracle: public(address)
+market143_fee: public(uint256)
+market143_open_interest: public(uint256)
+market143_positions: HashMap[address, Position]
+market143_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open143(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market143_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market143_positions[msg.sender] = position
+    self.market143_open_interest += size - fee
+    log Opened({market: 143, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close143(price: uint256) -> int128:
+    position: Position = self.market143_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market143_open_interest -= position.size
+    log Closed({market: 143, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits143(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market143_deposits[owner][n]
+        if total > 0x0090 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee143(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market143_fee = fee
+
+market144_oracle: public(address)
+market144_fee: public(uint256)
+market144_open_interest: public(uint256)
+market144_positions: HashMap[address, Position]
+market144_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open144(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market144_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market144_positions[msg.sender] = position
+    self.market144_open_interest += size - fee
+    log Opened({market: 144, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close144(price: uint256) -> int128:
+    position: Position = self.market144_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market144_open_interest -= position.size
+    log Closed({market: 144, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits144(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market144_deposits[owner][n]
+        if total > 0x0091 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee144(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market144_fee = fee
+
+market145_oracle: public(address)
+market145_fee: public(uint256)
+market145_open_interest: public(uint256)
+market145_positions: HashMap[address, Position]
+market145_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open145(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market145_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market145_positions[msg.sender] = position
+    self.market145_open_interest += size - fee
+    log Opened({market: 145, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close145(price: uint256) -> int128:
+    position: Position = self.market145_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market145_open_interest -= position.size
+    log Closed({market: 145, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits145(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market145_deposits[owner][n]
+        if total > 0x0092 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee145(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market145_fee = fee
+
+market146_oracle: public(address)
+market146_fee: public(uint256)
+market146_open_interest: public(uint256)
+market146_positions: HashMap[address, Position]
+market146_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open146(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market146_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market146_positions[msg.sender] = position
+    self.market146_open_interest += size - fee
+    log Opened({market: 146, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close146(price: uint256) -> int128:
+    position: Position = self.market146_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market146_open_interest -= position.size
+    log Closed({market: 146, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits146(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market146_deposits[owner][n]
+        if total > 0x0093 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee146(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market146_fee = fee
+
+market147_oracle: public(address)
+market147_fee: public(uint256)
+market147_open_interest: public(uint256)
+market147_positions: HashMap[address, Position]
+market147_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open147(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market147_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market147_positions[msg.sender] = position
+    self.market147_open_interest += size - fee
+    log Opened({market: 147, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close147(price: uint256) -> int128:
+    position: Position = self.market147_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market147_open_interest -= position.size
+    log Closed({market: 147, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits147(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market147_deposits[owner][n]
+        if total > 0x0094 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee147(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market147_fee = fee
+
+market148_oracle: public(address)
+market148_fee: public(uint256)
+market148_open_interest: public(uint256)
+market148_positions: HashMap[address, Position]
+market148_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open148(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market148_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market148_positions[msg.sender] = position
+    self.market148_open_interest += size - fee
+    log Opened({market: 148, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close148(price: uint256) -> int128:
+    position: Position = self.market148_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market148_open_interest -= position.size
+    log Closed({market: 148, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits148(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market148_deposits[owner][n]
+        if total > 0x0095 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee148(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market148_fee = fee
+
+market149_oracle: public(address)
+market149_fee: public(uint256)
+market149_open_interest: public(uint256)
+market149_positions: HashMap[address, Position]
+market149_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open149(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market149_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market149_positions[msg.sender] = position
+    self.market149_open_interest += size - fee
+    log Opened({market: 149, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close149(price: uint256) -> int128:
+    position: Position = self.market149_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market149_open_interest -= position.size
+    log Closed({market: 149, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits149(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market149_deposits[owner][n]
+        if total > 0x0096 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee149(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market149_fee = fee
+
+market150_oracle: public(address)
+market150_fee: public(uint256)
+market150_open_interest: public(uint256)
+market150_positions: HashMap[address, Position]
+market150_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open150(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market150_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market150_positions[msg.sender] = position
+    self.market150_open_interest += size - fee
+    log Opened({market: 150, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close150(price: uint256) -> int128:
+    position: Position = self.market150_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market150_open_interest -= position.size
+    log Closed({market: 150, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits150(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market150_deposits[owner][n]
+        if total > 0x0097 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee150(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market150_fee = fee
+
+market151_oracle: public(address)
+market151_fee: public(uint256)
+market151_open_interest: public(uint256)
+market151_positions: HashMap[address, Position]
+market151_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open151(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market151_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market151_positions[msg.sender] = position
+    self.market151_open_interest += size - fee
+    log Opened({market: 151, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close151(price: uint256) -> int128:
+    position: Position = self.market151_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market151_open_interest -= position.size
+    log Closed({market: 151, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits151(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market151_deposits[owner][n]
+        if total > 0x0098 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee151(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market151_fee = fee
+
+market152_oracle: public(address)
+market152_fee: public(uint256)
+market152_open_interest: public(uint256)
+market152_positions: HashMap[address, Position]
+market152_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open152(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market152_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market152_positions[msg.sender] = position
+    self.market152_open_interest += size - fee
+    log Opened({market: 152, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close152(price: uint256) -> int128:
+    position: Position = self.market152_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market152_open_interest -= position.size
+    log Closed({market: 152, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits152(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market152_deposits[owner][n]
+        if total > 0x0099 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee152(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market152_fee = fee
+
+market153_oracle: public(address)
+market153_fee: public(uint256)
+market153_open_interest: public(uint256)
+market153_positions: HashMap[address, Position]
+market153_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open153(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market153_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market153_positions[msg.sender] = position
+    self.market153_open_interest += size - fee
+    log Opened({market: 153, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close153(price: uint256) -> int128:
+    position: Position = self.market153_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market153_open_interest -= position.size
+    log Closed({market: 153, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits153(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market153_deposits[owner][n]
+        if total > 0x009a ** 2:
+            break
+    return total
+
+
+@external
+def set_fee153(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market153_fee = fee
+
+market154_oracle: public(address)
+market154_fee: public(uint256)
+market154_open_interest: public(uint256)
+market154_positions: HashMap[address, Position]
+market154_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open154(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market154_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market154_positions[msg.sender] = position
+    self.market154_open_interest += size - fee
+    log Opened({market: 154, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close154(price: uint256) -> int128:
+    position: Position = self.market154_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market154_open_interest -= position.size
+    log Closed({market: 154, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits154(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market154_deposits[owner][n]
+        if total > 0x009b ** 2:
+            break
+    return total
+
+
+@external
+def set_fee154(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market154_fee = fee
+
+market155_oracle: public(address)
+market155_fee: public(uint256)
+market155_open_interest: public(uint256)
+market155_positions: HashMap[address, Position]
+market155_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open155(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market155_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market155_positions[msg.sender] = position
+    self.market155_open_interest += size - fee
+    log Opened({market: 155, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close155(price: uint256) -> int128:
+    position: Position = self.market155_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market155_open_interest -= position.size
+    log Closed({market: 155, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits155(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market155_deposits[owner][n]
+        if total > 0x009c ** 2:
+            break
+    return total
+
+
+@external
+def set_fee155(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market155_fee = fee
+
+market156_oracle: public(address)
+market156_fee: public(uint256)
+market156_open_interest: public(uint256)
+market156_positions: HashMap[address, Position]
+market156_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open156(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market156_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market156_positions[msg.sender] = position
+    self.market156_open_interest += size - fee
+    log Opened({market: 156, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close156(price: uint256) -> int128:
+    position: Position = self.market156_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market156_open_interest -= position.size
+    log Closed({market: 156, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits156(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market156_deposits[owner][n]
+        if total > 0x009d ** 2:
+            break
+    return total
+
+
+@external
+def set_fee156(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market156_fee = fee
+
+market157_oracle: public(address)
+market157_fee: public(uint256)
+market157_open_interest: public(uint256)
+market157_positions: HashMap[address, Position]
+market157_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open157(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market157_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market157_positions[msg.sender] = position
+    self.market157_open_interest += size - fee
+    log Opened({market: 157, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close157(price: uint256) -> int128:
+    position: Position = self.market157_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market157_open_interest -= position.size
+    log Closed({market: 157, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits157(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market157_deposits[owner][n]
+        if total > 0x009e ** 2:
+            break
+    return total
+
+
+@external
+def set_fee157(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market157_fee = fee
+
+market158_oracle: public(address)
+market158_fee: public(uint256)
+market158_open_interest: public(uint256)
+market158_positions: HashMap[address, Position]
+market158_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open158(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market158_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market158_positions[msg.sender] = position
+    self.market158_open_interest += size - fee
+    log Opened({market: 158, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close158(price: uint256) -> int128:
+    position: Position = self.market158_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market158_open_interest -= position.size
+    log Closed({market: 158, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits158(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market158_deposits[owner][n]
+        if total > 0x009f ** 2:
+            break
+    return total
+
+
+@external
+def set_fee158(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market158_fee = fee
+
+market159_oracle: public(address)
+market159_fee: public(uint256)
+market159_open_interest: public(uint256)
+market159_positions: HashMap[address, Position]
+market159_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open159(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market159_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market159_positions[msg.sender] = position
+    self.market159_open_interest += size - fee
+    log Opened({market: 159, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close159(price: uint256) -> int128:
+    position: Position = self.market159_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market159_open_interest -= position.size
+    log Closed({market: 159, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits159(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market159_deposits[owner][n]
+        if total > 0x00a0 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee159(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market159_fee = fee
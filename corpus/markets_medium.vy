@@ -0,0 +1,497 @@
+# A registry of 8 markets, all sharing the same layout
+
+interface Oracle:
+    def price() -> uint256: view
+    def decimals() -> uint256: view
+
+struct Position:
+    owner: address
+    size: uint256
+    collateral: uint256
+    opened: uint256
+
+event Opened:
+    market: indexed(uint256)
+    owner: indexed(address)
+    size: uint256
+
+event Closed:
+    market: indexed(uint256)
+    owner: indexed(address)
+    profit: int128
+
+admin: public(address)
+paused: public(bool)
+FEE_DENOMINATOR: constant(uint256) = 10000
+
+market0_oracle: public(address)
+market0_fee: public(uint256)
+market0_open_interest: public(uint256)
+market0_positions: HashMap[address, Position]
+market0_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open0(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market0_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market0_positions[msg.sender] = position
+    self.market0_open_interest += size - fee
+    log Opened({market: 0, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close0(price: uint256) -> int128:
+    position: Position = self.market0_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market0_open_interest -= position.size
+    log Closed({market: 0, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits0(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market0_deposits[owner][n]
+        if total > 0x0001 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee0(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market0_fee = fee
+
+market1_oracle: public(address)
+market1_fee: public(uint256)
+market1_open_interest: public(uint256)
+market1_positions: HashMap[address, Position]
+market1_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open1(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market1_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market1_positions[msg.sender] = position
+    self.market1_open_interest += size - fee
+    log Opened({market: 1, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close1(price: uint256) -> int128:
+    position: Position = self.market1_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market1_open_interest -= position.size
+    log Closed({market: 1, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits1(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market1_deposits[owner][n]
+        if total > 0x0002 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee1(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market1_fee = fee
+
+market2_oracle: public(address)
+market2_fee: public(uint256)
+market2_open_interest: public(uint256)
+market2_positions: HashMap[address, Position]
+market2_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open2(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market2_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market2_positions[msg.sender] = position
+    self.market2_open_interest += size - fee
+    log Opened({market: 2, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close2(price: uint256) -> int128:
+    position: Position = self.market2_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market2_open_interest -= position.size
+    log Closed({market: 2, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits2(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market2_deposits[owner][n]
+        if total > 0x0003 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee2(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market2_fee = fee
+
+market3_oracle: public(address)
+market3_fee: public(uint256)
+market3_open_interest: public(uint256)
+market3_positions: HashMap[address, Position]
+market3_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open3(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market3_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market3_positions[msg.sender] = position
+    self.market3_open_interest += size - fee
+    log Opened({market: 3, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close3(price: uint256) -> int128:
+    position: Position = self.market3_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market3_open_interest -= position.size
+    log Closed({market: 3, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits3(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market3_deposits[owner][n]
+        if total > 0x0004 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee3(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market3_fee = fee
+
+market4_oracle: public(address)
+market4_fee: public(uint256)
+market4_open_interest: public(uint256)
+market4_positions: HashMap[address, Position]
+market4_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open4(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market4_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market4_positions[msg.sender] = position
+    self.market4_open_interest += size - fee
+    log Opened({market: 4, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close4(price: uint256) -> int128:
+    position: Position = self.market4_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market4_open_interest -= position.size
+    log Closed({market: 4, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits4(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market4_deposits[owner][n]
+        if total > 0x0005 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee4(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market4_fee = fee
+
+market5_oracle: public(address)
+market5_fee: public(uint256)
+market5_open_interest: public(uint256)
+market5_positions: HashMap[address, Position]
+market5_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open5(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market5_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market5_positions[msg.sender] = position
+    self.market5_open_interest += size - fee
+    log Opened({market: 5, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close5(price: uint256) -> int128:
+    position: Position = self.market5_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market5_open_interest -= position.size
+    log Closed({market: 5, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits5(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market5_deposits[owner][n]
+        if total > 0x0006 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee5(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market5_fee = fee
+
+market6_oracle: public(address)
+market6_fee: public(uint256)
+market6_open_interest: public(uint256)
+market6_positions: HashMap[address, Position]
+market6_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open6(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market6_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market6_positions[msg.sender] = position
+    self.market6_open_interest += size - fee
+    log Opened({market: 6, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close6(price: uint256) -> int128:
+    position: Position = self.market6_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market6_open_interest -= position.size
+    log Closed({market: 6, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits6(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market6_deposits[owner][n]
+        if total > 0x0007 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee6(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market6_fee = fee
+
+market7_oracle: public(address)
+market7_fee: public(uint256)
+market7_open_interest: public(uint256)
+market7_positions: HashMap[address, Position]
+market7_deposits: HashMap[address, HashMap[uint256, uint256]]
+
+
+@external
+def open7(size: uint256, collateral: uint256) -> bool:
+    assert not self.paused, "Paused"
+    assert size > 0, "Empty position"
+    fee: uint256 = size * self.market7_fee / FEE_DENOMINATOR
+    position: Position = {
+        owner: msg.sender,
+        size: size - fee,
+        collateral: collateral,
+        opened: block.timestamp
+    }
+    self.market7_positions[msg.sender] = position
+    self.market7_open_interest += size - fee
+    log Opened({market: 7, owner: msg.sender, size: size})
+    return True
+
+
+@external
+def close7(price: uint256) -> int128:
+    position: Position = self.market7_positions[msg.sender]
+    assert position.size > 0, "No position"
+    profit: int128 = 0
+    if price > position.opened:
+        profit = price - position.opened
+    elif price < position.opened:
+        profit = -(position.opened - price)
+    else:
+        profit = 0
+    self.market7_open_interest -= position.size
+    log Closed({market: 7, owner: msg.sender, profit: profit})
+    return profit
+
+
+@view
+@external
+def deposits7(owner: address, rounds: uint256) -> uint256:
+    total: uint256 = 0
+    for n in rounds:
+        if n % 2 == 0:
+            continue
+        total += self.market7_deposits[owner][n]
+        if total > 0x0008 ** 2:
+            break
+    return total
+
+
+@external
+def set_fee7(fee: uint256):
+    assert msg.sender == self.admin, "Only the admin"
+    assert fee < FEE_DENOMINATOR, "Fee too high"
+    self.market7_fee = fee
@@ -0,0 +1,91 @@
+# An ERC20 token
+
+from vyper.interfaces import ERC20
+
+implements: ERC20
+
+event Transfer:
+    sender: indexed(address)
+    receiver: indexed(address)
+    value: uint256
+
+event Approval:
+    owner: indexed(address)
+    spender: indexed(address)
+    value: uint256
+
+name: public(bytes32)
+symbol: public(bytes32)
+decimals: public(uint256)
+totalSupply: public(uint256)
+minter: address
+
+balanceOf: public(HashMap[address, uint256])
+allowance: public(HashMap[address, HashMap[address, uint256]])
+
+
+@external
+def __init__(_name: bytes32, _symbol: bytes32, _decimals: uint256, _supply: uint256):
+    init_supply: uint256 = _supply * 10 ** _decimals
+    self.name = _name
+    self.symbol = _symbol
+    self.decimals = _decimals
+    self.balanceOf[msg.sender] = init_supply
+    self.totalSupply = init_supply
+    self.minter = msg.sender
+    log Transfer({sender: ZERO_ADDRESS, receiver: msg.sender, value: init_supply})
+
+
+@external
+def transfer(_to: address, _value: uint256) -> bool:
+    self.balanceOf[msg.sender] -= _value
+    self.balanceOf[_to] += _value
+    log Transfer({sender: msg.sender, receiver: _to, value: _value})
+    return True
+
+
+@external
+def transferFrom(_from: address, _to: address, _value: uint256) -> bool:
+    self.balanceOf[_from] -= _value
+    self.balanceOf[_to] += _value
+    self.allowance[_from][msg.sender] -= _value
+    log Transfer({sender: _from, receiver: _to, value: _value})
+    return True
+
+
+@external
+def approve(_spender: address, _value: uint256) -> bool:
+    self.allowance[msg.sender][_spender] = _value
+    log Approval({owner: msg.sender, spender: _spender, value: _value})
+    return True
+
+
+@external
+def mint(_to: address, _value: uint256):
+    assert msg.sender == self.minter, "Only the minter can mint"
+    assert _to != ZERO_ADDRESS, "Cannot mint to the zero address"
+    self.totalSupply += _value
+    self.balanceOf[_to] += _value
+    log Transfer({sender: ZERO_ADDRESS, receiver: _to, value: _value})
+
+
+@external
+def burn(_value: uint256):
+    self.totalSupply -= _value
+    self.balanceOf[msg.sender] -= _value
+    log Transfer({sender: msg.sender, receiver: ZERO_ADDRESS, value: _value})
+
+
+@external
+def burnFrom(_to: address, _value: uint256):
+    assert _to != ZERO_ADDRESS, "Cannot burn from the zero address"
+    self.allowance[_to][msg.sender] -= _value
+    self.totalSupply -= _value
+    self.balanceOf[_to] -= _value
+    log Transfer({sender: _to, receiver: ZERO_ADDRESS, value: _value})
+
+
+@external
+def renounceMinter():
+    assert msg.sender == self.minter, "Only the minter can renounce"
+    self.minter = ZERO_ADDRESS
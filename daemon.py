@@ -0,0 +1,272 @@
+"""
+A long-running parse server for editors and linters, speaking JSON-RPC 2.0
+over stdio, with each message framed by a `Content-Length` header (as in
+the Language Server Protocol). The parser stays warm between requests,
+and open documents are kept in memory, re-parsed incrementally on edits.
+
+    python daemon.py
+
+Methods (`uri` names an open document; `parse` and `diagnostics` also
+take a `text` instead):
+
+    open {uri, text}            Start tracking a document
+    change {uri, edits}         Apply [{start, end, text}, ...] in order,
+                                each to the text left by the ones before
+    close {uri}                 Stop tracking it
+    parse {uri | text}          {"ast": ...}, as parse() gives, or an error
+    diagnostics {uri | text}    {"diagnostics": [{line, column, message}]},
+                                every syntax error (0-based positions)
+    tokens {uri}                {"tokens": [[type, value, lineno, index]]}
+    shutdown                    Stop after answering
+"""
+import inspect
+import json
+import re
+import sys
+
+from incremental import ParsedModule, reparse
+from lex import tokenize
+from parse import ParseError, parse
+from recovery import parse_recovering
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# Not one of JSON-RPC's: the document doesn't parse
+SYNTAX_ERROR = -32000
+
+_POSITION = re.compile(r"@ line (\d+)(?:, col (\d+))?")
+
+
+class RPCError(Exception):
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class Document:
+    """
+    An open document: its text, and the ParsedModule of it (None if it
+    doesn't parse, with `error` instead). Tokens and diagnostics are
+    only worked out when asked for, and kept until the next edit.
+    """
+
+    __slots__ = ("text", "module", "error", "_tokens", "_diagnostics")
+
+    def __init__(self, text):
+        self._update(text, ParsedModule, text)
+
+    def _update(self, text, parse_module, *args):
+        # Parse before changing anything, so that if the parser fails
+        # the document is left as it was
+        try:
+            module, error = parse_module(*args), None
+        except SyntaxError as e:
+            module, error = None, e
+        self.text, self.module, self.error = text, module, error
+        self._tokens = self._diagnostics = None
+
+    def edit(self, start, end, replacement):
+        """
+        Apply `text[start:end] = replacement`
+        """
+        if not 0 <= start <= end <= len(self.text):
+            raise RPCError(INVALID_PARAMS, f"Edit {start}:{end} is out of range")
+        text = self.text[:start] + replacement + self.text[end:]
+        if self.module is None:
+            self._update(text, ParsedModule, text)
+        else:
+            self._update(text, reparse, self.module, start, end, replacement)
+
+    @property
+    def ast(self):
+        if self.module is None:
+            raise self.error
+        return self.module.ast
+
+    @property
+    def tokens(self):
+        if self._tokens is None:
+            self._tokens = [
+                [t.type, t.value, t.lineno, t.index] for t in tokenize(self.text)
+            ]
+        return self._tokens
+
+    @property
+    def diagnostics(self):
+        if self._diagnostics is None:
+            if self.module is not None:
+                self._diagnostics = []
+            else:
+                _, errors = parse_recovering(self.text)
+                self._diagnostics = [_diagnostic(e, self.text) for e in errors]
+        return self._diagnostics
+
+
+def _diagnostic(error, text):
+    if isinstance(error, ParseError):
+        message = "Invalid syntax"
+        line = text.count("\n", 0, error.index)
+        column = error.index - (text.rfind("\n", 0, error.index) + 1)
+    else:
+        message = str(error)
+        m = _POSITION.search(message)
+        if m is not None:
+            # The lexer counts lines from 1, and columns from 1 on the
+            # first line but from 2 after that (see LineIndex.column)
+            line = int(m[1]) - 1
+            column = max(int(m[2] or 0) - (2 if line else 1), 0)
+        else:
+            line, column = text.count("\n"), 0  # e.g. at the end of the text
+    return {"line": line, "column": column, "message": message}
+
+
+class Server:
+    """
+    Answers requests about the documents it holds open
+    """
+
+    def __init__(self):
+        self.documents = {}
+        self.running = True
+
+    def handle(self, request):
+        """
+        The response to a request (a dict), or None for a notification
+        """
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _error(None, RPCError(INVALID_REQUEST, "Invalid request"))
+
+        id_ = request.get("id")
+        try:
+            method = getattr(self, "rpc_" + request["method"], None)
+            if method is None:
+                raise RPCError(METHOD_NOT_FOUND, f"Unknown method {request['method']}")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "Params must be an object")
+            try:
+                inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise RPCError(INVALID_PARAMS, str(e)) from None
+            result = method(**params)
+        except RPCError as e:
+            response = _error(id_, e)
+        except SyntaxError as e:
+            response = _error(id_, RPCError(SYNTAX_ERROR, str(e)))
+        except Exception as e:
+            response = _error(id_, RPCError(INTERNAL_ERROR, f"{type(e).__name__}: {e}"))
+        else:
+            response = {"jsonrpc": "2.0", "id": id_, "result": result}
+
+        return None if "id" not in request else response
+
+    def _document(self, uri):
+        document = self.documents.get(uri)
+        if document is None:
+            raise RPCError(INVALID_PARAMS, f"{uri} is not open")
+        return document
+
+    def _source(self, uri, text):
+        # A document that isn't kept open
+        if text is not None:
+            return Document(text)
+        return self._document(uri)
+
+    def rpc_open(self, uri, text):
+        self.documents[uri] = Document(text)
+
+    def rpc_change(self, uri, edits):
+        document = self._document(uri)
+        for edit in edits:
+            try:
+                start, end, text = edit["start"], edit["end"], edit["text"]
+            except (KeyError, TypeError):
+                message = "Edits need a start, end and text"
+                raise RPCError(INVALID_PARAMS, message) from None
+            document.edit(start, end, text)
+
+    def rpc_close(self, uri):
+        self.documents.pop(uri, None)
+
+    def rpc_parse(self, uri=None, text=None):
+        return {"ast": self._source(uri, text).ast}
+
+    def rpc_diagnostics(self, uri=None, text=None):
+        return {"diagnostics": self._source(uri, text).diagnostics}
+
+    def rpc_tokens(self, uri):
+        return {"tokens": self._document(uri).tokens}
+
+    def rpc_shutdown(self):
+        self.running = False
+
+
+def _error(id_, error):
+    body = {"code": error.code, "message": str(error)}
+    if error.data is not None:
+        body["data"] = error.data
+    return {"jsonrpc": "2.0", "id": id_, "error": body}
+
+
+def read_message(stream):
+    """
+    The next message body from a binary stream, or None at the end of it.
+    Bad headers raise a ValueError, once the stream is past them.
+    """
+    length = error = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.partition(b":")
+        if name.strip().lower() == b"content-length":
+            value = value.strip().decode("ascii", "replace")
+            if value.isdigit():
+                length = int(value)
+            else:
+                error = f"Invalid Content-Length: {value}"
+    if error is None and length is None:
+        error = "Message without a Content-Length"
+    if error is not None:
+        raise ValueError(error)
+    return stream.read(length)
+
+
+def write_message(stream, body):
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body))
+    stream.write(body)
+    stream.flush()
+
+
+def serve(stdin, stdout):
+    """
+    Answer the requests on `stdin` until it ends or a shutdown request
+    """
+    parse("x: uint256")  # Build (or load) the parser tables up front
+    server = Server()
+    while server.running:
+        try:
+            body = read_message(stdin)
+            if body is None:
+                break
+            request = json.loads(body)
+        except ValueError as e:
+            # A bad header or body. After bad headers there's no telling
+            # where the body ends, so reading carries on right after them
+            response = _error(None, RPCError(PARSE_ERROR, str(e)))
+        else:
+            response = server.handle(request)
+        if response is not None:
+            write_message(stdout, json.dumps(response).encode())
+
+
+if __name__ == "__main__":
+    serve(sys.stdin.buffer, sys.stdout.buffer)
@@ -0,0 +1,137 @@
+"""
+Find what each file imports without parsing all of it, and build the
+import graph of a project, e.g. to schedule builds.
+
+    scan_imports(text)  # [{"path": [...], "alias": ...}, ...], as in parse()
+    for path, dependencies in dependency_graph("contracts").items():
+        ...  # Every file comes after the files it imports
+
+Only the imports at the top of a file are scanned: tokenizing stops at the
+first statement that isn't an import (after the module docstring).
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from graphlib import CycleError, TopologicalSorter
+
+from lex import LineIndex, tokenize
+from parse import parse_tokens
+
+# Files that can be imported
+EXTENSIONS = (".vy", ".vyi")
+
+
+class ImportCycleError(ValueError):
+    """
+    Files that import each other, with `cycle` listing them in import
+    order, ending with the first one again
+    """
+
+    def __init__(self, cycle):
+        super().__init__(f"Import cycle: {' -> '.join(cycle)}")
+        self.cycle = cycle
+
+
+def _import_tokens(tokens):
+    """
+    The tokens of the docstring and imports at the start of a module
+    """
+    statement_start = True
+    for t in tokens:
+        if statement_start and t.type not in ("DOCSTR", "IMPORT", "FROM"):
+            return
+        statement_start = t.type in ("DOCSTR", "ENDSTMT")
+        yield t
+
+
+def scan_imports(text):
+    """
+    The imports at the top of a module, the same as parse(text)'s
+    "imports" (for a module that only has imports at the top)
+    """
+    line_index = LineIndex(text)
+    tokens = _import_tokens(tokenize(text, line_index))
+    return parse_tokens(tokens, text, line_index)[1]["imports"]
+
+
+def resolve_import(path, importer, root):
+    """
+    The file an import's `path` refers to, relative to `root`, or None if
+    it isn't in the project (e.g. a library interface). Relative paths
+    start from the directory of `importer` (also relative to `root`),
+    and others from `root`. For `from a import b`, `b` may be a module or
+    a name in `a`, so both are tried.
+    """
+    directory = os.path.dirname(importer) if path[0] in (".", "..") else ""
+    names = []
+    for part in path:
+        if part == "..":
+            if not directory:
+                return None  # Above the project root
+            directory = os.path.dirname(directory)
+        elif part not in (".", "*"):
+            names.append(part)
+
+    for end in (len(names), len(names) - 1):
+        if end <= 0:
+            break
+        module = os.path.join(directory, *names[:end])
+        for extension in EXTENSIONS:
+            if os.path.isfile(os.path.join(root, module + extension)):
+                return module + extension
+    return None
+
+
+def _scan_file(root, path):
+    with open(os.path.join(root, path), encoding="utf-8") as f:
+        text = f.read()
+    try:
+        return path, scan_imports(text), None
+    except SyntaxError as e:
+        return path, None, e
+
+
+def _project_files(root):
+    files = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            if name.endswith(EXTENSIONS):
+                files.append(os.path.relpath(os.path.join(directory, name), root))
+    return sorted(files)
+
+
+def dependency_graph(root, workers=None):
+    """
+    Scan every file under `root` (on `workers` processes, or in this one if
+    `workers=1`), returning `{file: [files it imports]}` with paths relative
+    to `root`, ordered so that every file comes after the files it imports.
+    Raises ImportCycleError if there's no such order, and SyntaxError
+    for a file whose imports don't parse.
+    """
+    files = _project_files(root)
+    roots = [root] * len(files)
+    if workers == 1:
+        scanned = map(_scan_file, roots, files)
+    else:
+        workers = workers or os.cpu_count() or 1
+        # A few chunks per worker, rather than a round trip per file
+        chunksize = max(1, len(files) // (4 * workers))
+        with ProcessPoolExecutor(workers) as executor:
+            scanned = list(executor.map(_scan_file, roots, files, chunksize=chunksize))
+
+    graph = {}
+    for path, imports, error in scanned:
+        if error is not None:
+            raise SyntaxError(f"{path}: {error}")
+        dependencies = []
+        for stmt in imports:
+            dependency = resolve_import(stmt["path"], path, root)
+            if dependency is not None and dependency not in dependencies:
+                dependencies.append(dependency)
+        graph[path] = dependencies
+
+    try:
+        order = TopologicalSorter(graph).static_order()
+        return {path: graph[path] for path in order}
+    except CycleError as e:
+        # graphlib gives the cycle backwards: each file is imported by the next
+        raise ImportCycleError(e.args[1][::-1]) from None
@@ -0,0 +1,841 @@
+"""
+The LALR parser of the grammar, and the cache of its tables. Building the
+parser class is most of the cost of parsing for the first time, so parse
+only imports this module when it first needs a parser.
+"""
+import hashlib
+import os
+import pickle
+from types import SimpleNamespace
+
+import sly
+from sly import Parser as _Parser
+from sly.yacc import YaccSymbol
+
+# TABLE_CACHE_DIR is read from parse on every use, where it can be changed
+import parse as _parse
+from lex import LineIndex, VyperLexer
+from parse import ParseError, _write_atomic
+
+# Bump this whenever the layout of the cached table artifact changes
+TABLE_FORMAT_VERSION = 1
+
+
+def grammar_fingerprint(grammar, precedence):
+    """
+    Hash everything the LALR tables depend on: the productions (which carry
+    their precedence), the precedence table itself, and the versions of the
+    table format and of sly that produced them.
+    """
+    h = hashlib.sha256()
+    h.update(f"{TABLE_FORMAT_VERSION}:{sly.__version__}\n".encode())
+    h.update(repr(precedence).encode())
+    h.update(repr(sorted(grammar.Terminals)).encode())
+    for p in grammar.Productions:
+        h.update(f"\n{p}".encode())
+    return h.hexdigest()
+
+
+def _table_path(fingerprint):
+    return os.path.join(_parse.TABLE_CACHE_DIR, f"parsetab-{fingerprint[:16]}.pickle")
+
+
+def _load_tables(fingerprint):
+    if not _parse.TABLE_CACHE_DIR:
+        return None
+
+    try:
+        with open(_table_path(fingerprint), "rb") as f:
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None  # Missing or unreadable, so rebuild
+
+    if cached.get("fingerprint") != fingerprint:
+        return None  # Truncated hash collided, or stale artifact
+
+    return SimpleNamespace(
+        lr_action=cached["lr_action"],
+        lr_goto=cached["lr_goto"],
+        defaulted_states=cached["defaulted_states"],
+    )
+
+
+def _save_tables(fingerprint, lrtable):
+    if not _parse.TABLE_CACHE_DIR:
+        return
+
+    cached = {
+        "fingerprint": fingerprint,
+        "lr_action": lrtable.lr_action,
+        "lr_goto": lrtable.lr_goto,
+        "defaulted_states": lrtable.defaulted_states,
+    }
+    data = pickle.dumps(cached, protocol=pickle.HIGHEST_PROTOCOL)
+    try:
+        _write_atomic(_table_path(fingerprint), data)
+    except OSError:
+        pass  # Caching is best-effort, we already have the tables in memory
+
+
+# Tokens with no text of their own, which aren't part of any span
+_LAYOUT_TOKENS = {"INDENT", "DEDENT", "ENDSTMT", "NEWLINE"}
+
+
+def _spanned(func):
+    """
+    Wrap a grammar rule so that it records the span of the text it reduces
+    (see _VyperParser.parse)
+    """
+
+    def rule(self, p):
+        # sly pushes the symbol of the last reduction after this returns, so
+        # its span is given to it here: it's the top symbol under any tokens
+        # shifted since
+        stack = self.symstack
+        n = len(stack) - 1
+        while type(stack[n]) is not YaccSymbol:
+            n -= 1
+        if not hasattr(stack[n], "span"):
+            stack[n].span = self._span
+
+        # From the first symbol with any text to the last one
+        symbols = p._slice
+        start = end = None
+        for symbol in symbols:
+            if type(symbol) is YaccSymbol:
+                if symbol.span is not None:  # Not reduced from nothing
+                    start = symbol.span[0]
+                    break
+            elif symbol.type not in _LAYOUT_TOKENS:
+                start = symbol.index
+                break
+        if start is not None:
+            for symbol in reversed(symbols):
+                if type(symbol) is YaccSymbol:
+                    if symbol.span is not None:
+                        end = symbol.span[1]
+                        break
+                elif symbol.type not in _LAYOUT_TOKENS:
+                    end = symbol.index + len(symbol.value)
+                    break
+        span = self._span = None if start is None else (start, end)
+
+        value = func(self, p)
+        if span is None or not isinstance(value, (tuple, list, dict)):
+            return value
+        offsets = self._offsets
+        if id(value) in offsets:
+            for symbol in symbols:
+                if type(symbol) is YaccSymbol and symbol.value is value:
+                    # Reduced again, e.g. a list that grows or an expression
+                    # in brackets, so this span holds the last one
+                    offsets[id(value)] = span
+                    return value
+            value = (*value,)  # A constant like `("break",)`, so it gets its own
+
+        offsets[id(value)] = span
+        self._reduced.append(value)  # So no other value gets its id
+        made = ()
+        if isinstance(value, list):
+            made = value
+        elif isinstance(value, tuple) and len(value) == 2:
+            fields = value[1]
+            if isinstance(fields, (list, dict)):
+                # The dict (or list) of a `(tag, {...})` node is the same node
+                offsets[id(fields)] = span
+                self._reduced.append(fields)
+            if isinstance(fields, dict):
+                made = fields.values()
+        # Nodes the rule made in it weren't reduced on their own, e.g. the
+        # `a, b` of `a, b = c`, the `a + b` of `a += b`, or each import of
+        # `from x import a, b`, so they have the span of all of it
+        for node in made:
+            if isinstance(node, (tuple, dict)) and id(node) not in offsets:
+                offsets[id(node)] = span
+                self._reduced.append(node)
+        return value
+
+    return rule
+
+
+class _VyperParser(_Parser):
+
+    # Set VYPER_GRAMMAR_DEBUG=parser.out if you want to see the parse table
+    debugfile = os.environ.get("VYPER_GRAMMAR_DEBUG") or None
+
+    @classmethod
+    def _build(cls, definitions):
+        """
+        Replaces sly's build step so the LALR tables (the expensive part) are
+        loaded from parse.TABLE_CACHE_DIR when the grammar hasn't changed.
+        """
+        rules = cls._Parser__collect_rules(definitions)
+        if not cls._Parser__validate_specification():
+            raise sly.yacc.YaccError("Invalid parser specification")
+
+        # The grammar itself is cheap, and we need it for the production functions
+        cls._Parser__build_grammar(rules)
+        cls._fingerprint = grammar_fingerprint(cls._grammar, cls.precedence)
+
+        # Always rebuild when debugging, since the output needs the full tables
+        lrtable = None if cls.debugfile else _load_tables(cls._fingerprint)
+        if lrtable is None:
+            cls._Parser__build_lrtables()
+            _save_tables(cls._fingerprint, cls._lrtable)
+        else:
+            cls._lrtable = lrtable
+
+        if cls.debugfile:
+            with open(cls.debugfile, "w") as f:
+                f.write(str(cls._grammar))
+                f.write("\n")
+                f.write(str(cls._lrtable))
+
+    def __init__(self):
+        super().__init__()
+        # The source being parsed, so we can do source code annotation
+        self._text = None
+        self._line_index = None
+
+    @classmethod
+    def _spanned_grammar(cls):
+        """
+        The grammar, with every rule wrapped to record spans
+        """
+        if "_grammar_with_spans" not in cls.__dict__:
+            cls._grammar_with_spans = SimpleNamespace(
+                Productions=[
+                    SimpleNamespace(
+                        name=p.name,
+                        len=p.len,
+                        namemap=p.namemap,
+                        func=p.func and _spanned(p.func),
+                    )
+                    for p in cls._grammar.Productions
+                ]
+            )
+        return cls._grammar_with_spans
+
+    def parse(self, tokens, text=None, line_index=None, offsets=None):
+        """
+        Parse `tokens`, showing syntax errors in `text` (or in `line_index`,
+        which can be anything with `lines()` and `len()` like a LineIndex).
+        sly keeps the parse state on the instance, so one parser can only be
+        used by one parse at a time, but it can be used again afterwards.
+
+        Given an `offsets` dict, the `(start_offset, end_offset)` of every
+        tuple, list and dict that a rule returns is put in it by `id()`.
+        Values that didn't end up in the AST are in there too.
+        """
+        self._text, self._line_index = text, line_index
+        if offsets is not None:
+            self._grammar = self._spanned_grammar()
+            self._offsets, self._reduced, self._span = offsets, [], None
+        try:
+            return super().parse(tokens)
+        finally:
+            # Don't keep the source, nor what's left on the stacks, alive
+            self._text = self._line_index = None
+            self.tokens = self.statestack = self.symstack = None
+            if offsets is not None:
+                del self._grammar, self._offsets, self._reduced, self._span
+
+    def error(self, tok):
+        if tok:
+            if self._line_index is None:
+                self._line_index = LineIndex(self._text)
+            raise ParseError(self._line_index, tok.lineno, tok.colno, tok.index) from None
+        else:  # End of file
+            raise SyntaxError("Reached end of program, but expecting more tokens!")
+
+    def _expect(self, p, n, name):
+        """
+        Raise a ParseError at the `n`th symbol of `p` unless it is the NAME `name`
+        """
+        if p[n] != name:
+            self.error(p._slice[n])
+
+    # HACK: Cannot import these from constant in lex, for whatever reason
+    # LAZY_BODY is never lexed, it stands in for a function body that
+    # `tokenize_skeleton` skipped over
+    tokens = VyperLexer.tokens - {"TAB", "SPACE", "NEWLINE"} | {"LAZY_BODY"}
+    literals = VyperLexer.literals
+
+    precedence = (
+        # These operations can be used in a series e.g. 1 + 2 + 3 + 4
+        # The evaluation order is left to right evaluation e.g. (...((a + b) + c) + ...
+        ("left", ADD, SUB),
+        ("left", MUL, DIV),  # Top-down is order of operations (lowest first)
+        ("left", AND, OR, XOR),
+        # These operations can be used in series e.g. not not not True
+        # The evaluation order is right to left evaluation e.g. -(-(-(a)))
+        ("right", USUB, NOT),
+        # Cannot use these operators multiple times in a row without parens
+        # e.g. 1 < 2 < 3 < ...
+        ("nonassoc", EQ, NE, LT, GT, LE, GE, IN),
+        ("nonassoc", SHL, SHR),  # Only nonassociative with those in it's group
+        ("nonassoc", POW, MOD),
+        ("nonassoc", AUGADD, AUGSUB, AUGMUL, AUGDIV, AUGPOW, AUGMOD),
+        ("nonassoc", DOT),
+    )
+
+    ##### TOP-LEVEL MODULE #####
+    start = "module"
+
+    @_("[ DOCSTR ] { module_stmt }")
+    def module(self, p):
+        module = {
+            "doc": p.DOCSTR,
+            "imports": list(),
+            "interface_defs": list(),
+            "struct_defs": list(),
+            "event_defs": list(),
+            "storage_defs": list(),
+            "constant_defs": list(),
+            "function_defs": list(),
+        }
+        for stmt in p.module_stmt:
+            # Stmt is either a (ClassName, dict) tuple
+            if isinstance(stmt, tuple):
+                k, v = stmt
+                module[k.lower().replace("def", "_def") + "s"].append(v)
+            # or list of those tuples
+            elif isinstance(stmt, list):
+                for k, v in stmt:
+                    module[k.lower().replace("def", "") + "s"].append(v)
+            else:
+                raise ValueError(f"Cannot accept: {stmt}")
+
+        return ("Module", module)
+
+    @_("import_stmt")
+    def module_stmt(self, p):
+        # Handle multiple imports
+        if isinstance(p.import_stmt, list):
+            return [("Import", stmt) for stmt in p.import_stmt]
+        else:
+            return [("Import", p.import_stmt)]
+
+    @_("interface_def")
+    @_("struct_def")
+    @_("event_def")
+    @_("storage_def")
+    @_("constant_def")
+    @_("function_def")
+    def module_stmt(self, p):
+        return p[0]
+
+    ##### IMPORTS #####
+    @_("IMPORT import_path [ import_alias ] ENDSTMT")
+    def import_stmt(self, p):
+        return {"path": p.import_path, "alias": p.import_alias}
+
+    @_("FROM import_from IMPORT MUL ENDSTMT")
+    def import_stmt(self, p):
+        return {"path": p.import_from + ["*"], "alias": None}
+
+    @_("FROM import_from IMPORT import_list ENDSTMT")
+    def import_stmt(self, p):
+        return [
+            {"path": p.import_from + [name], "alias": alias}
+            for name, alias in p.import_list
+        ]
+
+    @_("[ import_dots ] import_name")
+    def import_path(self, p):
+        return p.import_dots + p.import_name if p.import_dots else p.import_name
+
+    @_("import_dots")
+    def import_from(self, p):
+        return p.import_dots
+
+    @_("[ import_dots ] import_name")
+    def import_from(self, p):
+        return p.import_dots + p.import_name if p.import_dots else p.import_name
+
+    @_("DOT { DOT }")
+    def import_dots(self, p):
+        levels = len([p.DOT0] + p.DOT1)
+        return [".."] * (levels - 1) if levels > 1 else ["."]
+
+    @_("NAME { DOT NAME }")
+    def import_name(self, p):
+        return [p.NAME0] + p.NAME1
+
+    @_('import_item { "," import_item }')
+    @_('"(" import_item { "," import_item } [ "," ] ")"')
+    def import_list(self, p):
+        return [p.import_item0] + p.import_item1
+
+    @_("NAME [ import_alias ]")
+    def import_item(self, p):
+        return (p.NAME, p.import_alias)
+
+    @_("AS NAME")
+    def import_alias(self, p):
+        return p.NAME
+
+    ##### TYPE DEFINITIONS #####
+    @_("base_type")
+    @_("array_type")
+    @_("tuple_type")
+    @_("mapping_type")
+    def type(self, p):
+        return p[0]
+
+    # Base Types
+    @_("NAME")
+    def base_type(self, p):
+        return ("BaseType", p.NAME)
+
+    # Array definitions
+    @_('type "[" DEC_NUM "]"')
+    def array_type(self, p):
+        return ("ArrayType", {"type": p.type, "size": p.DEC_NUM, "len": p.DEC_NUM})
+
+    @_('type "[" NAME "]"')
+    def array_type(self, p):
+        return ("ArrayType", {"type": p.type, "size": p.NAME, "len": p.NAME})
+
+    # Tuple definitions
+    @_('"(" "," ")"')
+    def tuple_type(self, p):
+        return ("TupleType", {"types": list()})
+
+    @_('"(" type "," ")"')
+    def tuple_type(self, p):
+        return ("TupleType", {"types": [p.type]})
+
+    @_('"(" tuple_members [ "," ] ")"')
+    def tuple_type(self, p):
+        return ("TupleType", {"types": p.tuple_members})
+
+    @_('type "," type')
+    def tuple_members(self, p):
+        return [p.type0, p.type1]
+
+    @_('tuple_members "," type')
+    def tuple_members(self, p):
+        return p.tuple_members + [p.type]
+
+    # Mapping definitions
+    @_('NAME "[" base_type "," base_type "]"')
+    @_('NAME "[" base_type "," array_type "]"')
+    @_('NAME "[" base_type "," mapping_type "]"')
+    def mapping_type(self, p):
+        self._expect(p, 0, "HashMap")
+        return ("MappingType", {"key_type": p[2], "val_type": p[4]})
+
+    ##### VARIABLE DEFINITIONS #####
+    @_('NAME ":" type ENDSTMT')
+    def storage_def(self, p):
+        return ("StorageDef", {"name": p.NAME, "type": p.type, "decorator": None})
+
+    # TODO Change to an actual decorator
+    @_('NAME ":" NAME "(" type ")" ENDSTMT')
+    def storage_def(self, p):
+        return ("StorageDef", {"name": p.NAME0, "type": p.type, "decorator": p.NAME1})
+
+    ##### CONSTANT DEFINITIONS #####
+    # TODO Change to an actual decorator
+    @_('NAME ":" NAME "(" type ")" "=" expr ENDSTMT')
+    def constant_def(self, p):
+        self._expect(p, 2, "constant")
+        return ("ConstantDef", {"name": p.NAME0, "type": p.type, "value": p.expr})
+
+    ##### STRUCT DEFINITIONS #####
+    @_(
+        """
+    STRUCT NAME ":"
+    INDENT
+        struct_member ENDSTMT
+      { struct_member ENDSTMT }
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def struct_def(self, p):
+        return (
+            "StructDef",
+            {"name": p.NAME, "members": [p.struct_member0] + p.struct_member1},
+        )
+
+    @_(
+        """
+    STRUCT NAME ":"
+    INDENT
+        PASS ENDSTMT
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def struct_def(self, p):
+        return ("StructDef", {"name": p.NAME, "members": list()})
+
+    @_('NAME ":" type')
+    def struct_member(self, p):
+        return {"name": p.NAME, "type": p.type}
+
+    ##### INTERFACE DEFINTIIONS #####
+    @_(
+        """
+    INTERFACE NAME ":"
+    INDENT
+        interface_function ENDSTMT
+      { interface_function ENDSTMT }
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def interface_def(self, p):
+        return (
+            "InterfaceDef",
+            {
+                "name": p.NAME,
+                "functions": [p.interface_function0] + p.interface_function1,
+            },
+        )
+
+    @_(
+        """
+    INTERFACE NAME ":"
+    INDENT
+        PASS ENDSTMT
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def interface_def(self, p):
+        return ("InterfaceDef", {"name": p.NAME, "functions": list()})
+
+    @_('function_type ":" NAME')
+    def interface_function(self, p):
+        return {**p.function_type, "mutability": p.NAME}
+
+    ##### EVENT DEFITIONS #####
+    @_(
+        """
+    EVENT NAME ":"
+    INDENT
+        event_member ENDSTMT
+      { event_member ENDSTMT }
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def event_def(self, p):
+        return (
+            "EventDef",
+            {"name": p.NAME, "members": [p.event_member0] + p.event_member1},
+        )
+
+    @_(
+        """
+    EVENT NAME ":"
+    INDENT
+        PASS ENDSTMT
+    DEDENT
+    ENDSTMT
+    """
+    )
+    def event_def(self, p):
+        return ("EventDef", {"name": p.NAME, "members": list()})
+
+    @_('NAME ":" NAME "(" type ")"')
+    def event_member(self, p):
+        self._expect(p, 2, "indexed")
+        return {"name": p.NAME0, "indexed": True, "type": p.type}
+
+    @_('NAME ":" type')
+    def event_member(self, p):
+        return {"name": p.NAME, "indexed": False, "type": p.type}
+
+    ##### FUNCTION DEFINITIONS #####
+    @_('"@" NAME [ "(" arguments ")" ] ENDSTMT')
+    def decorator(self, p):
+        return ("decorator", {"name": p.NAME, "arguments": p.arguments})
+
+    @_('parameter { "," parameter }')
+    def parameters(self, p):
+        return [p.parameter0] + p.parameter1
+
+    @_('NAME ":" type [ "=" variable ]')
+    def parameter(self, p):
+        return (
+            "parameter",
+            {"name": p.NAME, "type": p.type, "default_value": p.variable,},
+        )
+
+    @_("ARROW type")
+    def returns(self, p):
+        return p.type
+
+    @_('DEF NAME "(" [ parameters ] ")" [ returns ]')
+    def function_type(self, p):
+        return {"name": p.NAME, "parameters": p.parameters, "returns": p.returns}
+
+    @_('{ decorator } function_type ":" [ DOCSTR ] body')
+    def function_def(self, p):
+        function = p.function_type
+        function.update({"decorators": p.decorator, "doc": p.DOCSTR, "body": p.body})
+        return ("FunctionDef", function)
+
+    @_("INDENT stmt { stmt } DEDENT ENDSTMT")
+    def body(self, p):
+        # Bodies of multiline statements
+        return [p.stmt0] + p.stmt1
+
+    @_("INDENT PASS ENDSTMT DEDENT ENDSTMT")
+    def body(self, p):
+        # Bodies can either be a list of 1+ stmts, or PASS
+        return list()
+
+    @_("LAZY_BODY ENDSTMT")
+    def body(self, p):
+        # Parsed when it's first used
+        return p.LAZY_BODY
+
+    ##### ASSIGNMENT STATEMENTS #####
+    @_('NAME ":" type "=" expr ENDSTMT')
+    def stmt(self, p):
+        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.expr})
+
+    # Object Creation Assignments
+    # Dict Object
+    @_('"{" NAME ":" expr { "," NAME ":" expr } "}"')
+    def dict(self, p):
+        return ("dict", {"keys": [p.NAME0] + p.NAME1, "values": [p.expr0] + p.expr1})
+
+    @_('"{" "}"')
+    def dict(self, p):
+        return ("dict", {"keys": list(), "values": list()})
+
+    @_('NAME ":" type "=" dict ENDSTMT')
+    def stmt(self, p):
+        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.dict})
+
+    # List Object
+    @_('"[" expr { "," expr } "]"')
+    def list(self, p):
+        return ("list", {"values": [p.expr0] + p.expr1})
+
+    @_('"[" "]"')
+    def list(self, p):
+        return ("list", {"values": list()})
+
+    @_('NAME ":" type "=" list ENDSTMT')
+    def stmt(self, p):
+        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.list})
+
+    # Tuple Object
+    @_('"(" expr { "," expr } "," ")"')
+    def tuple(self, p):
+        return ("tuple", {"values": [p.expr0] + p.expr1})
+
+    @_('"(" expr "," expr { "," expr } ")"')
+    def tuple(self, p):
+        return ("tuple", {"values": [p.expr0, p.expr1] + p.expr2})
+
+    @_('"(" "," ")"')
+    def tuple(self, p):
+        return ("tuple", {"values": list()})
+
+    @_('NAME ":" type "=" tuple ENDSTMT')
+    def stmt(self, p):
+        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.tuple})
+
+    # Allow multiple assignments (and skipping)
+    @_("variable")
+    @_("SKIP")
+    def target(self, p):
+        return getattr(p, "variable", None)
+
+    @_('target { "," target } = expr ENDSTMT')
+    def stmt(self, p):
+        if len(p.target1) > 0:
+            target = ("tuple", [p.target0] + p.target1)
+        else:
+            target = p.target0
+        return ("assign", {"target": target, "expr": p.expr})
+
+    # Augmented Assignment
+    @_("variable AUGADD expr ENDSTMT")
+    @_("variable AUGSUB expr ENDSTMT")
+    @_("variable AUGMUL expr ENDSTMT")
+    @_("variable AUGDIV expr ENDSTMT")
+    @_("variable AUGPOW expr ENDSTMT")
+    @_("variable AUGMOD expr ENDSTMT")
+    def stmt(self, p):
+        expr = (p[1].lower(), p.variable, p.expr)
+        # Re-arrange to Assign from BinOp
+        return ("assign", {"target": p.variable, "expr": expr})
+
+    ##### NON-ASSIGNMENT STATEMENTS #####
+    @_("expr ENDSTMT")
+    def stmt(self, p):
+        return p.expr
+
+    @_("BREAK ENDSTMT")
+    def stmt(self, p):
+        return ("break",)
+
+    @_("CONTINUE ENDSTMT")
+    def stmt(self, p):
+        return ("continue",)
+
+    @_('ASSERT expr [ "," STRING ] ENDSTMT')
+    def stmt(self, p):
+        return ("assert", p.expr, p.STRING)
+
+    @_('ASSERT expr "," UNREACHABLE ENDSTMT')
+    def stmt(self, p):
+        return ("assert", p.expr, "unreachable")
+
+    @_("RAISE [ STRING ] ENDSTMT")
+    def stmt(self, p):
+        return ("raise", p.STRING)
+
+    @_("RAISE UNREACHABLE ENDSTMT")
+    def stmt(self, p):
+        return ("raise", "unreachable")
+
+    @_("RETURN [ expr ] ENDSTMT")
+    def stmt(self, p):
+        return ("return", p.expr)
+
+    @_('LOG NAME "(" dict ")" ENDSTMT')
+    def stmt(self, p):
+        return ("log", {"type": p.NAME, "args": p.dict})
+
+    ##### MULTILINE STATEMENTS #####
+    @_('FOR NAME IN expr ":" body')
+    def stmt(self, p):
+        return ("for", {"iter_var": p.NAME, "iter": p.expr, "body": p.body})
+
+    @_('IF expr ":" body elif_list [ else_clause ]')
+    def stmt(self, p):
+        return ("if", [(p.expr, p.body)] + p.elif_list + [p.else_clause])
+
+    @_('{ ELIF expr ":" body }')
+    def elif_list(self, p):
+        return list(zip(p.expr, p.body))
+
+    @_('ELSE ":" body')
+    def else_clause(self, p):
+        return (None, p.body)
+
+    ##### EXPRESSIONS #####
+
+    # Binary Operations
+    # Mathematical operations
+    @_("expr ADD expr")
+    @_("expr SUB expr")
+    @_("expr MUL expr")
+    @_("expr DIV expr")
+    @_("expr POW expr")
+    @_("expr MOD expr")
+    # Logical Operations
+    @_("expr AND expr")
+    @_("expr OR expr")
+    @_("expr XOR expr")
+    @_("expr SHL expr")
+    @_("expr SHR expr")
+    # Comparisons
+    @_("expr LT expr")
+    @_("expr LE expr")
+    @_("expr GT expr")
+    @_("expr GE expr")
+    @_("expr EQ expr")
+    @_("expr NE expr")
+    @_("expr IN expr")
+    def expr(self, p):
+        return (p[1].lower(), p.expr0, p.expr1)
+
+    # Unary Operations
+    @_("SUB expr %prec USUB")
+    @_("NOT expr")
+    def expr(self, p):
+        op = "u" + p[0].lower()
+        return (op, p.expr)
+
+    # Ensure wrapping in parens doesn't do anything
+    @_('"(" expr ")"')
+    def expr(self, p):
+        return p.expr
+
+    # Endpoint of an expression
+    @_("literal")
+    @_("variable")
+    def expr(self, p):
+        return p[0]
+
+    ##### VARIABLES ####
+    # Just ensure parenthesis don't do anything
+    @_('"(" variable ")"')
+    def variable(self, p):
+        return p.variable
+
+    # Make a Call
+    @_('variable "(" [ arguments ] ")"')
+    def variable(self, p):
+        return ("call", {"target": p.variable, "args": p.arguments})
+
+    # Call arguments
+    @_('argument { "," argument }')
+    def arguments(self, p):
+        return [p.argument0] + p.argument1
+
+    # Keyword arguments
+    @_('[ NAME "=" ] expr')
+    def argument(self, p):
+        return {"name": p.NAME, "value": p.expr}
+
+    # Get attribute
+    @_("variable DOT NAME")
+    def variable(self, p):
+        return ("getattr", {"target": p.variable, "attribute": p.NAME})
+
+    # Get item
+    @_('variable "[" expr "]"')
+    def variable(self, p):
+        return ("getitem", {"target": p.variable, "index": p.expr})
+
+    # Endpoint for variable
+    @_("NAME")
+    def variable(self, p):
+        return p.NAME
+
+    ##### LITERALS #####
+    @_("number")
+    @_("string")
+    @_("bool")
+    def literal(self, p):
+        return p[0]
+
+    @_("DEC_NUM")
+    def number(self, p):
+        return int(p.DEC_NUM)
+
+    @_("HEX_NUM")
+    def number(self, p):
+        return int(p.HEX_NUM, 16)
+
+    @_("OCT_NUM")
+    def number(self, p):
+        return int(p.OCT_NUM, 8)
+
+    @_("BIN_NUM")
+    def number(self, p):
+        return int(p.BIN_NUM, 2)
+
+    @_("FLOAT")
+    def number(self, p):
+        return float(p.FLOAT)
+
+    @_("STRING")
+    def string(self, p):
+        return p[0]
+
+    @_("BOOL")
+    def bool(self, p):
+        return bool(p.BOOL)
@@ -0,0 +1,138 @@
+"""
+Incremental re-parsing for editors: after an edit, only the top-level
+statements it touches are re-tokenized and re-parsed, and their entries are
+spliced back into the previous Module.
+
+    module = ParsedModule(text)
+    module = reparse(module, start, end, "new text")
+    module.ast  # ("Module", {...}), same as parse(module.text)
+"""
+from bisect import bisect_right
+
+from lex import LineIndex, tokenize
+from parse import parse_tokens
+
+# The lists in a Module, in the order parse() builds them
+MODULE_KEYS = (
+    "imports",
+    "interface_defs",
+    "struct_defs",
+    "event_defs",
+    "storage_defs",
+    "constant_defs",
+    "function_defs",
+)
+
+
+def split_statements(tokens):
+    """
+    Split a token stream into the tokens of each top-level statement
+    (indent level 0), keeping decorators with the function they decorate
+    and a module docstring with the first statement.
+    """
+    statement = []
+    depth = 0
+    line_start = None  # The first token of the current line
+    for t in tokens:
+        statement.append(t)
+        if line_start is None:
+            line_start = t
+        if t.type == "INDENT":
+            depth += 1
+        elif t.type == "DEDENT":
+            depth -= 1
+        elif t.type == "ENDSTMT":
+            # A decorator line doesn't end the statement
+            if depth == 0 and line_start.type != "@":
+                yield statement
+                statement = []
+            line_start = None
+
+    if statement:
+        yield statement
+
+
+class ParsedModule:
+    """
+    The result of parsing a module, remembering where each top-level
+    statement starts so that it can be re-parsed piece by piece.
+    """
+
+    __slots__ = ("text", "regions", "ast")
+
+    def __init__(self, text, regions=None):
+        self.text = text
+        if regions is None:
+            regions = _parse_regions(text, 0, len(text))
+        # (start offset, end offset, Module dict) per top-level statement
+        self.regions = regions
+        self.ast = _join(regions)
+
+
+def _parse_regions(text, start, end):
+    """
+    Parse `text[start:end]`, which must begin and end on statement
+    boundaries, into a list of regions with absolute offsets
+    """
+    source = text[start:end]
+    line_index = LineIndex(source)
+    statements = list(split_statements(tokenize(source, line_index)))
+
+    regions = []
+    for n, tokens in enumerate(statements):
+        region_start = start + tokens[0].index if n else start
+        module = parse_tokens(tokens, source, line_index)[1]
+        regions.append([region_start, None, module])
+
+    if not regions:  # Only whitespace and comments
+        regions.append([start, None, parse_tokens([], source, line_index)[1]])
+
+    for region, next_region in zip(regions, regions[1:]):
+        region[1] = next_region[0]
+    regions[-1][1] = end
+    return [tuple(region) for region in regions]
+
+
+def _join(regions):
+    module = {"doc": regions[0][2]["doc"] if regions else None}
+    for key in MODULE_KEYS:
+        module[key] = [v for _, _, m in regions for v in m[key]]
+    return ("Module", module)
+
+
+def reparse(previous, start, end, replacement):
+    """
+    Apply the edit `text[start:end] = replacement` to a ParsedModule,
+    re-parsing only the top-level statements it touches.
+    Raises SyntaxError (from a full parse) if the new text is invalid.
+    """
+    text = previous.text[:start] + replacement + previous.text[end:]
+    delta = len(replacement) - (end - start)
+    regions = previous.regions
+
+    # Every region the edit touches, including ones it only borders on,
+    # since e.g. deleting a newline joins two statements
+    starts = [r[0] for r in regions]
+    first = max(bisect_right(starts, start) - 1, 0)
+    last = max(bisect_right(starts, end) - 1, first)
+
+    # Editing the first line of a statement can also attach it to the one
+    # before it (e.g. indenting it into the previous function's body)
+    if first > 0 and "\n" not in previous.text[regions[first][0] : start]:
+        first -= 1
+
+    span_start = regions[first][0]
+    span_end = regions[last][1] + delta
+    try:
+        new_regions = _parse_regions(text, span_start, span_end)
+    except SyntaxError:
+        # The edit may not be contained to these statements (e.g. an
+        # unclosed bracket), so let a full parse decide
+        return ParsedModule(text)
+
+    # Keep the module docstring on the first region, if it has one
+    if first > 0 and new_regions[0][2]["doc"] is not None:
+        return ParsedModule(text)
+
+    shifted = [(s + delta, e + delta, m) for s, e, m in regions[last + 1 :]]
+    return ParsedModule(text, regions[:first] + new_regions + shifted)
@@ -1,28 +1,96 @@
+import re as _re
+from array import array as _array
+from bisect import bisect_left as _bisect_left
 from itertools import chain as _chain
-from more_itertools import peekable as _peekable
 from sly.lex import (
     Lexer as _Lexer,
     Token as _Token,
 )
 
 
+def _peekable(tokens):
+    # more_itertools is slow to import, and only the filters of the
+    # reference pipeline need it
+    from more_itertools import peekable
+
+    return peekable(tokens)
+
+
 class VyperToken(_Token):
-    __slots__ = _Token.__slots__ + ("colno",)
+    """
+    A token with its column. Tokens from tokenize() only hold the LineIndex
+    shared by all of them, and work out their column when it's first used.
+    """
+
+    __slots__ = _Token.__slots__ + ("_colno", "line_index")
 
     def __init__(self):
         super().__init__()
-        self.colno = 0
+        self._colno = 0
+        self.line_index = None
 
+    @property
+    def colno(self):
+        if self.line_index is not None:
+            self._colno = self.line_index.column(self.index)
+            self.line_index = None
+        return self._colno
 
-# Compute column.
-#     input is the input text string
-#     token is a token instance
-def _find_column(text, token):
-    last_cr = text.rfind("\n", 0, token.index)
-    if last_cr < 0:
-        last_cr = 0
-    column = (token.index - last_cr) + 1
-    return column
+    @colno.setter
+    def colno(self, colno):
+        self._colno = colno
+        self.line_index = None
+
+
+class LineIndex:
+    """
+    Offsets of every newline in a source text, built once so that columns
+    and source lines can be found with a bisect instead of scanning the text.
+    """
+
+    __slots__ = ("text", "newlines")
+
+    def __init__(self, text):
+        self.text = text
+        self.newlines = newlines = []
+        i = text.find("\n")
+        while i >= 0:
+            newlines.append(i)
+            i = text.find("\n", i + 1)
+
+    def __len__(self):
+        # Same count as `len(text.splitlines())` for "\n" line endings
+        if not self.text:
+            return 0
+        return len(self.newlines) + (0 if self.text.endswith("\n") else 1)
+
+    def column(self, index):
+        # Compute column.
+        #     index is the offset of a token in the text
+        n = _bisect_left(self.newlines, index)
+        last_cr = self.newlines[n - 1] if n else 0
+        return (index - last_cr) + 1
+
+    def position(self, index):
+        """
+        `(lineno, column)` of an offset in the text, with lines counted
+        from 1 and columns from 0 (as in Python's ast)
+        """
+        n = _bisect_left(self.newlines, index)
+        return n + 1, index - (self.newlines[n - 1] + 1 if n else 0)
+
+    def lines(self, start, stop):
+        """
+        Equivalent to `text.splitlines()[start:stop]`, without splitting
+        the whole text.
+        """
+        text, newlines = self.text, self.newlines
+        lines = []
+        for n in range(max(start, 0), min(stop, len(self))):
+            begin = newlines[n - 1] + 1 if n else 0
+            end = newlines[n] if n < len(newlines) else len(text)
+            lines.append(text[begin:end].rstrip("\r"))
+        return lines
 
 
 class VyperLexer(_Lexer):
@@ -106,13 +174,24 @@ class VyperLexer(_Lexer):
 
     # Tokens
 
-    @_("|".join([r'"""(.|\s)*"""', r"'''(.|\s)*'''"]))
+    # Literals are matched as "unrolled loops", where every character can
+    # only be consumed one way. They take linear time (even when never
+    # closed), end at the first unescaped closing quote, and skip escapes.
+    @_(
+        r'"""[^"\\]*(?:(?:\\[\s\S]|"(?!""))[^"\\]*)*"""',
+        r"'''[^'\\]*(?:(?:\\[\s\S]|'(?!''))[^'\\]*)*'''",
+    )
     def DOCSTR(self, t):
         # Docstrings are multiline
         self.lineno += max(t.value.count("\n"), t.value.count("\r"))
         return t
 
-    STRING = "|".join([r'"(?!"").*"', r"'(?!" ").*'"])
+    STRING = "|".join(
+        [
+            r'"(?!"")[^"\\\r\n]*(?:\\.[^"\\\r\n]*)*"',
+            r"'(?!'')[^'\\\r\n]*(?:\\.[^'\\\r\n]*)*'",
+        ]
+    )
 
     HEX_NUM = r"0x[\da-f]*"
     OCT_NUM = r"0o[0-7]*"
@@ -199,7 +278,7 @@ class VyperLexer(_Lexer):
 
         # Can only use 4 spaces or the tab char to denote indent, not both
         if self.__using_spaces and self.__using_tab_char:
-            col = _find_column(self.text, t)
+            col = self._find_column(t)
             raise SyntaxError(f"Mixing tabs and spaces @ line {self.lineno}, col {col}")
 
         return t
@@ -209,30 +288,167 @@ class VyperLexer(_Lexer):
         # Only need this for parsing, discard later
         return t
 
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, line_index=None, **kwargs):
         self.__using_tab_char = False
         self.__using_spaces = False
+        # Shared with tokenize() and the parser, so columns are only indexed once
+        self.line_index = line_index
         super().__init__(*args, **kwargs)
 
+    def _find_column(self, t):
+        if self.line_index is None or self.line_index.text is not self.text:
+            self.line_index = LineIndex(self.text)
+        return self.line_index.column(t.index)
+
     def error(self, t):
-        col = _find_column(self.text, t)
+        col = self._find_column(t)
         raise SyntaxError(
             f"Illegal Character {t.value[0]} @ line {self.lineno}, col {col}"
         )
 
 
+# VyperLexer's token patterns, and the values of NAME that are keywords
+_PATTERNS = {name: getattr(rule, "pattern", rule) for name, rule in VyperLexer._rules}
+KEYWORDS = dict(VyperLexer._remapping["NAME"])
+
+
+def _alternatives(*names):
+    # The rules that can match at a character, in the order sly tries them
+    names = sorted(names, key=list(_PATTERNS).index)
+    return _re.compile("|".join(f"(?P<{name}>{_PATTERNS[name]})" for name in names))
+
+
+_NAME_RE = _re.compile(_PATTERNS["NAME"])
+_NEWLINE_RE = _re.compile(_PATTERNS["NEWLINE"])
+_SPACE_RE = _re.compile(_PATTERNS["SPACE"])
+
+# What to do for each first character of a token
+_NAME, _SPACE, _NEWLINE, _COMMENT, _LITERAL = range(5)
+_DISPATCH = {}
+for _c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_":
+    _DISPATCH[_c] = _NAME
+_DISPATCH[" "] = _DISPATCH["\t"] = _SPACE
+_DISPATCH["\n"] = _DISPATCH["\r"] = _NEWLINE
+_DISPATCH["#"] = _COMMENT
+for _c in VyperLexer.literals:
+    _DISPATCH[_c] = _LITERAL
+# Characters that start more than one kind of token use a small regex of
+# just the rules that can match there
+_DISPATCH['"'] = _DISPATCH["'"] = _alternatives("DOCSTR", "STRING")
+_DISPATCH["0"] = _alternatives("HEX_NUM", "OCT_NUM", "BIN_NUM", "FLOAT", "DEC_NUM")
+for _c in "123456789":
+    _DISPATCH[_c] = _alternatives("FLOAT", "DEC_NUM")
+_DISPATCH["."] = _alternatives("FLOAT", "DOT")
+_DISPATCH["-"] = _alternatives("ARROW", "AUGSUB", "SUB")
+_DISPATCH["<"] = _alternatives("SHL", "LT", "LE")
+_DISPATCH[">"] = _alternatives("SHR", "GT", "GE")
+_DISPATCH["="] = _alternatives("EQ")  # Or else the "=" literal
+_DISPATCH["!"] = _alternatives("NE")
+_DISPATCH["*"] = _alternatives("AUGPOW", "AUGMUL", "POW", "MUL")
+_DISPATCH["+"] = _alternatives("AUGADD", "ADD")
+_DISPATCH["/"] = _alternatives("AUGDIV", "DIV")
+_DISPATCH["%"] = _alternatives("AUGMOD", "MOD")
+_DISPATCH[";"] = _alternatives("ENDSTMT")
+del _c
+
+
+class TableLexer:
+    """
+    Produces exactly the same tokens (and errors) as VyperLexer, but looks
+    up what to do with the first character of each token in a table,
+    instead of trying sly's regex of every pattern and then calling a
+    method for NEWLINE, TAB, SPACE, DOCSTR and comments.
+    """
+
+    def __init__(self, line_index=None):
+        self._using_tab_char = False
+        self._using_spaces = False
+        self.line_index = line_index
+
+    def tokenize(self, text, lineno=1, index=0):
+        dispatch, keywords, size = _DISPATCH, KEYWORDS, len(text)
+        while index < size:
+            c = text[index]
+            kind = dispatch.get(c)
+            tok = _Token()
+            tok.lineno = lineno
+            tok.index = index
+
+            if kind is _NAME:
+                value = _NAME_RE.match(text, index).group()
+                tok.type = keywords.get(value, "NAME")
+            elif kind is _SPACE:
+                if c == "\t" or text.startswith("    ", index):
+                    value = c * (1 if c == "\t" else 4)
+                    tok.type = "TAB"
+                    self._check_indent(text, index, lineno, value)
+                else:
+                    value = _SPACE_RE.match(text, index).group()
+                    tok.type = "SPACE"
+            elif kind is _NEWLINE:
+                value = _NEWLINE_RE.match(text, index).group()
+                tok.type = "NEWLINE"
+                lineno += max(value.count("\n"), value.count("\r"))
+            elif kind is _COMMENT:
+                end = text.find("\n", index)
+                index = size if end < 0 else end
+                continue
+            elif kind is _LITERAL:
+                value = tok.type = c
+            else:
+                m = kind.match(text, index) if kind is not None else None
+                if m is not None:
+                    value = m.group()
+                    tok.type = m.lastgroup
+                    if tok.type == "DOCSTR":
+                        lineno += max(value.count("\n"), value.count("\r"))
+                elif c in VyperLexer.literals:
+                    value = tok.type = c
+                else:
+                    self._error(text, index, lineno)
+
+            tok.value = value
+            index += len(value)
+            yield tok
+
+    def _check_indent(self, text, index, lineno, value):
+        # Can only use 4 spaces or the tab char to denote indent, not both
+        if value == "\t":
+            self._using_tab_char = True
+        else:
+            self._using_spaces = True
+        if self._using_spaces and self._using_tab_char:
+            col = self._find_column(text, index)
+            raise SyntaxError(f"Mixing tabs and spaces @ line {lineno}, col {col}")
+
+    def _find_column(self, text, index):
+        if self.line_index is None or self.line_index.text is not text:
+            self.line_index = LineIndex(text)
+        return self.line_index.column(index)
+
+    def _error(self, text, index, lineno):
+        col = self._find_column(text, index)
+        raise SyntaxError(f"Illegal Character {text[index]} @ line {lineno}, col {col}")
+
+
+# Lexers that tokenize() can run, by name
+ENGINES = {"sly": VyperLexer, "table": TableLexer}
+
 # The tokens that actually get exported by tokenize() below
 TOKENS = VyperLexer.tokens - {"TAB", "SPACE", "NEWLINE"}
 
 
-def annotate_columns(text, tokens):
+def annotate_columns(text, tokens, line_index=None):
+    if line_index is None:
+        line_index = LineIndex(text)
+
     for token in tokens:
         vy_token = VyperToken()
         vy_token.type = token.type
         vy_token.value = token.value
         vy_token.index = token.index
         vy_token.lineno = token.lineno
-        vy_token.colno = _find_column(text, token)
+        vy_token.colno = line_index.column(token.index)
         yield vy_token
 
 
@@ -249,14 +465,21 @@ def indent_tracker(tokens):
     # The below functionality is only here to aid in parsing whitespace for scoping.
     indent_level = 0
 
+    # Like Python, line breaks inside (), [] or {} don't end the line
+    bracket_depth = 0
+
     for t in tokens:
 
-        if t.type == "NEWLINE":
+        if t.type == "NEWLINE" and bracket_depth > 0:
+            continue  # The line continues inside the brackets
+
+        elif t.type == "NEWLINE":
             starting_t = (
                 t  # Keep this in case we need to abort, or there's no indent change
             )
 
             lvl = 0
+            blank = False
             try:
                 # Count how many tabs we have
                 while tokens.peek().type == "TAB":
@@ -264,11 +487,8 @@ def indent_tracker(tokens):
                     lvl += 1
 
                     # TAB followed by a NEWLINE is just whitespace
-                    # Resetting the level and breaking allows the
-                    # detection of TAB -> NEWLINE below to skip
-                    # yielding a token
                     if tokens.peek().type == "NEWLINE":
-                        lvl = indent_level
+                        blank = True
                         break
 
                     # If we have 1+ spaces after a tab, it's a problem
@@ -280,8 +500,12 @@ def indent_tracker(tokens):
                 # so dedent all the way
                 lvl = 0
 
+            # TAB(s) + NEWLINE is whitespace, which we ignore
+            if blank:
+                continue
+
             # Can only indent once per line, check if one too many tabs!
-            if lvl - indent_level > 1:
+            elif lvl - indent_level > 1:
                 raise SyntaxError(f"Too much indenting @ line {t.lineno}")
             # One ore indent than current indent level (discard the newline)
             elif lvl > indent_level:
@@ -290,37 +514,42 @@ def indent_tracker(tokens):
                 indent_level += 1  # increment indent by one level
                 yield t
 
-            # Less indent than current indent level (discard the newline)
+            # Less indent than current indent level
             elif lvl < indent_level:
-                yield t  # We want the newline
+                yield starting_t  # We want the newline
                 dedent = VyperToken()  # Create a new token from the last one
                 dedent.type = "DEDENT"  # Change TAB to DEDENT (or add it if NEWLINE)
                 dedent.value = t.value
                 dedent.index = t.index
                 dedent.lineno = t.lineno
-                # yield number of DEDENTs equal to the difference in levels
+                # yield number of DEDENTs equal to the difference in levels,
+                # each followed by a NEWLINE since it also ends a statement
                 missing_levels = indent_level - lvl
                 for _ in range(missing_levels):
                     indent_level -= 1  # dedent by one level
                     yield dedent
-            # No indent or dedent occured, so keep the newline if it's not an empty line
-            elif t.type != "TAB":
+                    yield starting_t
+            # No indent or dedent occured, so keep the newline
+            else:
                 yield starting_t
-            # TAB(s) + NEWLINE is whitespace, which we ignore
 
         elif t.type in ("SPACE", "TAB"):
             continue  # We don't care about spaces or tabs otherwise
 
         else:
+            if t.type in ("(", "[", "{"):
+                bracket_depth += 1
+            elif t.type in (")", "]", "}"):
+                bracket_depth -= 1
             yield t  # Normal token
 
 
 def collapse_unnecessary_multiline(tokens):
     """
     Filter a stream of tokens for instances where a unnecessary INDENT-DEDENT pair occurs
-    and remove it. It is considered "unnecessary" if a ":" doesn't preceed the INDENT.
-    Throws if it finds two INDENTs in a row under these conditions, because it was not
-    inteded to handle that.
+    and remove it, along with the NEWLINEs between them. It is considered "unnecessary"
+    if a ":" doesn't preceed the INDENT. Throws if it finds two INDENTs in a row under
+    these conditions, because it was not inteded to handle that.
     """
     # Need a peekable iterator
     tokens = _peekable(tokens)
@@ -338,7 +567,8 @@ def collapse_unnecessary_multiline(tokens):
             next(tokens)  # Skip the INDENT
             assert t.type != "DEDENT"  # DEDENT should never be followed by INDENT
             while t.type != "DEDENT":  # Look for the next DEDENT
-                yield t
+                if t.type != "NEWLINE":  # These lines are all one statement
+                    yield t
                 try:
                     t = next(tokens)
                 except StopIteration as e:
@@ -417,15 +647,14 @@ def skip_begin(tokens, token_type):
     Check if the first token is the given type,
     if it is then skip that one (and that one only)
     """
-    tokens = _peekable(tokens)
+    tokens = iter(tokens)
 
-    try:
-        if tokens.peek().type == token_type:
-            next(tokens)  # Skip the first one
-    except StopIteration as e:
-        return  # Empty program
+    for t in tokens:
+        if t.type != token_type:
+            yield t
+        break  # Only the first one
 
-    return tokens
+    yield from tokens
 
 
 def substitute(tokens, token_type, substitute_type):
@@ -470,11 +699,14 @@ def swap_order(tokens, a_type, b_type):
 def add_last(tokens, type_to_add):
     """
     Pass-through all the tokens in the stream, appending an additional token
-    of `type_to_add` to the end
+    of `type_to_add` to the end (unless it already ends with one)
     """
     for t in tokens:
         yield t
 
+    if t.type == type_to_add:
+        return
+
     last_t = VyperToken()
     last_t.type = type_to_add
     last_t.value = ""
@@ -483,47 +715,395 @@ def add_last(tokens, type_to_add):
     yield last_t
 
 
-def tokenize(text):
+def postprocess(tokens, line_index, annotate=True):
     """
-    Override behavior to integrate various token modification filters
+    Single-pass equivalent of `reference_pipeline`: produces the same token
+    stream, but as one state machine with at most one token of lookahead,
+    instead of nine stacked generators with their own peek buffers.
+
+    With `annotate=False`, tokens from the lexer are passed through as-is
+    instead of being copied into `VyperToken`s with a column number, and
+    `line_index` isn't used (so it may be None).
     """
-    tokens = VyperLexer().tokenize(text)
+    # indent_tracker: the NEWLINE starting the line we're counting TABs for,
+    # and the last TAB seen on that line (if any)
+    indent_level = 0
+    bracket_depth = 0
+    line_start = None
+    last_tab = None
+    lvl = 0
+    last = None  # for add_last
+
+    # collapse_unnecessary_multiline: token waiting for the next one,
+    # and the INDENT we are currently collapsing
+    held = None
+    collapsing = None
+
+    # skip_begin, skip_after and swap_order
+    started = False
+    prev_type = None
+    docstr = None
+
+    indented = []  # Output of the indent stage for a single input token
+    collapsed = []  # Output of the collapse stage for a single input token
+
+    def resolve(lvl, t, starting_t):
+        nonlocal indent_level
+        # Can only indent once per line, check if one too many tabs!
+        if lvl - indent_level > 1:
+            raise SyntaxError(f"Too much indenting @ line {t.lineno}")
+        elif lvl > indent_level:
+            t.type = "INDENT"
+            indent_level += 1
+            indented.append(t)
+        elif lvl < indent_level:
+            indented.append(starting_t)
+            dedent = VyperToken()
+            dedent.type = "DEDENT"
+            dedent.value = t.value
+            dedent.index = t.index
+            dedent.lineno = t.lineno
+            # Each DEDENT is followed by a NEWLINE, since it also ends a statement
+            indented.extend([dedent, starting_t] * (indent_level - lvl))
+            indent_level = lvl
+        else:
+            indented.append(starting_t)
+
+    for token in _chain(tokens, (None,)):
+        if token is not None:
+            last = token
+            if line_start is None and (
+                token.type in ("SPACE", "TAB")
+                or (token.type == "NEWLINE" and bracket_depth > 0)
+            ):
+                continue  # Whitespace only matters at the start of a line
+
+            if annotate:
+                t = VyperToken()
+                t.type = token.type
+                t.value = token.value
+                t.index = token.index
+                t.lineno = token.lineno
+                t.line_index = line_index  # For its column, when it's used
+            else:
+                t = token
+        elif last is None:
+            return  # Empty program
+        elif last.type != "NEWLINE":
+            # Ensure that we can parse programs that don't end with an newline
+            t = VyperToken()
+            t.type = "NEWLINE"
+            t.value = ""
+            t.index = last.index + len(last.value)
+            t.lineno = last.lineno
+        else:
+            t = None
+
+        # Indent tracking, where the token may only be a lookahead
+        # for the line we are counting TABs on
+        if t is not None and line_start is not None:
+            if t.type == "TAB":
+                lvl += 1
+                last_tab = t
+                continue
+
+            if last_tab is not None:
+                if t.type == "SPACE":
+                    # If we have 1+ spaces after a tab, it's a problem
+                    raise SyntaxError(f"Misaligned indent @ line {last_tab.lineno}")
+                elif t.type != "NEWLINE":
+                    resolve(lvl, last_tab, line_start)
+                # TAB(s) + NEWLINE is whitespace, which we ignore
 
+            elif t.type == "NEWLINE":
+                # Ignoring comments leaves extra newlines in place
+                line_start = t
+                continue
+
+            else:
+                resolve(lvl, line_start, line_start)
+
+            line_start = None
+
+        if t is None or t.type == "NEWLINE":
+            if t is not None and bracket_depth <= 0:
+                line_start = t
+                lvl = 0
+                last_tab = None
+            if token is None and line_start is not None:
+                # End of program, so dedent all the way
+                resolve(0, line_start, line_start)
+        elif t.type not in ("SPACE", "TAB"):
+            if t.type in ("(", "[", "{"):
+                bracket_depth += 1
+            elif t.type in (")", "]", "}"):
+                bracket_depth -= 1
+            indented.append(t)
+
+        if not indented and token is not None:
+            continue
+
+        # Remove unnecessary INDENT-DEDENT pairs from multiline definitions
+        for t in indented:
+            if collapsing is not None:
+                if t.type == "DEDENT":
+                    collapsing = None
+                    continue
+                if t.type == "INDENT":
+                    raise SyntaxError(f"Cannot further indent here: {t}")
+                if t.type != "NEWLINE":
+                    collapsed.append(t)
+            elif held is None:
+                held = t
+            elif held.type != ":" and t.type == "INDENT":
+                assert held.type != "DEDENT"  # DEDENT should never be followed by INDENT
+                if held.type != "NEWLINE":
+                    collapsed.append(held)
+                held = None
+                collapsing = t
+            else:
+                collapsed.append(held)
+                held = t
+        indented.clear()
+
+        if token is None:
+            if collapsing is not None:
+                raise SyntaxError(f"No corresponding DEDENT for INDENT: {collapsing}")
+            if held is not None:
+                collapsed.append(held)
+
+        for t in collapsed:
+            if not started:
+                started = True
+                # We don't need a program that starts with a newline
+                if t.type == "NEWLINE":
+                    continue
+
+            if t.type == "NEWLINE":
+                # Ignore newlines after ENDSTMT, commas and DOCSTRs
+                if prev_type in ("ENDSTMT", ",", "DOCSTR"):
+                    continue
+                prev_type = "NEWLINE"
+                substitute = VyperToken()
+                substitute.type = "ENDSTMT"
+                substitute.value = t.value
+                substitute.index = t.index
+                substitute.lineno = t.lineno
+                t = substitute
+            else:
+                prev_type = t.type
+
+            # Swap DOCSTR and INDENT, so the docstring is inside the body
+            if docstr is not None:
+                if t.type == "INDENT":
+                    yield t
+                    yield docstr
+                    docstr = None
+                    continue
+                yield docstr
+                docstr = None
+
+            if t.type == "DOCSTR":
+                docstr = t
+            else:
+                yield t
+        collapsed.clear()
+
+    if docstr is not None:
+        yield docstr
+
+
+def _unmeasured(name, tokens):
+    return tokens
+
+
+def reference_pipeline(text, tokens, line_index, measure=_unmeasured):
+    """
+    The token modification filters, chained one after another.
+    Kept as the reference behavior for `postprocess`.
+
+    `measure(name, tokens)` is applied to the output of every filter.
+    """
     # Add colno to all tokens
-    tokens = annotate_columns(text, tokens)
+    tokens = measure("annotate_columns", annotate_columns(text, tokens, line_index))
 
     # Since we are ignoring comments above, we have instances
     # where there are >1 comments in a row, which messes with
     # our indent tracker
-    tokens = remove_double(tokens, "NEWLINE")
+    tokens = measure("remove_double", remove_double(tokens, "NEWLINE"))
 
     # Ensure that we can parse programs that don't end with an newline
-    tokens = add_last(tokens, "NEWLINE")
+    tokens = measure("add_last", add_last(tokens, "NEWLINE"))
 
     # Do our indent algorithm, returning a stream without contextual whitespace
-    tokens = indent_tracker(tokens)
+    tokens = measure("indent_tracker", indent_tracker(tokens))
 
     # We allow users to make certain definitions into multiline defs
-    # e.g. a = ( NEWLINE INDENT 1, NEWLINE 2, NEWLINE 3, NEWLINE DEDENT )
+    # e.g. a = 1 + NEWLINE INDENT 2 + NEWLINE 3 NEWLINE DEDENT
     # But the parser doesn't need to know about them, so remove the INDENT/DEDENT pairs
-    # NOTE: The indent_tracker already removes the NEWLINEs
-    tokens = collapse_unnecessary_multiline(tokens)
+    # NOTE: The indent_tracker already removes NEWLINEs inside brackets
+    tokens = measure(
+        "collapse_unnecessary_multiline", collapse_unnecessary_multiline(tokens)
+    )
 
     # We don't need a program that starts with a newline
-    tokens = skip_begin(tokens, "NEWLINE")
+    tokens = measure("skip_begin", skip_begin(tokens, "NEWLINE"))
 
     # Ignore newlines that occur after actual ENDSTMT tokens (e.g. ";")
     # and commas (e.g. multi-line comma-separated values)
     # Ignore newlines after DOCSTR because it screws with function body docstrings
-    tokens = skip_after(tokens, "NEWLINE", ("ENDSTMT", ",", "DOCSTR"))
+    tokens = measure(
+        "skip_after", skip_after(tokens, "NEWLINE", ("ENDSTMT", ",", "DOCSTR"))
+    )
 
     # Turn all the NEWLINES into ENDSTMTS, as we no longer need them present
-    tokens = substitute(tokens, "NEWLINE", "ENDSTMT")
+    tokens = measure("substitute", substitute(tokens, "NEWLINE", "ENDSTMT"))
 
     # INDENT denotes the start of a body, and we do this to help the parser
     # ensure that a docstring only appears inside a function body at the top.
     # Otherwise we would have to post-process the body to ensure that it was
     # the top-most statement.
-    tokens = swap_order(tokens, "DOCSTR", "INDENT")
+    tokens = measure("swap_order", swap_order(tokens, "DOCSTR", "INDENT"))
+
+    return tokens
+
+
+# Ways tokenize() can post-process the lexer output
+PIPELINES = ("fused", "reference")
+
+# Every token type that can come out of tokenize(), numbered for TokenBuffer
+TOKEN_TYPES = tuple(sorted(VyperLexer.tokens | VyperLexer.literals))
+TOKEN_IDS = {token_type: n for n, token_type in enumerate(TOKEN_TYPES)}
+
+
+class TokenView:
+    """
+    A single token in a TokenBuffer, with the same attributes as a VyperToken.
+    The value is only sliced out of the source text when asked for.
+    """
+
+    __slots__ = ("buffer", "n")
+
+    def __init__(self, buffer, n):
+        self.buffer = buffer
+        self.n = n
+
+    @property
+    def type(self):
+        return TOKEN_TYPES[self.buffer.types[self.n]]
+
+    @property
+    def value(self):
+        return self.buffer.value(self.n)
+
+    @property
+    def index(self):
+        return self.buffer.starts[self.n]
+
+    @property
+    def lineno(self):
+        return self.buffer.linenos[self.n]
+
+    @property
+    def colno(self):
+        return self.buffer.colnos[self.n]
+
+    def __repr__(self):
+        return (
+            f"Token(type={self.type!r}, value={self.value!r}, "
+            f"lineno={self.lineno}, index={self.index})"
+        )
+
+
+class TokenBuffer:
+    """
+    Compact struct-of-arrays storage for the output of tokenize(), holding
+    the type id, start and end offset, line and column of every token in
+    parallel typed arrays rather than as one object per token.
+    """
+
+    __slots__ = ("text", "types", "starts", "ends", "linenos", "colnos")
+
+    def __init__(self, text):
+        self.text = text
+        # 4 bytes per entry, unless the offsets may not fit in that
+        typecode = "I" if len(text) < 2 ** 32 else "Q"
+        self.types = _array("B")
+        self.starts = _array(typecode)
+        self.ends = _array(typecode)
+        self.linenos = _array(typecode)
+        self.colnos = _array(typecode)
+
+    def __len__(self):
+        return len(self.types)
+
+    def __getitem__(self, n):
+        if n < 0:
+            n += len(self.types)
+        if not 0 <= n < len(self.types):
+            raise IndexError("token index out of range")
+        return TokenView(self, n)
+
+    def __iter__(self):
+        for n in range(len(self.types)):
+            yield TokenView(self, n)
+
+    def value(self, n):
+        return self.text[self.starts[n] : self.ends[n]]
+
+    def extend(self, tokens, line_index):
+        """
+        Append a stream of tokens. Tokens that come straight from the lexer
+        have no column yet, so it is computed here.
+        """
+        types, starts, ends = self.types, self.starts, self.ends
+        linenos, colnos = self.linenos, self.colnos
+        column = line_index.column
+        for t in tokens:
+            types.append(TOKEN_IDS[t.type])
+            starts.append(t.index)
+            ends.append(t.index + len(t.value))
+            linenos.append(t.lineno)
+            colnos.append(t.colno if type(t) is VyperToken else column(t.index))
+
+
+def tokenize(
+    text, line_index=None, pipeline="fused", buffer=False, metrics=None, engine="sly"
+):
+    """
+    Override behavior to integrate various token modification filters
+
+    `engine` picks the lexer from ENGINES: VyperLexer ("sly"), or the
+    TableLexer ("table") which produces the same tokens faster.
+
+    With `buffer=True`, the whole stream is stored in a TokenBuffer instead
+    of being generated one VyperToken at a time.
+
+    With a `metrics.PipelineMetrics`, the tokens in and out of every stage
+    and the time spent in it are recorded there (call its `finish()` once
+    the tokens have been consumed).
+    """
+    if line_index is None:
+        line_index = LineIndex(text)
+
+    measure = _unmeasured if metrics is None else metrics.measure
+
+    try:
+        lexer = ENGINES[engine](line_index=line_index)
+    except KeyError:
+        raise ValueError(f"Unknown engine '{engine}', expected one of {tuple(ENGINES)}")
+    tokens = measure("lexer", lexer.tokenize(text))
+
+    if pipeline == "fused":
+        tokens = measure("postprocess", postprocess(tokens, line_index, not buffer))
+    elif pipeline == "reference":
+        tokens = reference_pipeline(text, tokens, line_index, measure)
+    else:
+        raise ValueError(f"Unknown pipeline '{pipeline}', expected one of {PIPELINES}")
+
+    if buffer:
+        token_buffer = TokenBuffer(text)
+        token_buffer.extend(tokens, line_index)
+        return token_buffer
 
     return tokens
@@ -0,0 +1,186 @@
+"""
+Where the memory goes when tokenizing and parsing a source, as traced by
+tracemalloc: the peak of tokenize() and of parse(), the bytes of the
+tokens by the pipeline stage that made them, and the bytes of the AST by
+the kind of node they belong to.
+
+    report = memory_report(text)
+    report["parse"]["peak_bytes_per_byte"]  # Peak / size of the source
+    report["parse"]["nodes"]  # {"FunctionDef": ..., "BinOp": ..., ...}
+
+Sizes are also given per byte of source, so limits hold for any size of
+input (see `python bench.py memory --limit`).
+"""
+import ast
+import inspect
+import os
+import sys
+import tracemalloc
+
+import sly
+
+import lex
+from incremental import MODULE_KEYS
+from lex import tokenize
+from nodes import BINARY_OPS, UNARY_OPS
+from parse import parse_tokens
+
+# The lexer classes, which are the first stage of tokenize()
+_LEXERS = {lexer.__name__ for lexer in lex.ENGINES.values()}
+
+_SLY = os.path.dirname(sly.__file__)
+
+# The kind of definition in each list of a Module, e.g. "StructDef"
+_DEFINITIONS = {
+    key: "".join(word.title() for word in key[:-1].split("_")) for key in MODULE_KEYS
+}
+
+_definitions = {}
+
+
+def _definitions_in(module):
+    """
+    `(first line, last line, name)` of every top-level definition in `module`
+    """
+    if module.__name__ not in _definitions:
+        _definitions[module.__name__] = [
+            (node.lineno, node.end_lineno, node.name)
+            for node in ast.parse(inspect.getsource(module)).body
+            if isinstance(node, (ast.FunctionDef, ast.ClassDef))
+        ]
+    return _definitions[module.__name__]
+
+
+def _by_definition(snapshot, module):
+    """
+    Bytes in `snapshot` by the definition in `module` that allocated them,
+    or by the file for anything allocated elsewhere (e.g. "sly/lex.py")
+    """
+    definitions = _definitions_in(module)
+    # Not samefile(), as frames can be in e.g. "<frozen ...>" files
+    source = os.path.normcase(os.path.abspath(module.__file__))
+    sizes = {}
+    for stat in snapshot.statistics("lineno"):
+        frame = stat.traceback[0]
+        name = os.path.basename(frame.filename)
+        if os.path.dirname(frame.filename) == _SLY:
+            name = f"sly/{name}"
+        elif os.path.normcase(os.path.abspath(frame.filename)) == source:
+            for first, last, definition in definitions:
+                if first <= frame.lineno <= last:
+                    name = definition
+                    break
+        sizes[name] = sizes.get(name, 0) + stat.size
+    return _largest_first(sizes)
+
+
+def _by_kind(tree):
+    """
+    Bytes of the objects in `tree` (by sys.getsizeof(), each counted once)
+    by the kind of node they belong to: the kind of definition for the
+    entries of a Module, the tag of a `(tag, ...)` tuple (with all operators
+    as "BinOp" or "UnaryOp"), or else the kind of the node they are in
+    """
+    sizes = {}
+    seen = set()
+    stack = [(tree, "Module")]
+    while stack:
+        value, kind = stack.pop()
+        if id(value) in seen:
+            continue  # e.g. interned names
+        seen.add(id(value))
+
+        if isinstance(value, tuple) and value and isinstance(value[0], str):
+            kind = value[0]
+            if kind in BINARY_OPS:
+                kind = "BinOp"
+            elif kind in UNARY_OPS:
+                kind = "UnaryOp"
+        sizes[kind] = sizes.get(kind, 0) + sys.getsizeof(value)
+
+        if kind == "Module" and isinstance(value, dict):
+            for key, entries in value.items():
+                if key in _DEFINITIONS:
+                    sizes[kind] += sys.getsizeof(entries)
+                    seen.add(id(entries))
+                    stack.extend((entry, _DEFINITIONS[key]) for entry in entries)
+                else:
+                    stack.append((entries, kind))
+        elif isinstance(value, dict):
+            stack.extend((v, kind) for v in value.values())
+            stack.extend((k, kind) for k in value)
+        elif isinstance(value, (list, tuple)):
+            stack.extend((v, kind) for v in value)
+    return _largest_first(sizes)
+
+
+def _largest_first(sizes):
+    return dict(sorted(sizes.items(), key=lambda item: -item[1]))
+
+
+def _stages(snapshot):
+    stages = {}
+    for name, size in _by_definition(snapshot, lex).items():
+        # sly's lexer runs the rules of VyperLexer
+        if name in _LEXERS or name == "sly/lex.py":
+            name = "lexer"
+        stages[name] = stages.get(name, 0) + size
+    return stages
+
+
+def _traced(func):
+    """
+    Run func() while tracing, returning its peak bytes, and a snapshot of
+    the allocations still held once it's done (by its result)
+    """
+    tracemalloc.start()
+    try:
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),  # e.g. the list of tokens
+            ]
+        )
+        del result
+        return peak, snapshot
+    finally:
+        tracemalloc.stop()
+
+
+def memory_report(text):
+    """
+    A dict of the memory used to tokenize and to parse `text`. Under
+    "stages" are the bytes of all the tokens of `text`, if they were held
+    at once, by the stage of tokenize() that made them (a parse only holds
+    a few at a time), and under "nodes" the sizes of the AST's objects by
+    the kind of node they belong to.
+    """
+    size = len(text.encode())
+
+    def tokenize_only():
+        for _ in tokenize(text):
+            pass
+
+    tokenize_peak, _ = _traced(tokenize_only)
+    # Holding on to every token, to see where they were made
+    _, tokens = _traced(lambda: list(tokenize(text)))
+    parse_peak, tree = _traced(lambda: parse_tokens(tokenize(text), text))
+    ast_bytes = sum(stat.size for stat in tree.statistics("filename"))
+
+    return {
+        "source_bytes": size,
+        "tokenize": {
+            "peak_bytes": tokenize_peak,
+            "peak_bytes_per_byte": tokenize_peak / size,
+            "stages": _stages(tokens),
+        },
+        "parse": {
+            "peak_bytes": parse_peak,
+            "peak_bytes_per_byte": parse_peak / size,
+            "ast_bytes": ast_bytes,
+            "ast_bytes_per_byte": ast_bytes / size,
+            "nodes": _by_kind(parse_tokens(tokenize(text), text)),
+        },
+    }
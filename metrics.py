@@ -0,0 +1,136 @@
+"""
+Per-stage instrumentation of the tokenize() pipeline and the parser.
+
+    ast, metrics = parse(text, instrument=True)
+    metrics.stages["lexer"]  # StageMetrics(tokens_in=0, tokens_out=..., seconds=...)
+    print(metrics.to_prometheus())
+
+Metrics from many parses can be added together, e.g. `total += metrics`.
+"""
+from time import perf_counter
+
+
+class StageMetrics:
+    """
+    The tokens that went in and out of a stage, and the time spent in it
+    (not counting the time spent in the stages before it)
+    """
+
+    __slots__ = ("tokens_in", "tokens_out", "seconds")
+
+    def __init__(self, tokens_in=0, tokens_out=0, seconds=0.0):
+        self.tokens_in = tokens_in
+        self.tokens_out = tokens_out
+        self.seconds = seconds
+
+    def __repr__(self):
+        return (
+            f"StageMetrics(tokens_in={self.tokens_in}, "
+            f"tokens_out={self.tokens_out}, seconds={self.seconds:.6f})"
+        )
+
+
+class PipelineMetrics:
+    """
+    StageMetrics for every stage that ran, in pipeline order.
+    Stages are measured by wrapping their token streams, which is only done
+    when metrics are asked for, so there's no cost otherwise.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.parses = 0
+        # How many tokens came out of each stage in this run, and how long
+        # they took, including the time spent in the stages before it
+        # (since the stream pulls from them)
+        self._runs = []
+
+    def measure(self, name, tokens):
+        """
+        Wrap the token stream coming out of stage `name`
+        """
+        run = [name, 0, 0.0]  # Tokens out, and time including earlier stages
+        self._runs.append(run)
+        return self._measured(run, tokens)
+
+    @staticmethod
+    def _measured(run, tokens):
+        tokens = iter(tokens)
+        while True:
+            start = perf_counter()
+            try:
+                t = next(tokens)
+            except StopIteration:
+                return
+            finally:
+                run[2] += perf_counter() - start
+            run[1] += 1
+            yield t
+
+    def measure_parser(self, parse, tokens):
+        """
+        Run `parse(tokens)` on the output of the measured stages,
+        measuring the parser as the last stage
+        """
+        start = perf_counter()
+        try:
+            return parse(tokens)
+        finally:
+            self.finish(parser_seconds=perf_counter() - start)
+
+    def finish(self, parser_seconds=None):
+        """
+        Add up the measured streams into each stage's StageMetrics.
+        Called once a parse is done; call it yourself after consuming
+        the tokens of an instrumented tokenize().
+        """
+        tokens_in, before = None, 0.0
+        for name, tokens_out, inclusive in self._runs:
+            stage = self.stages.setdefault(name, StageMetrics())
+            # The lexer reads characters, so it has no tokens in
+            stage.tokens_in += tokens_in or 0
+            stage.tokens_out += tokens_out
+            stage.seconds += inclusive - before
+            tokens_in, before = tokens_out, inclusive
+
+        if parser_seconds is not None:
+            # The parser pulled the tokens, so its time includes all the others
+            stage = self.stages.setdefault("parser", StageMetrics())
+            stage.tokens_in += tokens_in or 0
+            stage.seconds += parser_seconds - before
+
+        self._runs = []
+        self.parses += 1
+
+    def __iadd__(self, other):
+        for name, theirs in other.stages.items():
+            ours = self.stages.setdefault(name, StageMetrics())
+            ours.tokens_in += theirs.tokens_in
+            ours.tokens_out += theirs.tokens_out
+            ours.seconds += theirs.seconds
+        self.parses += other.parses
+        return self
+
+    def __repr__(self):
+        return f"PipelineMetrics({self.stages!r})"
+
+    def to_prometheus(self, prefix="vyper_grammar"):
+        """
+        Render as Prometheus text exposition format, one series per stage
+        """
+        lines = [
+            f"# HELP {prefix}_parses_total Number of instrumented parses",
+            f"# TYPE {prefix}_parses_total counter",
+            f"{prefix}_parses_total {self.parses}",
+        ]
+        for metric, attribute, help_text in (
+            ("stage_tokens_in_total", "tokens_in", "Tokens into each stage"),
+            ("stage_tokens_out_total", "tokens_out", "Tokens out of each stage"),
+            ("stage_seconds_total", "seconds", "Time spent in each stage"),
+        ):
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} counter")
+            for name, stage in self.stages.items():
+                value = getattr(stage, attribute)
+                lines.append(f'{prefix}_{metric}{{stage="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,568 @@
+"""
+Typed AST nodes with `__slots__`, as a more compact and faster to use
+alternative to the nested tuples and dicts that the parser builds.
+
+    module = parse(text, nodes=True)
+    for function in module.function_defs:
+        function.name, function.body
+    module.to_tuple() == parse(text)
+
+Names, strings and numbers are kept as plain Python values.
+
+With `parse(text, nodes=True, spans=True)`, every node's `span` is its
+`(start_offset, end_offset)` in the text (see parse.Spans).
+"""
+from functools import wraps
+
+
+class Node:
+    """
+    Base class of all nodes. Fields are the `__slots__` of the subclass.
+    `span` isn't one of them, so it's not compared nor converted.
+    """
+
+    __slots__ = ("span",)
+
+    def __init__(self, *values):
+        self.span = None
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and all(
+            getattr(self, f) == getattr(other, f) for f in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ", ".join(f"{f}={getattr(self, f)!r}" for f in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def to_tuple(self):
+        """
+        Convert back to the tuples and dicts that parse() returns
+        """
+        raise NotImplementedError
+
+
+def to_tuple(value):
+    """
+    Convert nodes (and lists or tuples of them) back to what parse() returns
+    """
+    if isinstance(value, Node):
+        return value.to_tuple()
+    elif isinstance(value, list):
+        return [to_tuple(v) for v in value]
+    elif isinstance(value, tuple):
+        return tuple(to_tuple(v) for v in value)
+    else:
+        return value
+
+
+def _fields(node):
+    return {f: to_tuple(getattr(node, f)) for f in node.__slots__}
+
+
+class _Tagged(Node):
+    """
+    A node that is a `(tag, {field: value, ...})` tuple in parse() output
+    """
+
+    __slots__ = ()
+    tag = None
+
+    def to_tuple(self):
+        return (self.tag, _fields(self))
+
+
+class _Plain(Node):
+    """
+    A node that is an untagged `{field: value, ...}` dict in parse() output
+    """
+
+    __slots__ = ()
+
+    def to_tuple(self):
+        return _fields(self)
+
+
+##### MODULE #####
+class Module(Node):
+    __slots__ = (
+        "doc",
+        "imports",
+        "interface_defs",
+        "struct_defs",
+        "event_defs",
+        "storage_defs",
+        "constant_defs",
+        "function_defs",
+    )
+
+    def to_tuple(self):
+        return ("Module", _fields(self))
+
+
+class Import(_Plain):
+    __slots__ = ("path", "alias")
+
+
+##### TYPES #####
+class BaseType(Node):
+    __slots__ = ("name",)
+
+    def to_tuple(self):
+        return ("BaseType", self.name)
+
+
+class ArrayType(Node):
+    __slots__ = ("type", "size")
+
+    def to_tuple(self):
+        size = to_tuple(self.size)
+        return ("ArrayType", {"type": to_tuple(self.type), "size": size, "len": size})
+
+
+class TupleType(_Tagged):
+    __slots__ = ("types",)
+    tag = "TupleType"
+
+
+class MappingType(_Tagged):
+    __slots__ = ("key_type", "val_type")
+    tag = "MappingType"
+
+
+##### DEFINITIONS #####
+class StorageDef(_Plain):
+    __slots__ = ("name", "type", "decorator")
+
+
+class ConstantDef(_Plain):
+    __slots__ = ("name", "type", "value")
+
+
+class StructDef(_Plain):
+    __slots__ = ("name", "members")
+
+
+class StructMember(_Plain):
+    __slots__ = ("name", "type")
+
+
+class InterfaceDef(_Plain):
+    __slots__ = ("name", "functions")
+
+
+class InterfaceFunction(_Plain):
+    __slots__ = ("name", "parameters", "returns", "mutability")
+
+
+class EventDef(_Plain):
+    __slots__ = ("name", "members")
+
+
+class EventMember(_Plain):
+    __slots__ = ("name", "indexed", "type")
+
+
+class FunctionDef(_Plain):
+    __slots__ = ("name", "parameters", "returns", "decorators", "doc", "body")
+
+
+class Decorator(_Tagged):
+    __slots__ = ("name", "arguments")
+    tag = "decorator"
+
+
+class Parameter(_Tagged):
+    __slots__ = ("name", "type", "default_value")
+    tag = "parameter"
+
+
+##### STATEMENTS #####
+class Allocate(_Tagged):
+    __slots__ = ("name", "type", "initial_value")
+    tag = "allocate"
+
+
+class Assign(_Tagged):
+    __slots__ = ("target", "expr")
+    tag = "assign"
+
+
+class TargetTuple(Node):
+    """
+    Several targets of one assignment, e.g. `a, b = ...`
+    """
+
+    __slots__ = ("targets",)
+
+    def to_tuple(self):
+        return ("tuple", to_tuple(self.targets))
+
+
+class Break(Node):
+    __slots__ = ()
+
+    def to_tuple(self):
+        return ("break",)
+
+
+class Continue(Node):
+    __slots__ = ()
+
+    def to_tuple(self):
+        return ("continue",)
+
+
+class Assert(Node):
+    __slots__ = ("test", "message")
+
+    def to_tuple(self):
+        return ("assert", to_tuple(self.test), self.message)
+
+
+class Raise(Node):
+    __slots__ = ("message",)
+
+    def to_tuple(self):
+        return ("raise", self.message)
+
+
+class Return(Node):
+    __slots__ = ("value",)
+
+    def to_tuple(self):
+        return ("return", to_tuple(self.value))
+
+
+class Log(_Tagged):
+    __slots__ = ("type", "args")
+    tag = "log"
+
+
+class For(_Tagged):
+    __slots__ = ("iter_var", "iter", "body")
+    tag = "for"
+
+
+class If(Node):
+    """
+    `branches` are the `(test, body)` of the if and every elif,
+    and `orelse` is the body of the else (or None)
+    """
+
+    __slots__ = ("branches", "orelse")
+
+    def to_tuple(self):
+        orelse = None if self.orelse is None else (None, to_tuple(self.orelse))
+        return ("if", to_tuple(self.branches) + [orelse])
+
+
+##### EXPRESSIONS #####
+class BinOp(Node):
+    """
+    e.g. `op` is "+" for `a + b`, or "+=" for the expression of `a += b`
+    """
+
+    __slots__ = ("op", "left", "right")
+
+    def to_tuple(self):
+        return (self.op, to_tuple(self.left), to_tuple(self.right))
+
+
+class UnaryOp(Node):
+    __slots__ = ("op", "operand")
+
+    def to_tuple(self):
+        return (self.op, to_tuple(self.operand))
+
+
+class Dict(_Tagged):
+    __slots__ = ("keys", "values")
+    tag = "dict"
+
+
+class List(_Tagged):
+    __slots__ = ("values",)
+    tag = "list"
+
+
+class Tuple(_Tagged):
+    __slots__ = ("values",)
+    tag = "tuple"
+
+
+class Call(_Tagged):
+    __slots__ = ("target", "args")
+    tag = "call"
+
+
+class Argument(_Plain):
+    __slots__ = ("name", "value")
+
+
+class GetAttr(_Tagged):
+    __slots__ = ("target", "attribute")
+    tag = "getattr"
+
+
+class GetItem(_Tagged):
+    __slots__ = ("target", "index")
+    tag = "getitem"
+
+
+# Operators are tagged by their (lowercased) source text
+BINARY_OPS = {
+    "+",
+    "-",
+    "*",
+    "/",
+    "**",
+    "%",
+    "and",
+    "or",
+    "xor",
+    "<<",
+    ">>",
+    "<",
+    "<=",
+    ">",
+    ">=",
+    "==",
+    "!=",
+    "in",
+    "+=",
+    "-=",
+    "*=",
+    "/=",
+    "**=",
+    "%=",
+}
+UNARY_OPS = {"u-", "unot"}
+
+
+##### CONVERSION FROM parse() OUTPUT #####
+# Each converter takes the parse.Spans of the output being converted by
+# from_tuple(), or None
+
+
+def _at(node, value, spans):
+    """
+    Give `node` the span of the `value` it was converted from
+    """
+    if spans is not None and isinstance(node, Node):
+        node.span = spans.get(value, node.span)
+    return node
+
+
+def _with_span(convert):
+    @wraps(convert)
+    def converted(value, spans):
+        return _at(convert(value, spans), value, spans)
+
+    return converted
+
+
+def _list(convert, values, spans):
+    return None if values is None else [convert(v, spans) for v in values]
+
+
+@_with_span
+def _type(t, spans):
+    kind, value = t
+    if kind == "BaseType":
+        return BaseType(value)
+    elif kind == "ArrayType":
+        return ArrayType(_type(value["type"], spans), value["size"])
+    elif kind == "TupleType":
+        return TupleType(_list(_type, value["types"], spans))
+    elif kind == "MappingType":
+        return MappingType(
+            _type(value["key_type"], spans), _type(value["val_type"], spans)
+        )
+    raise ValueError(f"Not a type: {t!r}")
+
+
+@_with_span
+def _expr(e, spans):
+    if not isinstance(e, tuple):
+        return e  # Name or literal
+
+    kind = e[0]
+    if kind in BINARY_OPS:
+        return BinOp(kind, _expr(e[1], spans), _expr(e[2], spans))
+    elif kind in UNARY_OPS:
+        return UnaryOp(kind, _expr(e[1], spans))
+
+    value = e[1]
+    if kind == "getattr":
+        return GetAttr(_expr(value["target"], spans), value["attribute"])
+    elif kind == "getitem":
+        return GetItem(_expr(value["target"], spans), _expr(value["index"], spans))
+    elif kind == "call":
+        return Call(
+            _expr(value["target"], spans), _list(_argument, value["args"], spans)
+        )
+    elif kind == "dict":
+        return Dict(list(value["keys"]), _list(_expr, value["values"], spans))
+    elif kind == "list":
+        return List(_list(_expr, value["values"], spans))
+    elif kind == "tuple":
+        return Tuple(_list(_expr, value["values"], spans))
+    raise ValueError(f"Not an expression: {e!r}")
+
+
+@_with_span
+def _argument(a, spans):
+    return Argument(a["name"], _expr(a["value"], spans))
+
+
+@_with_span
+def _target(t, spans):
+    if isinstance(t, tuple) and t[0] == "tuple" and isinstance(t[1], list):
+        return TargetTuple(_list(_expr, t[1], spans))
+    return _expr(t, spans)
+
+
+def _body(body, spans):
+    return _list(_stmt, body, spans)
+
+
+@_with_span
+def _stmt(s, spans):
+    kind = s[0]
+    if kind == "allocate":
+        value = s[1]
+        return Allocate(
+            value["name"],
+            _type(value["type"], spans),
+            _expr(value["initial_value"], spans),
+        )
+    elif kind == "assign":
+        return Assign(_target(s[1]["target"], spans), _expr(s[1]["expr"], spans))
+    elif kind == "break":
+        return Break()
+    elif kind == "continue":
+        return Continue()
+    elif kind == "assert":
+        return Assert(_expr(s[1], spans), s[2])
+    elif kind == "raise":
+        return Raise(s[1])
+    elif kind == "return":
+        return Return(_expr(s[1], spans))
+    elif kind == "log":
+        return Log(s[1]["type"], _expr(s[1]["args"], spans))
+    elif kind == "for":
+        value = s[1]
+        return For(
+            value["iter_var"], _expr(value["iter"], spans), _body(value["body"], spans)
+        )
+    elif kind == "if":
+        *branches, orelse = s[1]
+        return If(
+            [(_expr(test, spans), _body(body, spans)) for test, body in branches],
+            None if orelse is None else _body(orelse[1], spans),
+        )
+    return _expr(s, spans)  # Expression statement
+
+
+@_with_span
+def _parameter(p, spans):
+    value = p[1]
+    return Parameter(value["name"], _type(value["type"], spans), value["default_value"])
+
+
+def _returns(t, spans):
+    return None if t is None else _type(t, spans)
+
+
+@_with_span
+def _decorator(d, spans):
+    return Decorator(d[1]["name"], d[1]["arguments"])
+
+
+@_with_span
+def _function(f, spans):
+    return FunctionDef(
+        f["name"],
+        _list(_parameter, f["parameters"], spans),
+        _returns(f["returns"], spans),
+        _list(_decorator, f["decorators"], spans),
+        f["doc"],
+        _body(f["body"], spans),
+    )
+
+
+@_with_span
+def _interface_function(f, spans):
+    return InterfaceFunction(
+        f["name"],
+        _list(_parameter, f["parameters"], spans),
+        _returns(f["returns"], spans),
+        f["mutability"],
+    )
+
+
+@_with_span
+def _interface(i, spans):
+    return InterfaceDef(i["name"], _list(_interface_function, i["functions"], spans))
+
+
+@_with_span
+def _import(i, spans):
+    return Import(i["path"], i["alias"])
+
+
+@_with_span
+def _struct_member(x, spans):
+    return StructMember(x["name"], _type(x["type"], spans))
+
+
+@_with_span
+def _struct(s, spans):
+    return StructDef(s["name"], _list(_struct_member, s["members"], spans))
+
+
+@_with_span
+def _event_member(x, spans):
+    return EventMember(x["name"], x["indexed"], _type(x["type"], spans))
+
+
+@_with_span
+def _event(e, spans):
+    return EventDef(e["name"], _list(_event_member, e["members"], spans))
+
+
+@_with_span
+def _storage(s, spans):
+    return StorageDef(s["name"], _type(s["type"], spans), s["decorator"])
+
+
+@_with_span
+def _constant(c, spans):
+    return ConstantDef(c["name"], _type(c["type"], spans), _expr(c["value"], spans))
+
+
+def from_tuple(module, spans=None):
+    """
+    Convert the `("Module", {...})` returned by parse() into a Module node.
+    Given the parse.Spans of it, nodes get their `span` from there.
+    """
+    return _module(module, spans)
+
+
+@_with_span
+def _module(module, spans):
+    kind, m = module
+    assert kind == "Module"
+    return Module(
+        m["doc"],
+        _list(_import, m["imports"], spans),
+        _list(_interface, m["interface_defs"], spans),
+        _list(_struct, m["struct_defs"], spans),
+        _list(_event, m["event_defs"], spans),
+        _list(_storage, m["storage_defs"], spans),
+        _list(_constant, m["constant_defs"], spans),
+        _list(_function, m["function_defs"], spans),
+    )
@@ -1,628 +1,428 @@
-from itertools import tee
-
-from sly import Parser as _Parser
-
-from lex import VyperLexer, tokenize
-
-
-class _VyperParser(_Parser):
-
-    # Uncomment if you want to see the parse table
-    debugfile = "parser.out"
+import os
+import re
+import threading
+from bisect import bisect_left
+from collections.abc import Sequence
+from itertools import chain, takewhile, tee
+
+from lex import LineIndex, VyperLexer, VyperToken, postprocess, tokenize
+from metrics import PipelineMetrics
+
+# Where the compiled LALR tables are kept between processes.
+# Set VYPER_GRAMMAR_CACHE to an empty string to disable the cache entirely.
+TABLE_CACHE_DIR = os.environ.get(
+    "VYPER_GRAMMAR_CACHE",
+    os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "vyper-grammar",
+    ),
+)
+
+# The parser and its table cache are in grammar.py, which is only imported
+# when a parser is first needed, so importing this module stays cheap
+_GRAMMAR_NAMES = {
+    "_VyperParser",
+    "TABLE_FORMAT_VERSION",
+    "grammar_fingerprint",
+    "_load_tables",
+    "_save_tables",
+}
+
+
+def __getattr__(name):
+    if name in _GRAMMAR_NAMES:
+        import grammar
+
+        return getattr(grammar, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _write_atomic(path, data):
+    """
+    Write `data` to `path` then rename it into place, so that concurrent
+    processes (or an interrupted one) never see a partial file. If writing
+    fails, the temporary file is removed and the error raised.
+    """
+    import tempfile
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ParseError(SyntaxError):
+    """
+    A SyntaxError at a token, with the source lines around it as its message.
+    The message is only rendered from the line index when it is first shown,
+    so collecting many of these is cheap.
+    """
 
-    def __init__(self, text):
+    def __init__(self, line_index, lineno, colno, index=None):
         super().__init__()
-        # Save this so we can do source code annotation
-        self._text = text
+        self.line_index = line_index
+        self.position = (lineno, colno)
+        self.index = index  # Of the token, in the text
+        self._message = None
 
-    def error(self, tok):
-        if tok:
-            lines = self._text.splitlines()
-            line_lens = [len(l) for l in lines]
+    def render(self):
+        """
+        Render the message now, and let go of the line index
+        """
+        if self._message is None:
+            lineno, colno = self.position
             linenos = list(
-                range(max(0, tok.lineno - 3), min(len(lines), tok.lineno + 3))
+                range(max(0, lineno - 3), min(len(self.line_index), lineno + 3))
             )
+            before = self.line_index.lines(linenos[0], lineno)
+            after = self.line_index.lines(lineno, linenos[-1])
             lines = (
-                [f"  {n}  {l}" for n, l in zip(linenos, lines[linenos[0] : tok.lineno])]
-                + ["-" * (5 + tok.colno) + "^"]
-                + [
-                    f"  {n}  {l}"
-                    for n, l in zip(
-                        linenos[tok.lineno - linenos[0] :],
-                        lines[tok.lineno : linenos[-1]],
-                    )
-                ]
+                [f"  {n}  {l}" for n, l in zip(linenos, before)]
+                + ["-" * (5 + colno) + "^"]
+                + [f"  {n}  {l}" for n, l in zip(linenos[lineno - linenos[0] :], after)]
             )
-            raise SyntaxError("\n\n" + "\n".join(lines)) from None
-        else:  # End of file
-            raise SyntaxError("Reached end of program, but expecting more tokens!")
-
-    # HACK: Cannot import these from constant in lex, for whatever reason
-    tokens = VyperLexer.tokens - {"TAB", "SPACE", "NEWLINE"}
-    literals = VyperLexer.literals
-
-    precedence = (
-        # These operations can be used in a series e.g. 1 + 2 + 3 + 4
-        # The evaluation order is left to right evaluation e.g. (...((a + b) + c) + ...
-        ("left", ADD, SUB),
-        ("left", MUL, DIV),  # Top-down is order of operations (lowest first)
-        ("left", AND, OR, XOR),
-        # These operations can be used in series e.g. not not not True
-        # The evaluation order is right to left evaluation e.g. -(-(-(a)))
-        ("right", USUB, NOT),
-        # Cannot use these operators multiple times in a row without parens
-        # e.g. 1 < 2 < 3 < ...
-        ("nonassoc", EQ, NE, LT, GT, LE, GE, IN),
-        ("nonassoc", SHL, SHR),  # Only nonassociative with those in it's group
-        ("nonassoc", POW, MOD),
-        ("nonassoc", AUGADD, AUGSUB, AUGMUL, AUGDIV, AUGPOW, AUGMOD),
-        ("nonassoc", DOT),
-    )
-
-    ##### TOP-LEVEL MODULE #####
-    start = "module"
-
-    @_("[ DOCSTR ] { module_stmt }")
-    def module(self, p):
-        module = {
-            "doc": p.DOCSTR,
-            "imports": list(),
-            "interface_defs": list(),
-            "struct_defs": list(),
-            "event_defs": list(),
-            "storage_defs": list(),
-            "constant_defs": list(),
-            "function_defs": list(),
-        }
-        for stmt in p.module_stmt:
-            # Stmt is either a (ClassName, dict) tuple
-            if isinstance(stmt, tuple):
-                k, v = stmt
-                module[k.lower().replace("def", "_def") + "s"].append(v)
-            # or list of those tuples
-            elif isinstance(stmt, list):
-                for k, v in stmt:
-                    module[k.lower().replace("def", "") + "s"].append(v)
-            else:
-                raise ValueError(f"Cannot accept: {stmt}")
-
-        return ("Module", module)
-
-    @_("import_stmt")
-    def module_stmt(self, p):
-        # Handle multiple imports
-        if isinstance(p.import_stmt, list):
-            return [("Import", stmt) for stmt in p.import_stmt]
-        else:
-            return [("Import", p.import_stmt)]
-
-    @_("interface_def")
-    @_("struct_def")
-    @_("event_def")
-    @_("storage_def")
-    @_("constant_def")
-    @_("function_def")
-    def module_stmt(self, p):
-        return p[0]
-
-    ##### IMPORTS #####
-    @_("IMPORT import_path [ import_alias ] ENDSTMT")
-    def import_stmt(self, p):
-        return {"path": p.import_path, "alias": p.import_alias}
-
-    @_("FROM import_from IMPORT MUL ENDSTMT")
-    def import_stmt(self, p):
-        return {"path": p.import_from + ["*"], "alias": None}
-
-    @_("FROM import_from IMPORT import_list ENDSTMT")
-    def import_stmt(self, p):
-        return [
-            {"path": p.import_from + [name], "alias": alias}
-            for name, alias in p.import_list
-        ]
-
-    @_("[ import_dots ] import_name")
-    def import_path(self, p):
-        return p.import_dots + p.import_name if p.import_dots else p.import_name
-
-    @_("import_dots")
-    def import_from(self, p):
-        return p.import_dots
-
-    @_("[ import_dots ] import_name")
-    def import_from(self, p):
-        return p.import_dots + p.import_name if p.import_dots else p.import_name
-
-    @_("DOT { DOT }")
-    def import_dots(self, p):
-        levels = len([p.DOT0] + p.DOT1)
-        return [".."] * (levels - 1) if levels > 1 else ["."]
-
-    @_("NAME { DOT NAME }")
-    def import_name(self, p):
-        return [p.NAME0] + p.NAME1
-
-    @_('import_item { "," import_item }')
-    @_('"(" import_item { "," import_item } [ "," ] ")"')
-    def import_list(self, p):
-        return [p.import_item0] + p.import_item1
-
-    @_("NAME [ import_alias ]")
-    def import_item(self, p):
-        return (p.NAME, p.import_alias)
-
-    @_("AS NAME")
-    def import_alias(self, p):
-        return p.NAME
-
-    ##### TYPE DEFINITIONS #####
-    @_("base_type")
-    @_("array_type")
-    @_("tuple_type")
-    @_("mapping_type")
-    def type(self, p):
-        return p[0]
-
-    # Base Types
-    @_("NAME")
-    def base_type(self, p):
-        return ("BaseType", p.NAME)
-
-    # Array definitions
-    @_('type "[" DEC_NUM "]"')
-    def array_type(self, p):
-        return ("ArrayType", {"type": p.type, "size": p.DEC_NUM, "len": p.DEC_NUM})
-
-    @_('type "[" NAME "]"')
-    def array_type(self, p):
-        return ("ArrayType", {"type": p.type, "size": p.NAME, "len": p.NAME})
-
-    # Tuple definitions
-    @_('"(" "," ")"')
-    def tuple_type(self, p):
-        return ("TupleType", {"types": list()})
-
-    @_('"(" type "," ")"')
-    def tuple_type(self, p):
-        return ("TupleType", {"types": [p.type]})
-
-    @_('"(" tuple_members [ "," ] ")"')
-    def tuple_type(self, p):
-        return ("TupleType", {"types": p.tuple_members})
-
-    @_('type "," type')
-    def tuple_members(self, p):
-        return [p.type0, p.type1]
-
-    @_('tuple_members "," type')
-    def tuple_members(self, p):
-        return p.tuple_members + [p.type]
-
-    # Mapping definitions
-    @_('NAME "[" base_type "," base_type "]"')
-    @_('NAME "[" base_type "," array_type "]"')
-    @_('NAME "[" base_type "," mapping_type "]"')
-    def mapping_type(self, p):
-        assert p.NAME == "HashMap"
-        return ("MappingType", {"key_type": p[2], "val_type": p[4]})
-
-    ##### VARIABLE DEFINITIONS #####
-    @_('NAME ":" type ENDSTMT')
-    def storage_def(self, p):
-        return ("StorageDef", {"name": p.NAME, "type": p.type, "decorator": None})
-
-    # TODO Change to an actual decorator
-    @_('NAME ":" NAME "(" type ")" ENDSTMT')
-    def storage_def(self, p):
-        return ("StorageDef", {"name": p.NAME0, "type": p.type, "decorator": p.NAME1})
-
-    ##### CONSTANT DEFINITIONS #####
-    # TODO Change to an actual decorator
-    @_('NAME ":" NAME "(" type ")" "=" expr ENDSTMT')
-    def constant_def(self, p):
-        assert p.NAME1 == "constant"
-        return ("ConstantDef", {"name": p.NAME0, "type": p.type, "value": p.expr})
-
-    ##### STRUCT DEFINITIONS #####
-    @_(
-        """
-    STRUCT NAME ":"
-    INDENT
-        NAME ":" type ENDSTMT
-      { NAME ":" type ENDSTMT }
-    DEDENT
-    ENDSTMT
-    """
-    )
-    def struct_def(self, p):
-        return (
-            "StructDef",
-            {
-                "name": p.NAME0,
-                "members": [
-                    {"name": n, "type": t}
-                    for n, t in zip([p.NAME1] + p.NAME2, [p.type0] + p.type1)
-                ],
-            },
-        )
+            self._message = "\n\n" + "\n".join(lines)
+            self.line_index = None
+        return self._message
 
-    @_(
-        """
-    STRUCT NAME ":"
-    INDENT
-        PASS ENDSTMT
-    DEDENT
-    ENDSTMT
+    # Shown by tracebacks
+    msg = property(render)
+
+    def __str__(self):
+        return self.render()
+
+    def __reduce__(self):
+        # e.g. from a process pool, where the line index can't go
+        return SyntaxError, (self.render(),)
+
+
+def _raw_token(token_type, value, index, lineno):
+    t = VyperToken()
+    t.type = token_type
+    t.value = value
+    t.index = index
+    t.lineno = lineno
+    return t
+
+
+class Spans:
     """
-    )
-    def struct_def(self, p):
-        return ("StructDef", {"name": p.NAME, "members": list()})
+    Where the nodes of an AST are in its source, as recorded by the parser:
+    a `(start_offset, end_offset)` for each. Lines and columns are only
+    worked out (from the LineIndex shared with the parse) when asked for.
 
-    ##### INTERFACE DEFINTIIONS #####
-    @_(
-        """
-    INTERFACE NAME ":"
-    INDENT
-        function_type ":" NAME ENDSTMT
-      { function_type ":" NAME ENDSTMT }
-    DEDENT
-    ENDSTMT
+        ast, spans = parse(text, spans=True)
+        function = ast[1]["function_defs"][0]
+        spans[function]  # (start_offset, end_offset)
+        spans.start(function), spans.end(function)  # (lineno, column)
+
+    Nodes are the tuples, dicts and lists of the AST, looked up by identity
+    (so not copies of them), or nodes.Node objects, which hold their span.
     """
-    )
-    def interface_def(self, p):
-        return (
-            "InterfaceDef",
-            {
-                "name": p.NAME0,
-                "functions": [
-                    {**f, "mutability": n}
-                    for f, n in zip(
-                        [p.function_type0] + p.function_type1, [p.NAME1] + p.NAME2
-                    )
-                ],
-            },
-        )
 
-    @_(
+    __slots__ = ("ast", "line_index", "_offsets")
+
+    def __init__(self, ast, line_index, offsets=None):
+        self.ast = ast  # Keeps the nodes alive, so that no other object has their id
+        self.line_index = line_index
+        self._offsets = {}
+        if offsets:
+            # Only keep the spans of what's in the AST
+            seen = set()
+            stack = [ast]
+            while stack:
+                value = stack.pop()
+                if id(value) in seen:
+                    continue
+                seen.add(id(value))
+                span = offsets.get(id(value))
+                if span is not None:
+                    self._offsets[id(value)] = span
+                for child in value.values() if isinstance(value, dict) else value:
+                    if isinstance(child, (tuple, list, dict)):
+                        stack.append(child)
+
+    def get(self, node, default=None):
+        span = self._offsets.get(id(node))
+        if span is None:
+            span = getattr(node, "span", None)
+        return default if span is None else span
+
+    def __getitem__(self, node):
+        span = self.get(node)
+        if span is None:
+            raise KeyError(f"No span for {node!r}")
+        return span
+
+    def __contains__(self, node):
+        return self.get(node) is not None
+
+    def start(self, node):
         """
-    INTERFACE NAME ":"
-    INDENT
-        PASS ENDSTMT
-    DEDENT
-    ENDSTMT
-    """
-    )
-    def interface_def(self, p):
-        return ("InterfaceDef", {"name": p.NAME, "functions": list()})
+        `(lineno, column)` of the start of `node`, counting lines from 1 and
+        columns from 0
+        """
+        return self.line_index.position(self[node][0])
 
-    ##### EVENT DEFITIONS #####
-    @_(
+    def end(self, node):
+        """
+        `(lineno, column)` just after the end of `node`
         """
-    EVENT NAME ":"
-    INDENT
-        event_member ENDSTMT
-      { event_member ENDSTMT }
-    DEDENT
-    ENDSTMT
+        return self.line_index.position(self[node][1])
+
+
+class LazyBody(Sequence):
     """
-    )
-    def event_def(self, p):
-        return (
-            "EventDef",
-            {"name": p.NAME, "members": [p.event_member0] + p.event_member1},
-        )
+    The statements of a function body, which are only lexed and parsed the
+    first time they are used. Behaves like the list that would have been
+    parsed, so a SyntaxError inside the body is raised then instead.
+    """
+
+    __slots__ = ("_text", "_line_index", "_start", "_end", "_body")
 
-    @_(
+    def __init__(self, text, line_index, start, end):
+        # `text[start:end]` is the body, from the newline after the ":"
+        self._text = text
+        self._line_index = line_index
+        self._start = start
+        self._end = end
+        self._body = None
+
+    @property
+    def parsed(self):
+        return self._body is not None
+
+    def force(self):
+        """
+        Parse the body (if it hasn't been yet) and return it as a list
         """
-    EVENT NAME ":"
-    INDENT
-        PASS ENDSTMT
-    DEDENT
-    ENDSTMT
+        if self._body is None:
+            text, start, end = self._text, self._start, self._end
+            lineno = _lineno(self._line_index, start)
+            lexer = VyperLexer(line_index=self._line_index)
+            tokens = takewhile(
+                lambda t: t.index < end, lexer.tokenize(text, lineno, start)
+            )
+            # The parser can only start from a module, so wrap the
+            # body in a function that has nothing else in it
+            header = [
+                _raw_token(token_type, value, start, lineno)
+                for token_type, value in (
+                    ("DEF", "def"),
+                    ("NAME", "_"),
+                    ("(", "("),
+                    (")", ")"),
+                    (":", ":"),
+                )
+            ]
+            tokens = postprocess(chain(header, tokens), self._line_index)
+            module = parse_tokens(tokens, text, self._line_index)
+            self._body = module[1]["function_defs"][0]["body"]
+        return self._body
+
+    def __getitem__(self, n):
+        return self.force()[n]
+
+    def __len__(self):
+        return len(self.force())
+
+    def __eq__(self, other):
+        if isinstance(other, LazyBody):
+            other = other.force()
+        return self.force() == other
+
+    def __repr__(self):
+        if self._body is None:
+            # `_start` is the newline ending the "def" line
+            lineno = _lineno(self._line_index, self._start + 1)
+            return f"LazyBody(<unparsed @ line {lineno}>)"
+        return f"LazyBody({self._body!r})"
+
+
+def _lineno(line_index, index):
+    # Line numbers start at 1, like the lexer's
+    return bisect_left(line_index.newlines, index) + 1
+
+
+# The next line that starts at column 0 ends a function body
+_TOP_LEVEL_LINE = re.compile(r"\n(?=[^\s#])")
+# Strings and comments, which may contain unbalanced brackets
+_STRINGS_AND_COMMENTS = re.compile(VyperLexer.STRING + r"|#.*")
+
+
+def _body_end(text, start):
     """
-    )
-    def event_def(self, p):
-        return ("EventDef", {"name": p.NAME, "members": list()})
-
-    @_('NAME ":" NAME "(" type ")"')
-    def event_member(self, p):
-        assert p.NAME1 == "indexed"
-        return {"name": p.NAME0, "indexed": True, "type": p.type}
-
-    @_('NAME ":" type')
-    def event_member(self, p):
-        return {"name": p.NAME, "indexed": False, "type": p.type}
-
-    ##### FUNCTION DEFINITIONS #####
-    @_('"@" NAME [ "(" arguments ")" ] ENDSTMT')
-    def decorator(self, p):
-        return ("decorator", {"name": p.NAME, "arguments": p.arguments})
-
-    @_('parameter { "," parameter }')
-    def parameters(self, p):
-        return [p.parameter0] + p.parameter1
-
-    @_('NAME ":" type [ "=" variable ]')
-    def parameter(self, p):
-        return (
-            "parameter",
-            {"name": p.NAME, "type": p.type, "default_value": p.variable,},
-        )
+    Find where the function body starting at `text[start]` (the newline
+    after the ":") ends, or return None if that isn't safe to do without
+    lexing it, e.g. when a multiline string or a bracket could continue
+    at column 0.
+    """
+    m = _TOP_LEVEL_LINE.search(text, start + 1)
+    end = m.start() + 1 if m else len(text)
+    body = text[start:end]
+    if '"""' in body or "'''" in body:
+        return None
+    if not body.strip():
+        return None  # Missing body, which the parser should complain about
+    code = _STRINGS_AND_COMMENTS.sub("", body)
+    opened = code.count("(") + code.count("[") + code.count("{")
+    closed = code.count(")") + code.count("]") + code.count("}")
+    return end if opened == closed else None
+
+
+def _skeleton_tokens(text, line_index):
+    """
+    Lex `text` like VyperLexer, except the body of every top-level function
+    is skipped over and replaced by a LAZY_BODY token holding a LazyBody.
+    """
+    lexer = VyperLexer(line_index=line_index)
+    index, lineno = 0, 1
+    while True:
+        line_start = True  # Is the next token the first on its line?
+        in_header = False  # Between a top-level DEF and its ":"
+        after_colon = False  # Only whitespace since the header's ":"
+        brackets = 0
+        for t in lexer.tokenize(text, lineno, index):
+            if after_colon and t.type == "NEWLINE":
+                end = _body_end(text, t.index)
+                if end is not None:
+                    lazy = _raw_token("LAZY_BODY", None, t.index, t.lineno)
+                    lazy.value = LazyBody(text, line_index, t.index, end)
+                    yield lazy
+                    # The body's last newline ends the function definition
+                    index, lineno = end, _lineno(line_index, end - 1)
+                    yield _raw_token("NEWLINE", "\n", end - 1, lineno)
+                    lineno += 1
+                    break
+
+            if t.type not in ("SPACE", "TAB"):
+                after_colon = False
+
+            if t.type == "NEWLINE":
+                line_start = True
+                yield t
+                continue
+            elif t.type == "DEF" and line_start and text[t.index - 1 : t.index] in "\n":
+                in_header = True  # Only at column 0, not e.g. in an interface
+            elif t.type in ("(", "[", "{"):
+                brackets += 1
+            elif t.type in (")", "]", "}"):
+                brackets -= 1
+            elif t.type == ":" and in_header and brackets == 0:
+                in_header = False
+                after_colon = True
+
+            if t.type not in ("SPACE", "TAB"):
+                line_start = False
+            yield t
 
-    @_("ARROW type")
-    def returns(self, p):
-        return p.type
-
-    @_('DEF NAME "(" [ parameters ] ")" [ returns ]')
-    def function_type(self, p):
-        return {"name": p.NAME, "parameters": p.parameters, "returns": p.returns}
-
-    @_('{ decorator } function_type ":" [ DOCSTR ] body')
-    def function_def(self, p):
-        function = p.function_type
-        function.update({"decorators": p.decorator, "doc": p.DOCSTR, "body": p.body})
-        return ("FunctionDef", function)
-
-    @_("INDENT stmt { stmt } DEDENT ENDSTMT")
-    def body(self, p):
-        # Bodies of multiline statements
-        return [p.stmt0] + p.stmt1
-
-    @_("INDENT PASS ENDSTMT DEDENT ENDSTMT")
-    def body(self, p):
-        # Bodies can either be a list of 1+ stmts, or PASS
-        return list()
-
-    ##### ASSIGNMENT STATEMENTS #####
-    @_('NAME ":" type "=" expr ENDSTMT')
-    def stmt(self, p):
-        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.expr})
-
-    # Object Creation Assignments
-    # Dict Object
-    @_('"{" NAME ":" expr { "," NAME ":" expr } "}"')
-    def dict(self, p):
-        return ("dict", {"keys": [p.NAME0] + p.NAME1, "values": [p.expr0] + p.expr1})
-
-    @_('"{" "}"')
-    def dict(self, p):
-        return ("dict", {"keys": list(), "values": list()})
-
-    @_('NAME ":" type "=" dict ENDSTMT')
-    def stmt(self, p):
-        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.dict})
-
-    # List Object
-    @_('"[" expr { "," expr } "]"')
-    def list(self, p):
-        return ("list", {"values": [p.expr0] + p.expr1})
-
-    @_('"[" "]"')
-    def list(self, p):
-        return ("list", {"values": list()})
-
-    @_('NAME ":" type "=" list ENDSTMT')
-    def stmt(self, p):
-        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.list})
-
-    # Tuple Object
-    @_('"(" expr { "," expr } "," ")"')
-    def tuple(self, p):
-        return ("tuple", {"values": [p.expr0] + p.expr1})
-
-    @_('"(" expr "," expr { "," expr } ")"')
-    def tuple(self, p):
-        return ("tuple", {"values": [p.expr0, p.expr1] + p.expr2})
-
-    @_('"(" "," ")"')
-    def tuple(self, p):
-        return ("tuple", {"values": list()})
-
-    @_('NAME ":" type "=" tuple ENDSTMT')
-    def stmt(self, p):
-        return ("allocate", {"name": p.NAME, "type": p.type, "initial_value": p.tuple})
-
-    # Allow multiple assignments (and skipping)
-    @_("variable")
-    @_("SKIP")
-    def target(self, p):
-        return getattr(p, "variable", None)
-
-    @_('target { "," target } = expr ENDSTMT')
-    def stmt(self, p):
-        if len(p.target1) > 0:
-            target = ("tuple", [p.target0] + p.target1)
         else:
-            target = p.target0
-        return ("assign", {"target": target, "expr": p.expr})
-
-    # Augmented Assignment
-    @_("variable AUGADD expr ENDSTMT")
-    @_("variable AUGSUB expr ENDSTMT")
-    @_("variable AUGMUL expr ENDSTMT")
-    @_("variable AUGDIV expr ENDSTMT")
-    @_("variable AUGPOW expr ENDSTMT")
-    @_("variable AUGMOD expr ENDSTMT")
-    def stmt(self, p):
-        expr = (p[1].lower(), p.variable, p.expr)
-        # Re-arrange to Assign from BinOp
-        return ("assign", {"target": p.variable, "expr": expr})
-
-    ##### NON-ASSIGNMENT STATEMENTS #####
-    @_("expr ENDSTMT")
-    def stmt(self, p):
-        return p.expr
-
-    @_("BREAK ENDSTMT")
-    def stmt(self, p):
-        return ("break",)
-
-    @_("CONTINUE ENDSTMT")
-    def stmt(self, p):
-        return ("continue",)
-
-    @_('ASSERT expr [ "," STRING ] ENDSTMT')
-    def stmt(self, p):
-        return ("assert", p.expr, p.STRING)
-
-    @_('ASSERT expr "," UNREACHABLE ENDSTMT')
-    def stmt(self, p):
-        return ("assert", p.expr, "unreachable")
-
-    @_("RAISE [ STRING ] ENDSTMT")
-    def stmt(self, p):
-        return ("raise", p.STRING)
-
-    @_("RAISE UNREACHABLE ENDSTMT")
-    def stmt(self, p):
-        return ("raise", "unreachable")
-
-    @_("RETURN [ expr ] ENDSTMT")
-    def stmt(self, p):
-        return ("return", p.expr)
-
-    @_('LOG NAME "(" dict ")" ENDSTMT')
-    def stmt(self, p):
-        return ("log", {"type": p.NAME, "args": p.dict})
-
-    ##### MULTILINE STATEMENTS #####
-    @_('FOR NAME IN expr ":" body')
-    def stmt(self, p):
-        return ("for", {"iter_var": p.NAME, "iter": p.expr, "body": p.body})
-
-    @_('IF expr ":" body elif_list [ else_clause ]')
-    def stmt(self, p):
-        return ("if", [(p.expr, p.body)] + p.elif_list + [p.else_clause])
-
-    @_('{ ELIF expr ":" body }')
-    def elif_list(self, p):
-        return list(zip(p.expr, p.body))
-
-    @_('ELSE ":" body')
-    def else_clause(self, p):
-        return (None, p.body)
-
-    ##### EXPRESSIONS #####
-
-    # Binary Operations
-    # Mathematical operations
-    @_("expr ADD expr")
-    @_("expr SUB expr")
-    @_("expr MUL expr")
-    @_("expr DIV expr")
-    @_("expr POW expr")
-    @_("expr MOD expr")
-    # Logical Operations
-    @_("expr AND expr")
-    @_("expr OR expr")
-    @_("expr XOR expr")
-    @_("expr SHL expr")
-    @_("expr SHR expr")
-    # Comparisons
-    @_("expr LT expr")
-    @_("expr LE expr")
-    @_("expr GT expr")
-    @_("expr GE expr")
-    @_("expr EQ expr")
-    @_("expr NE expr")
-    @_("expr IN expr")
-    def expr(self, p):
-        return (p[1].lower(), p.expr0, p.expr1)
-
-    # Unary Operations
-    @_("SUB expr %prec USUB")
-    @_("NOT expr")
-    def expr(self, p):
-        op = "u" + p[0].lower()
-        return (op, p.expr)
-
-    # Ensure wrapping in parens doesn't do anything
-    @_('"(" expr ")"')
-    def expr(self, p):
-        return p.expr
-
-    # Endpoint of an expression
-    @_("literal")
-    @_("variable")
-    def expr(self, p):
-        return p[0]
-
-    ##### VARIABLES ####
-    # Just ensure parenthesis don't do anything
-    @_('"(" variable ")"')
-    def variable(self, p):
-        return self.variable
-
-    # Make a Call
-    @_('variable "(" [ arguments ] ")"')
-    def variable(self, p):
-        return ("call", {"target": p.variable, "args": p.arguments})
-
-    # Call arguments
-    @_('argument { "," argument }')
-    def arguments(self, p):
-        return [p.argument0] + p.argument1
-
-    # Keyword arguments
-    @_('[ NAME "=" ] expr')
-    def argument(self, p):
-        return {"name": p.NAME, "value": p.expr}
-
-    # Get attribute
-    @_("variable DOT NAME")
-    def variable(self, p):
-        return ("getattr", {"target": self.variable, "attribute": self.NAME})
-
-    # Get item
-    @_('variable "[" expr "]"')
-    def variable(self, p):
-        return self.variable[self.expr]
-
-    # Endpoint for variable
-    @_("NAME")
-    def variable(self, p):
-        return p.NAME
-
-    ##### LITERALS #####
-    @_("number")
-    @_("string")
-    @_("bool")
-    def literal(self, p):
-        return p[0]
-
-    @_("DEC_NUM")
-    def number(self, p):
-        return int(p.DEC_NUM)
-
-    @_("HEX_NUM")
-    def number(self, p):
-        return int(p.HEX_NUM, 16)
-
-    @_("OCT_NUM")
-    def number(self, p):
-        return int(p.OCT_NUM, 8)
-
-    @_("BIN_NUM")
-    def number(self, p):
-        return int(p.BIN_NUM, 2)
-
-    @_("FLOAT")
-    def number(self, p):
-        return float(p.FLOAT)
-
-    @_("STRING")
-    def string(self, p):
-        return p[0]
-
-    @_("BOOL")
-    def bool(self, p):
-        return bool(p.BOOL)
-
-
-def parse(text, display_tokens=False):
-    tokens = tokenize(text)
+            return  # Lexed to the end of the text
+
+
+def tokenize_skeleton(text, line_index=None):
+    """
+    Same as tokenize(text), except the body of every top-level function is
+    a single LAZY_BODY token, which the parser returns as a LazyBody
+    """
+    if line_index is None:
+        line_index = LineIndex(text)
+    return postprocess(_skeleton_tokens(text, line_index), line_index)
+
+
+# Parsers that are free to use, per thread
+_parsers = threading.local()
+
+
+def parse_tokens(tokens, text, line_index=None, offsets=None):
+    """
+    Parse tokens that were already produced by tokenize(text).
+    Re-uses this thread's parser, unless it's busy with an outer parse.
+    Given an `offsets` dict, the parser records spans in it (see Spans).
+    """
+    free = getattr(_parsers, "free", None)
+    if free is None:
+        free = _parsers.free = []
+    if free:
+        parser = free.pop()
+    else:
+        from grammar import _VyperParser
+
+        parser = _VyperParser()
+    try:
+        return parser.parse(iter(tokens), text, line_index, offsets)
+    finally:
+        free.append(parser)
+
+
+def parse(
+    text,
+    display_tokens=False,
+    buffer=False,
+    lazy=False,
+    instrument=False,
+    nodes=False,
+    spans=False,
+):
+    """
+    Parse a module. With `lazy=True`, function bodies are LazyBody objects
+    that are only parsed when they are first used.
+
+    With `nodes=True`, returns a nodes.Module instead of tuples and dicts
+    (which can't be combined with `lazy`, since converting parses every body).
+    Nor can `buffer`, as a TokenBuffer can't hold the tokens of lazy bodies.
+
+    With `instrument=True`, returns `(ast, metrics.PipelineMetrics)`, with
+    the tokens in and out and the time spent in each stage of tokenize()
+    and in the parser.
+
+    With `spans=True`, the parser also records where every node is in
+    `text`, and a Spans of them comes last in what's returned (e.g.
+    `(ast, spans)`). Nodes from `nodes=True` also hold their own `span`.
+    """
+    if lazy and nodes:
+        raise ValueError("Lazy bodies can't be converted to nodes")
+    if lazy and spans:
+        raise ValueError("Lazy bodies aren't parsed, so they have no spans")
+    if lazy and buffer:
+        raise ValueError("A TokenBuffer can't hold the tokens of lazy bodies")
+
+    metrics = PipelineMetrics() if instrument else None
+    line_index = LineIndex(text)
+    if lazy:
+        tokens = tokenize_skeleton(text, line_index)
+    else:
+        tokens = tokenize(text, line_index, buffer=buffer, metrics=metrics)
     if display_tokens:
         display, tokens = tee(tokens)
         print(list(display))
-    ast = _VyperParser(text).parse(tokens)
-    return ast
+    offsets = {} if spans else None
+    if metrics is None:
+        ast = parse_tokens(tokens, text, line_index, offsets)
+    else:
+        ast = metrics.measure_parser(
+            lambda tokens: parse_tokens(tokens, text, line_index, offsets), tokens
+        )
+    recorded = Spans(ast, line_index, offsets) if spans else None
+    if nodes:
+        from nodes import from_tuple
+
+        ast = from_tuple(ast, recorded)
+        if spans:
+            recorded = Spans(ast, line_index)  # The nodes hold their spans
+
+    result = [ast]
+    if metrics is not None:
+        result.append(metrics)
+    if recorded is not None:
+        result.append(recorded)
+    return ast if len(result) == 1 else tuple(result)
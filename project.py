@@ -0,0 +1,240 @@
+"""
+Incremental builds of a whole project: a manifest remembers every file's
+size, mtime and content hash, and its parse result is stored next to it,
+so later builds only parse the files that changed and the files that
+import them (directly or not).
+
+    project = Project("contracts")
+    result = project.build()  # BuildResult(parsed=[...], unchanged=[...], ...)
+    project.ast("tokens/erc20.vy")  # ("Module", {...})
+
+The manifest and parse results are kept in `<root>/.vyparse` by default.
+"""
+import json
+import os
+import time
+from collections import namedtuple
+
+import serialize
+from batch import parse_many
+from cache import grammar_version, source_key
+from deps import EXTENSIONS, resolve_import
+from parse import _write_atomic, parse
+
+# Bump this whenever the layout of the manifest changes
+MANIFEST_FORMAT_VERSION = 1
+
+# Files changed this close to a build may change again without their mtime
+# (at the filesystem's resolution) or size changing, so their hash is
+# always checked on the next build
+RACY_NS = 2 * 10 ** 9
+
+BuildResult = namedtuple("BuildResult", "parsed unchanged removed errors")
+
+
+class Project:
+    """
+    The parse results of every .vy/.vyi file under `root`, brought up to
+    date by `build()`. `directory` holds the manifest and the results.
+    """
+
+    def __init__(self, root, directory=None):
+        self.root = os.fspath(root)
+        if directory is None:
+            directory = os.path.join(self.root, ".vyparse")
+        self.directory = os.fspath(directory)
+        self._files = None  # The manifest's entries, once loaded
+
+    @property
+    def manifest_path(self):
+        return os.path.join(self.directory, "manifest.json")
+
+    def build(self, workers=1):
+        """
+        Parse the files that changed since the last build, and the files
+        that import them, on `workers` processes (None for one per CPU).
+        Returns a BuildResult of the paths (relative to `root`) that were
+        parsed, unchanged or removed, and `{path: error}` (usually a
+        SyntaxError) for the files that failed to parse, which are tried
+        again on every build.
+        """
+        started = time.time_ns()
+        old = self._load_manifest()  # Another process may have built since
+        files = {}  # Path to its manifest entry, for the files still there
+        changed = {}  # Path to text, for the files that need parsing
+        for path, st in self._stat_files():
+            entry = old.get(path)
+            if entry is not None and (st.st_mtime_ns, st.st_size) == (
+                entry["mtime_ns"],
+                entry["size"],
+            ):
+                files[path] = dict(entry)
+                continue
+
+            with open(os.path.join(self.root, path), encoding="utf-8") as f:
+                text = f.read()
+            key = source_key(text)
+            mtime_ns = st.st_mtime_ns if st.st_mtime_ns + RACY_NS < started else None
+            stat = {"mtime_ns": mtime_ns, "size": st.st_size, "hash": key}
+            if entry is not None and entry["hash"] == key:
+                files[path] = dict(entry, **stat)  # Touched, but the same
+            else:
+                files[path] = stat
+                changed[path] = text
+        removed = sorted(old.keys() - files.keys())
+
+        # Imports may resolve to different files when files come and go
+        if old.keys() != files.keys():
+            for path, entry in files.items():
+                if path not in changed:
+                    entry["dependencies"] = self._resolve(path, entry["imports"])
+
+        # Files importing a changed one are parsed again, too
+        dirty = _with_importers(files, changed.keys() | set(removed))
+        texts = dict(changed)
+        for path in dirty - changed.keys():
+            with open(os.path.join(self.root, path), encoding="utf-8") as f:
+                texts[path] = f.read()
+
+        parsed, errors = [], {}
+        for path, ast, error in self._parse(texts, workers):
+            if error is not None:
+                del files[path]  # Not in the manifest, so it's tried again
+                errors[path] = error
+                continue
+            imports = [stmt["path"] for stmt in ast[1]["imports"]]
+            files[path]["imports"] = imports
+            files[path]["dependencies"] = self._resolve(path, imports)
+            self._save_ast(files[path]["hash"], ast)
+            parsed.append(path)
+
+        unchanged = sorted(files.keys() - set(parsed))
+        if files != old:
+            self._save_manifest(files)
+        self._files = files
+        self._remove_unused(old, files)
+        return BuildResult(sorted(parsed), unchanged, removed, errors)
+
+    def ast(self, path, lazy=False):
+        """
+        The parse result of `path` (relative to `root`) from the last build,
+        or a serialize.load_lazy() view of it if `lazy`
+        """
+        entry = self._manifest().get(os.path.normpath(path))
+        if entry is None:
+            raise KeyError(path)
+        with open(self._ast_path(entry["hash"]), "rb") as f:
+            data = f.read()
+        return serialize.load_lazy(data) if lazy else serialize.loads(data)
+
+    def _stat_files(self):
+        """
+        Yield `(path, os.stat_result)` of every source file under `root`
+        """
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.path != self.directory and not entry.name.startswith("."):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(EXTENSIONS):
+                        yield os.path.relpath(entry.path, self.root), entry.stat()
+
+    def _resolve(self, path, imports):
+        dependencies = []
+        for import_path in imports:
+            dependency = resolve_import(import_path, path, self.root)
+            if dependency is not None and dependency not in dependencies:
+                dependencies.append(dependency)
+        return dependencies
+
+    def _parse(self, texts, workers):
+        """
+        Yield `(path, ast, error)` for each of `texts`
+        """
+        paths = sorted(texts)
+        if workers == 1 or len(paths) < 2:
+            for path in paths:
+                try:
+                    ast = parse(texts[path])
+                except Exception as e:
+                    # As parse_many() reports them, whatever the number of workers
+                    yield path, None, e
+                else:
+                    yield path, ast, None
+        else:
+            sources = (texts[path] for path in paths)
+            for n, ast, error in parse_many(sources, workers):
+                yield paths[n], ast, error
+
+    def _manifest(self):
+        if self._files is None:
+            self._files = self._load_manifest()
+        return self._files
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path) as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}  # Missing or corrupted, so build everything
+        if manifest.get("format") != MANIFEST_FORMAT_VERSION:
+            return {}
+        if manifest.get("grammar") != grammar_version():
+            return {}  # Every result could be different
+        return manifest["files"]
+
+    def _save_manifest(self, files):
+        manifest = {
+            "format": MANIFEST_FORMAT_VERSION,
+            "grammar": grammar_version(),
+            "files": files,
+        }
+        _write_atomic(self.manifest_path, json.dumps(manifest).encode())
+
+    def _ast_path(self, key):
+        return os.path.join(self.directory, "ast", key[:2], f"{key}.ast")
+
+    def _save_ast(self, key, ast):
+        path = self._ast_path(key)
+        if not os.path.exists(path):  # Files with the same text share one
+            _write_atomic(path, serialize.dumps(ast))
+
+    def _remove_unused(self, old, files):
+        """
+        Remove the results of the files that changed or were removed,
+        unless another file still has the same text
+        """
+        used = {entry["hash"] for entry in files.values()}
+        for entry in old.values():
+            if entry["hash"] not in used:
+                try:
+                    os.remove(self._ast_path(entry["hash"]))
+                except OSError:
+                    pass
+
+
+def _with_importers(files, paths):
+    """
+    `paths` and every file in `files` that imports one of them, directly
+    or through other files
+    """
+    importers = {}
+    for path, entry in files.items():
+        for dependency in entry.get("dependencies", ()):
+            importers.setdefault(dependency, []).append(path)
+
+    found = set(paths)
+    stack = list(paths)
+    while stack:
+        for importer in importers.get(stack.pop(), ()):
+            if importer not in found:
+                found.add(importer)
+                stack.append(importer)
+    return found & files.keys()
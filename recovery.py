@@ -0,0 +1,107 @@
+"""
+Parse a module collecting every syntax error, instead of stopping at the
+first one: after an error, parsing carries on at the next top-level
+statement.
+
+    ast, errors = parse_recovering(text)
+    ast  # ("Module", {...}) of every top-level statement that parsed
+    for error in errors:
+        print(error)  # Each message is only rendered here
+"""
+from incremental import _join
+from lex import LineIndex, VyperLexer, postprocess
+from parse import ParseError, _lineno, _raw_token, parse_tokens
+
+# A token at column 0 that always starts a new top-level statement, even
+# if the one before it left a bracket open
+_STATEMENT_STARTS = {"DEF", "@", "STRUCT", "EVENT", "INTERFACE", "IMPORT", "FROM"}
+
+
+def _raw_tokens(text, line_index, errors):
+    """
+    VyperLexer's tokens, except that after a lexing error the rest of that
+    line is skipped, leaving an ERROR token in its place
+    """
+    index, lineno = 0, 1
+    while True:
+        lexer = VyperLexer(line_index=line_index)
+        try:
+            yield from lexer.tokenize(text, lineno, index)
+            return
+        except SyntaxError as e:
+            errors.append((_lineno(line_index, lexer.index), e))
+
+        yield _raw_token("ERROR", None, lexer.index, _lineno(line_index, lexer.index))
+        index = text.find("\n", lexer.index)
+        if index < 0:
+            return
+        lineno = _lineno(line_index, index)
+
+
+def _statements(tokens):
+    """
+    Split raw tokens into the tokens of each top-level statement, keeping
+    decorators and a module docstring with the statement after them
+    """
+    statement = []
+    depth = 0  # Open brackets
+    line_start = column_0 = True
+    last_top = None  # The first token of the last line starting at column 0
+    for t in tokens:
+        if t.type == "NEWLINE":
+            line_start = column_0 = True
+        elif t.type in ("SPACE", "TAB"):
+            column_0 = False
+        elif line_start:
+            line_start = False
+            if column_0 and statement and last_top not in ("@", "DOCSTR"):
+                if t.type in _STATEMENT_STARTS:
+                    depth = 0
+                if depth == 0:
+                    yield statement
+                    statement = []
+            if column_0:
+                last_top = t.type
+
+        if t.type in ("(", "[", "{"):
+            depth += 1
+        elif t.type in (")", "]", "}"):
+            depth = max(depth - 1, 0)
+        elif t.type == "ERROR":
+            depth = 0  # Can't tell what the rest of the line would close
+        statement.append(t)
+
+    if statement:
+        yield statement
+
+
+def parse_recovering(text):
+    """
+    Parse a module, carrying on at the next top-level statement after any
+    syntax error. Returns `(ast, errors)`: a Module of the statements that
+    parsed (the same as parse(text) if there were no errors), and the
+    SyntaxErrors in source order.
+    """
+    line_index = LineIndex(text)
+    errors = []  # (line number, error)
+    statements = []
+    for tokens in _statements(_raw_tokens(text, line_index, errors)):
+        if any(t.type == "ERROR" for t in tokens):
+            continue  # Already reported by the lexer
+
+        try:
+            module = parse_tokens(postprocess(tokens, line_index), text, line_index)
+        except ParseError as e:
+            errors.append((e.position[0], e))
+        except SyntaxError as e:  # From post-processing, or the end of input
+            errors.append((tokens[-1].lineno, e))
+        except AssertionError as e:  # A token stream post-processing can't handle
+            lineno = tokens[0].lineno
+            error = SyntaxError(f"Invalid syntax @ line {lineno}")
+            error.__cause__ = e
+            errors.append((lineno, error))
+        else:
+            statements.append((None, None, module[1]))
+
+    errors.sort(key=lambda error: error[0])
+    return _join(statements), [e for _, e in errors]
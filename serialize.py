@@ -0,0 +1,327 @@
+"""
+A compact binary encoding of parse() results, for storing them and sending
+them between services.
+
+    data = dumps(ast)
+    loads(data) == ast
+
+    module = load_lazy(data)  # Only decodes what is used
+    names = [f["name"] for f in module[1]["function_defs"]]
+
+The encoding starts with a header: MAGIC, the format version and the
+grammar version (see cache.grammar_version), which must match to decode.
+Then comes a table of every distinct string, and then the AST, where each
+value is a varint tag followed by:
+
+    None, False, True   nothing
+    int                 zigzag varint
+    float               8 bytes, little-endian double
+    str                 varint index into the string table
+    list, tuple         varint count, varint size in bytes, the items
+    dict                varint count, varint size in bytes, then a string
+                        table index and a value for each item
+
+Containers carry their size, so the lazy loader can skip over the ones
+that aren't used.
+"""
+import struct
+from collections.abc import Mapping, Sequence
+
+from cache import grammar_version
+
+MAGIC = b"VYAST\0"
+
+# Bump this whenever the encoding changes
+FORMAT_VERSION = 1
+
+(
+    TAG_NONE,
+    TAG_FALSE,
+    TAG_TRUE,
+    TAG_INT,
+    TAG_FLOAT,
+    TAG_STR,
+    TAG_LIST,
+    TAG_TUPLE,
+    TAG_DICT,
+) = range(9)
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _varint(n, out):
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data, pos):
+    b = data[pos]
+    if b < 0x80:
+        return b, pos + 1
+    n, shift = 0, 0
+    while True:
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class _Encoder:
+    def __init__(self):
+        self.strings = {}
+
+    def string(self, s):
+        index = self.strings.get(s)
+        if index is None:
+            index = self.strings[s] = len(self.strings)
+        return index
+
+    def value(self, v, out):
+        # bool first, since it's also an int
+        if v is None:
+            out.append(TAG_NONE)
+        elif v is True:
+            out.append(TAG_TRUE)
+        elif v is False:
+            out.append(TAG_FALSE)
+        elif isinstance(v, str):
+            out.append(TAG_STR)
+            _varint(self.string(v), out)
+        elif isinstance(v, int):
+            out.append(TAG_INT)
+            _varint(v * 2 if v >= 0 else -v * 2 - 1, out)
+        elif isinstance(v, float):
+            out.append(TAG_FLOAT)
+            out += _DOUBLE.pack(v)
+        elif isinstance(v, (list, tuple)):
+            payload = bytearray()
+            for item in v:
+                self.value(item, payload)
+            tag = TAG_LIST if isinstance(v, list) else TAG_TUPLE
+            self.container(tag, len(v), payload, out)
+        elif isinstance(v, dict):
+            payload = bytearray()
+            for key, item in v.items():
+                _varint(self.string(key), payload)
+                self.value(item, payload)
+            self.container(TAG_DICT, len(v), payload, out)
+        else:
+            # e.g. a LazyBody, which should be forced first
+            raise TypeError(f"Can't encode {type(v).__name__}: {v!r}")
+
+    @staticmethod
+    def container(tag, count, payload, out):
+        out.append(tag)
+        _varint(count, out)
+        _varint(len(payload), out)
+        out += payload
+
+
+def dumps(ast):
+    """
+    Encode a parse() result as bytes
+    """
+    encoder = _Encoder()
+    body = bytearray()
+    encoder.value(ast, body)
+
+    out = bytearray(MAGIC)
+    _varint(FORMAT_VERSION, out)
+    out += bytes.fromhex(grammar_version())
+    _varint(len(encoder.strings), out)
+    for s in encoder.strings:
+        encoded = s.encode()
+        _varint(len(encoded), out)
+        out += encoded
+    out += body
+    return bytes(out)
+
+
+def _header(data):
+    """
+    Check the header, and return the string table and where the AST starts
+    """
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not an encoded parse result")
+    version, pos = _read_varint(data, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Encoded with format {version}, expected {FORMAT_VERSION}")
+    fingerprint = bytes(data[pos : pos + 32]).hex()
+    if fingerprint != grammar_version():
+        raise ValueError("Encoded by a different version of the grammar")
+    pos += 32
+
+    count, pos = _read_varint(data, pos)
+    strings = []
+    for _ in range(count):
+        size, pos = _read_varint(data, pos)
+        strings.append(str(data[pos : pos + size], "utf-8"))
+        pos += size
+    return strings, pos
+
+
+def _decode(data, pos, strings):
+    """
+    Decode the value at `pos`, returning it and the position after it
+    """
+    tag = data[pos]
+    pos += 1
+    if tag == TAG_STR:
+        index, pos = _read_varint(data, pos)
+        return strings[index], pos
+    elif tag == TAG_DICT:
+        count, pos = _read_varint(data, pos)
+        pos = _read_varint(data, pos)[1]  # Skip the size
+        d = {}
+        for _ in range(count):
+            index, pos = _read_varint(data, pos)
+            d[strings[index]], pos = _decode(data, pos, strings)
+        return d, pos
+    elif tag == TAG_LIST or tag == TAG_TUPLE:
+        count, pos = _read_varint(data, pos)
+        pos = _read_varint(data, pos)[1]
+        items = []
+        for _ in range(count):
+            item, pos = _decode(data, pos, strings)
+            items.append(item)
+        return (items if tag == TAG_LIST else tuple(items)), pos
+    elif tag == TAG_NONE:
+        return None, pos
+    elif tag == TAG_INT:
+        n, pos = _read_varint(data, pos)
+        return (n >> 1) ^ -(n & 1), pos
+    elif tag == TAG_TRUE:
+        return True, pos
+    elif tag == TAG_FALSE:
+        return False, pos
+    elif tag == TAG_FLOAT:
+        return _DOUBLE.unpack_from(data, pos)[0], pos + 8
+    raise ValueError(f"Unknown tag {tag} at {pos - 1}")
+
+
+def loads(data):
+    """
+    Decode bytes from dumps() back into a parse() result
+    """
+    strings, pos = _header(data)
+    return _decode(data, pos, strings)[0]
+
+
+def _skip(data, pos):
+    """
+    The position after the value at `pos`, without decoding it
+    """
+    tag = data[pos]
+    pos += 1
+    if tag in (TAG_LIST, TAG_TUPLE, TAG_DICT):
+        _, pos = _read_varint(data, pos)
+        size, pos = _read_varint(data, pos)
+        return pos + size
+    elif tag in (TAG_INT, TAG_STR):
+        return _read_varint(data, pos)[1]
+    elif tag == TAG_FLOAT:
+        return pos + 8
+    return pos
+
+
+def _lazy(data, pos, strings):
+    """
+    The value at `pos`, with containers left as lazy views
+    """
+    tag = data[pos]
+    if tag == TAG_DICT:
+        return LazyDict(data, pos, strings)
+    elif tag in (TAG_LIST, TAG_TUPLE):
+        return LazyList(data, pos, strings)
+    return _decode(data, pos, strings)[0]
+
+
+class LazyList(Sequence):
+    """
+    A list or tuple in encoded data, whose items are decoded when used
+    """
+
+    __slots__ = ("_data", "_pos", "_strings", "_offsets")
+
+    def __init__(self, data, pos, strings):
+        self._data, self._pos, self._strings = data, pos, strings
+        self._offsets = None
+
+    def _items(self):
+        if self._offsets is None:
+            count, pos = _read_varint(self._data, self._pos + 1)
+            _, pos = _read_varint(self._data, pos)
+            offsets = []
+            for _ in range(count):
+                offsets.append(pos)
+                pos = _skip(self._data, pos)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self):
+        return _read_varint(self._data, self._pos + 1)[0]
+
+    def __getitem__(self, n):
+        if isinstance(n, slice):
+            return [_lazy(self._data, pos, self._strings) for pos in self._items()[n]]
+        return _lazy(self._data, self._items()[n], self._strings)
+
+    def decode(self):
+        """
+        The whole list (or tuple), decoded
+        """
+        return _decode(self._data, self._pos, self._strings)[0]
+
+
+class LazyDict(Mapping):
+    """
+    A dict in encoded data, whose values are decoded when used
+    """
+
+    __slots__ = ("_data", "_pos", "_strings", "_offsets")
+
+    def __init__(self, data, pos, strings):
+        self._data, self._pos, self._strings = data, pos, strings
+        self._offsets = None
+
+    def _items(self):
+        if self._offsets is None:
+            data = self._data
+            count, pos = _read_varint(data, self._pos + 1)
+            _, pos = _read_varint(data, pos)
+            offsets = {}
+            for _ in range(count):
+                index, pos = _read_varint(data, pos)
+                offsets[self._strings[index]] = pos
+                pos = _skip(data, pos)
+            self._offsets = offsets
+        return self._offsets
+
+    def __getitem__(self, key):
+        return _lazy(self._data, self._items()[key], self._strings)
+
+    def __iter__(self):
+        return iter(self._items())
+
+    def __len__(self):
+        return _read_varint(self._data, self._pos + 1)[0]
+
+    def decode(self):
+        """
+        The whole dict, decoded
+        """
+        return _decode(self._data, self._pos, self._strings)[0]
+
+
+def load_lazy(data):
+    """
+    A view of bytes from dumps() that only decodes the parts that are used:
+    dicts are LazyDicts, lists and tuples are LazyLists, and both have
+    `decode()` to get the whole thing
+    """
+    strings, pos = _header(data)
+    return _lazy(data, pos, strings)
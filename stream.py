@@ -0,0 +1,221 @@
+"""
+Lex and parse very large files with bounded memory: the file is memory-mapped
+and decoded, lexed and parsed a chunk of lines at a time, instead of being
+read into one string up front.
+
+    ast = parse_file("generated.vy")
+    with open("generated.vy", "rb") as f:
+        for token in tokenize_file(f):
+            ...
+"""
+import mmap
+import os
+import re
+from contextlib import contextmanager
+
+from lex import LineIndex, VyperLexer, VyperToken, postprocess
+from parse import ParseError, parse_tokens
+
+# About this many bytes of the file are decoded and lexed at once
+CHUNK_BYTES = 1024 * 1024
+
+ENCODING = "utf-8"
+
+
+@contextmanager
+def _mapped(source):
+    """
+    Memory-map a file path or a binary file object (which is left open).
+    File objects that aren't backed by a real file are read into memory.
+    """
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "rb") as f, _mapped(f) as data:
+            yield data
+        return
+
+    try:
+        fileno = source.fileno()
+    except (AttributeError, OSError):
+        yield source.read()
+        return
+
+    if os.fstat(fileno).st_size == 0:
+        yield b""  # Can't map an empty file
+        return
+
+    with mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+
+# Anything that may contain a triple quote without starting a docstring,
+# or a triple quote itself. Strings and docstrings are matched with the
+# lexer's own (linear time) patterns, so they end where its tokens do.
+_QUOTES_AND_COMMENTS = re.compile(
+    rb'"""|\'\'\'|#[^\n]*|' + VyperLexer.STRING.encode(ENCODING)
+)
+_DOCSTR = re.compile(VyperLexer.DOCSTR.pattern.encode(ENCODING))
+
+
+def _code_spans(data):
+    """
+    Yield the `(start, end)` byte ranges of `data` that are outside of
+    multiline docstrings, scanning it once from the start
+    """
+    pos = span_start = 0
+    while True:
+        m = _QUOTES_AND_COMMENTS.search(data, pos)
+        if m is None:
+            yield span_start, len(data)
+            return
+
+        quote = m.group()
+        if quote not in (b'"""', b"'''"):
+            pos = m.end()  # Skip over the comment or single-line string
+            continue
+
+        yield span_start, m.start()
+        docstring = _DOCSTR.match(data, m.start())
+        if docstring is None:
+            return  # Unclosed, so the lexer will complain about the rest
+        pos = span_start = docstring.end()
+
+
+def chunk_bounds(data, chunk_size=CHUNK_BYTES):
+    """
+    Split `data` into `(start, end)` byte ranges of about `chunk_size`,
+    each ending with a whole line outside of a docstring, so that no token
+    straddles two of them. A range is extended past `chunk_size` for lines
+    longer than that, or to the end of a multiline docstring.
+    """
+    size = len(data)
+    spans = _code_spans(data)
+    span = next(spans, None)
+    start = 0
+    while start < size:
+        target = start + chunk_size
+        if target >= size:
+            yield start, size
+            return
+
+        # The last newline outside a docstring before `target`...
+        cut = None
+        while span is not None and span[0] < target:
+            newline = data.rfind(b"\n", max(span[0], start), min(span[1], target))
+            if newline >= 0:
+                cut = newline + 1
+            if span[1] > target:
+                break  # This span continues into the next chunk
+            span = next(spans, None)
+
+        # ...or else the first one after it
+        while cut is None and span is not None:
+            newline = data.find(b"\n", max(span[0], target), span[1])
+            if newline >= 0:
+                cut = newline + 1
+            else:
+                span = next(spans, None)
+
+        if cut is None:
+            cut = size
+        # The lexer matches a run of newlines as one token, so don't split it
+        while data[cut : cut + 1] in (b"\n", b"\r"):
+            cut += 1
+        yield start, cut
+        start = cut
+
+
+def _chunk_column(text, first):
+    """
+    LineIndex(text).column for a chunk of a larger text, where the chunk's
+    first line may be counted differently than the first line of the text
+    """
+    line_index = LineIndex(text)
+    if not first:
+        # As if the newline ending the previous chunk was just before it
+        line_index.newlines.insert(0, -1)
+    return line_index.column
+
+
+def _lex(data, chunk_size):
+    """
+    Lex `data` a chunk at a time, into VyperTokens with their offset in the
+    decoded text, line and column (just like tokenize() would annotate them)
+    """
+    lexer = VyperLexer()
+    index = 0  # Offset of the chunk in the decoded text
+    lineno = 1
+    for start, end in chunk_bounds(data, chunk_size):
+        # Chunks end on a newline, so they never split a multibyte character
+        text = data[start:end].decode(ENCODING)
+        # Chunks also start at the beginning of a line, so columns
+        # within the chunk are columns within the file
+        column = _chunk_column(text, first=start == 0)
+        for token in lexer.tokenize(text, lineno):
+            t = VyperToken()
+            t.type = token.type
+            t.value = token.value
+            t.index = index + token.index
+            t.lineno = token.lineno
+            t.colno = column(token.index)
+            yield t
+        index += len(text)
+        lineno += text.count("\n")
+
+
+class MappedLines:
+    """
+    The lines of a mapped file, for showing the source around a syntax error.
+    Has the same `lines()` and `len()` as a LineIndex, but finds lines by
+    scanning the file, since that's only needed once.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = data
+
+    def __len__(self):
+        data, count, i = self.data, 0, self.data.find(b"\n")
+        while i >= 0:
+            count += 1
+            i = data.find(b"\n", i + 1)
+        if len(data) and data[-1:] != b"\n":
+            count += 1
+        return count
+
+    def lines(self, start, stop):
+        data, begin, n = self.data, 0, 0
+        lines = []
+        while n < stop and begin < len(data):
+            end = data.find(b"\n", begin)
+            if end < 0:
+                end = len(data)
+            if n >= start:
+                lines.append(data[begin:end].decode(ENCODING).rstrip("\r"))
+            begin = end + 1
+            n += 1
+        return lines
+
+
+def tokenize_file(source, chunk_size=CHUNK_BYTES):
+    """
+    The tokens of the decoded contents of `source`, a file path or binary
+    file object, lexed a chunk at a time. These are the same as the tokens
+    from tokenize(), since chunks only end between complete tokens.
+    """
+    with _mapped(source) as data:
+        yield from postprocess(_lex(data, chunk_size), None, annotate=False)
+
+
+def parse_file(source, chunk_size=CHUNK_BYTES):
+    """
+    Same as parse() on the decoded contents of `source`, a file path or
+    binary file object, with memory use bounded by `chunk_size` plus the AST
+    """
+    with _mapped(source) as data:
+        tokens = postprocess(_lex(data, chunk_size), None, annotate=False)
+        try:
+            return parse_tokens(tokens, None, MappedLines(data))
+        except ParseError as e:
+            e.render()  # While the file is still mapped
+            raise
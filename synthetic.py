@@ -0,0 +1,273 @@
+"""
+Generate valid contracts of any size, for testing how the lexer and parser
+scale. The same size and seed always give the same source.
+
+    text = generate_contract(2 ** 20, seed=1)  # About 1MB
+    parse(text)
+
+Contracts use the constructs of the grammar: imports, interfaces,
+structs, events, storage (with nested HashMaps), constants, decorated
+functions with defaults and return types, and statements of every kind,
+with deeply nested `if`/`elif`/`else`, long expression chains, and
+collections spread over many lines.
+"""
+import random
+
+TYPES = ("uint256", "int128", "address", "bool", "bytes32", "decimal")
+# Operators that chain (the others don't associate, so they're in brackets)
+CHAINED_OPS = ("+", "-", "*", "/")
+BRACKETED_OPS = ("%", "**", "<<", ">>")
+COMPARISONS = ("<", ">", "==", "!=", "in")
+AUGMENTED_OPS = ("+=", "-=", "*=", "/=", "%=", "**=")
+
+
+class _Generator:
+    def __init__(self, seed):
+        self.random = random.Random(seed)
+        self.lines = []
+        self.size = 0
+        self.budget = 0  # Statements left for the current function
+
+    def emit(self, line=""):
+        self.lines.append(line)
+        self.size += len(line) + 1
+
+    def name(self, prefix):
+        return f"{prefix}{self.random.randrange(1000)}"
+
+    def type(self, unit, depth=0):
+        roll = self.random.random()
+        if depth < 3 and roll < 0.2:
+            key = self.random.choice(("address", "uint256", "bytes32"))
+            return f"HashMap[{key}, {self.type(unit, depth + 1)}]"
+        if roll < 0.3:
+            return f"Position{unit}"
+        if depth == 0 and roll < 0.35:  # Not as a HashMap's value
+            return f"({self.random.choice(TYPES)}, {self.random.choice(TYPES)})"
+        return self.random.choice(TYPES)
+
+    def literal(self):
+        roll = self.random.random()
+        if roll < 0.5:
+            return str(self.random.randrange(10 ** self.random.randrange(1, 20)))
+        if roll < 0.6:
+            return hex(self.random.randrange(2 ** 64))
+        if roll < 0.65:
+            return oct(self.random.randrange(2 ** 16))
+        if roll < 0.7:
+            return bin(self.random.randrange(256))
+        if roll < 0.8:
+            return f"{self.random.randrange(1000)}.{self.random.randrange(1000)}"
+        if roll < 0.9:
+            return self.random.choice(("True", "False"))
+        quote = self.random.choice("\"'")
+        return f"{quote}text {self.random.randrange(1000)} \\{quote} # not a comment{quote}"
+
+    def variable(self, unit):
+        roll = self.random.random()
+        if roll < 0.3:
+            return self.name("x")
+        if roll < 0.5:
+            return f"self.balance{unit}[{self.name('x')}]"
+        if roll < 0.6:
+            return f"self.nested{unit}[msg.sender][{self.atom(unit)}]"
+        if roll < 0.7:
+            return f"self.positions{unit}[{self.name('x')}].size"
+        if roll < 0.8:
+            # Arguments can't start with a name, so they're literals or keywords
+            return f"self.helper{unit}({self.literal()}, amount={self.name('x')})"
+        if roll < 0.9:
+            return f"msg.{self.random.choice(('sender', 'value', 'data'))}"
+        return f"block.{self.random.choice(('timestamp', 'number'))}"
+
+    def atom(self, unit):
+        roll = self.random.random()
+        if roll < 0.4:
+            return self.literal()
+        if roll < 0.9:
+            return self.variable(unit)
+        return f"-{self.variable(unit)}"
+
+    def expr(self, unit, terms=None):
+        if terms is None:
+            terms = self.random.choice((1, 1, 2, 3, 5, 8))
+        parts = [self.atom(unit)]
+        for _ in range(terms - 1):
+            parts.append(self.random.choice(CHAINED_OPS))
+            roll = self.random.random()
+            if roll < 0.1:
+                parts.append(f"({self.expr(unit, 2)})")
+            elif roll < 0.2:
+                op = self.random.choice(BRACKETED_OPS)
+                parts.append(f"({self.atom(unit)} {op} {self.atom(unit)})")
+            else:
+                parts.append(self.atom(unit))
+        return " ".join(parts)
+
+    def condition(self, unit):
+        parts = []
+        for n in range(self.random.choice((1, 1, 2, 3))):
+            if n:
+                parts.append(self.random.choice(("and", "or")))
+            if self.random.random() < 0.2:
+                parts.append(f"not {self.variable(unit)}")
+            else:
+                op = self.random.choice(COMPARISONS)
+                parts.append(f"{self.expr(unit, 2)} {op} {self.expr(unit, 2)}")
+        return " ".join(parts)
+
+    def block(self, unit, indent, depth, loop=False):
+        pad = "    " * indent
+        for _ in range(self.random.randrange(1, 5)):
+            self.statement(unit, indent, depth, loop)
+        if loop and self.random.random() < 0.3:
+            self.emit(f"{pad}{self.random.choice(('break', 'continue'))}")
+
+    def statement(self, unit, indent, depth, loop):
+        pad = "    " * indent
+        self.budget -= 1
+        # Nesting multiplies statements, so only while the budget lasts
+        roll = self.random.random() if self.budget > 0 else 0.2 + self.random.random() * 0.8
+        if depth < 6 and roll < 0.15:
+            self.emit(f"{pad}if {self.condition(unit)}:")
+            self.block(unit, indent + 1, depth + 1, loop)
+            for _ in range(self.random.choice((0, 1, 2, 8))):
+                self.emit(f"{pad}elif {self.condition(unit)}:")
+                self.block(unit, indent + 1, depth + 1, loop)
+            if self.random.random() < 0.5:
+                self.emit(f"{pad}else:")
+                self.block(unit, indent + 1, depth + 1, loop)
+        elif depth < 6 and roll < 0.2:
+            iterable = self.random.choice(
+                (f"range({self.random.randrange(1, 100)})", f"self.items{unit}")
+            )
+            self.emit(f"{pad}for {self.name('i')} in {iterable}:")
+            self.block(unit, indent + 1, depth + 1, loop=True)
+        elif roll < 0.35:
+            self.emit(f"{pad}{self.name('x')}: uint256 = {self.expr(unit)}")
+        elif roll < 0.5:
+            self.emit(f"{pad}{self.variable(unit)} = {self.expr(unit)}")
+        elif roll < 0.6:
+            op = self.random.choice(AUGMENTED_OPS)
+            self.emit(f"{pad}self.balance{unit}[{self.name('x')}] {op} {self.expr(unit)}")
+        elif roll < 0.65:
+            self.emit(f"{pad}{self.name('x')}, _ = {self.variable(unit)}")
+        elif roll < 0.75:
+            message = self.random.choice(("", ', "Failed"', ", UNREACHABLE"))
+            self.emit(f"{pad}assert {self.condition(unit)}{message}")
+        elif roll < 0.8:
+            self.emit(f"{pad}log Moved{unit}({{sender: msg.sender, amount: {self.expr(unit)}}})")
+        elif roll < 0.85:
+            self.collection(unit, indent)
+        elif roll < 0.9:
+            self.emit(f"{pad}pair: (uint256, bool) = ({self.expr(unit)}, {self.literal()})")
+        elif roll < 0.95:
+            self.emit(f"{pad}self.helper{unit}({self.literal()}, amount={self.name('x')})")
+        elif roll < 0.97:
+            self.emit(f"{pad}# A comment, with (unbalanced brackets")
+            self.emit(f"{pad}{self.name('x')}: uint256 = {self.expr(unit)}  # Another")
+        else:
+            self.emit(f"{pad}{self.random.choice(('raise', 'raise UNREACHABLE'))}")
+
+    def collection(self, unit, indent):
+        """
+        A list or struct literal, one item per line
+        """
+        pad = "    " * indent
+        items = [self.expr(unit) for _ in range(self.random.randrange(20))]
+        if not items:
+            self.emit(f"{pad}values: Values{unit} = []")
+            return
+        if self.random.random() < 0.5:
+            # The grammar has no array types (yet), so any name will do
+            self.emit(f"{pad}values: Values{unit} = [")
+            for n, item in enumerate(items):
+                self.emit(f"{pad}    {item}{',' if n < len(items) - 1 else ''}")
+            self.emit(f"{pad}]")
+        else:
+            self.emit(f"{pad}position: Position{unit} = {{")
+            fields = ("owner", "size", "collateral", "opened")
+            for n, field in enumerate(fields):
+                self.emit(f"{pad}    {field}: {items[n % len(items)]}{',' if n < 3 else ''}")
+            self.emit(f"{pad}}}")
+
+    def function(self, unit, n):
+        decorators = self.random.choice(
+            (["@external"], ["@internal"], ["@external", "@view"], ["@external", "@payable"],
+             ['@external', '@nonreentrant("lock")'])
+        )
+        for decorator in decorators:
+            self.emit(decorator)
+        parameters = [
+            f"{self.name('a')}: {self.random.choice(TYPES)}"
+            for _ in range(self.random.randrange(4))
+        ]
+        if self.random.random() < 0.3:
+            parameters.append(f"option: address = {self.name('DEFAULT')}")
+        returns = self.random.choice(("", " -> uint256", " -> (uint256, bool)"))
+        self.emit(f"def function{unit}_{n}({', '.join(parameters)}){returns}:")
+        self.budget = self.random.randrange(10, 60)
+        if self.random.random() < 0.1:
+            self.emit("    pass")
+            return
+        self.block(unit, 1, 0)
+        if returns:
+            self.emit(f"    return {self.expr(unit)}")
+
+    def unit(self, unit, size):
+        """
+        A group of declarations and the functions using them, with names
+        numbered by `unit` so that they don't clash with other groups.
+        Stops adding functions once the source is `size` bytes.
+        """
+        self.emit(f"interface Oracle{unit}:")
+        for n in range(self.random.randrange(1, 4)):
+            mutability = self.random.choice(("view", "pure", "nonpayable", "payable"))
+            self.emit(f"    def price{n}(asset: address) -> uint256: {mutability}")
+        self.emit()
+        self.emit(f"struct Position{unit}:")
+        self.emit("    owner: address")
+        self.emit("    size: uint256")
+        self.emit("    collateral: uint256")
+        self.emit("    opened: uint256")
+        self.emit()
+        self.emit(f"event Moved{unit}:")
+        self.emit("    sender: indexed(address)")
+        self.emit("    amount: uint256")
+        self.emit()
+        self.emit(f"balance{unit}: public(HashMap[address, uint256])")
+        self.emit(f"nested{unit}: HashMap[address, HashMap[uint256, HashMap[bytes32, uint256]]]")
+        self.emit(f"positions{unit}: HashMap[address, Position{unit}]")
+        self.emit(f"items{unit}: {self.type(unit)}")
+        self.emit(f"owner{unit}: immutable(address)")
+        limit = f"{self.random.randrange(1, 100)} * 10 ** {self.random.randrange(19)}"
+        self.emit(f"LIMIT{unit}: constant(uint256) = {limit}")
+        self.emit(f'NAME{unit}: constant(String) = "unit {unit}"')
+        for n in range(self.random.randrange(2, 6)):
+            self.emit()
+            self.emit()
+            self.function(unit, n)
+            if self.size >= size:
+                break
+        self.emit()
+        self.emit()
+
+
+def generate_contract(size, seed=0):
+    """
+    A valid contract of at least `size` bytes (and not much more)
+    """
+    generator = _Generator(seed)
+    generator.emit('"""')
+    generator.emit(f"@title Synthetic contract {seed}")
+    generator.emit('"""')
+    generator.emit("import interfaces.token as token")
+    generator.emit("from . import math")
+    generator.emit("from ..lib import (helpers, errors as e)")
+    generator.emit("from vyper.interfaces import *")
+    generator.emit()
+    unit = 0
+    while generator.size < size:
+        generator.unit(unit, size)
+        unit += 1
+    return "\n".join(generator.lines) + "\n"
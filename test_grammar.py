@@ -1,3 +1,6 @@
+import glob
+import os
+
 import pytest
 from parse import parse
 
@@ -117,3 +120,982 @@ SOURCES = (
 @pytest.mark.parametrize("source", SOURCES)
 def test_grammar(source):
     parse(source, display_tokens=True)
+
+
+def test_table_cache(tmp_path, monkeypatch):
+    import parse as parse_module
+
+    monkeypatch.setattr(parse_module, "TABLE_CACHE_DIR", str(tmp_path))
+    parser = parse_module._VyperParser
+    parse_module._save_tables(parser._fingerprint, parser._lrtable)
+
+    tables = parse_module._load_tables(parser._fingerprint)
+    assert tables.lr_action == parser._lrtable.lr_action
+    assert tables.lr_goto == parser._lrtable.lr_goto
+    assert tables.defaulted_states == parser._lrtable.defaulted_states
+
+    # A grammar change means a new fingerprint, which must miss
+    assert parse_module._load_tables("0" * 64) is None
+
+
+def test_import_is_lazy():
+    import subprocess
+    import sys
+
+    # The parser is only built (or loaded) when it's first used
+    code = "import sys, parse; print('grammar' in sys.modules)"
+    here = os.path.dirname(os.path.abspath(__file__))
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=here, capture_output=True, text=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+@pytest.mark.parametrize("source", IMPORTS + MAPPINGS + TUPLES + CONSTANTS)
+def test_token_buffer(source):
+    assert parse(source, buffer=True) == parse(source)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many(ordered):
+    from batch import parse_many
+
+    sources = IMPORTS + ["a = $"] + MAPPINGS
+    results = list(parse_many(sources, workers=2, ordered=ordered, chunk_bytes=64))
+    if not ordered:
+        results.sort(key=lambda r: r[0])
+
+    assert [n for n, _, _ in results] == list(range(len(sources)))
+    for n, ast, error in results:
+        if sources[n] == "a = $":
+            assert ast is None and isinstance(error, SyntaxError)
+        else:
+            assert error is None and ast == parse(sources[n])
+
+
+def test_parse_pool_prestarted():
+    import multiprocessing
+
+    from batch import ParsePool
+
+    with ParsePool(workers=2):
+        assert len(multiprocessing.active_children()) == 2
+
+
+CONTRACT = """
+from a import b
+import c as d
+
+struct Point:
+    x: uint256
+    y: uint256
+
+event Transfer:
+    sender: indexed(address)
+    amount: uint256
+
+interface Token:
+    def balanceOf(owner: address) -> uint256: view
+
+owner: address
+balances: HashMap[address, uint256]
+MAX: constant(uint256) = 100
+
+@external
+def transfer(to: address, amount: uint256) -> bool:
+    assert amount > 0, "Too little"
+    balance += amount
+    if amount > 100:
+        log Transfer({sender: owner, amount: amount})
+    for i in items:
+        total = total + i
+    return True
+
+@view
+@internal
+def _helper(a: uint256, b: uint256) -> uint256:
+    result: uint256 = a * b + (a - b) / 2
+    values: Point = {
+        x: 1,
+        y: 2
+    }
+    return self.balances[result]
+"""
+
+EDITS = [
+    ("owner: address", "owner: bytes32"),  # Replace a statement's type
+    ("MAX", "MIN"),  # Rename a constant
+    ("\nowner: address", ""),  # Delete a whole statement
+    ("\n@view", "\nx: uint256\n@view"),  # Insert a statement
+    ("return True", "return False\n    pass"),  # Edit a function body
+    ("\n\n@external", "\n@external"),  # Remove a blank line
+    ("\n    x: uint256\n", "\n    x: uint256\n    z: uint256\n"),  # Add a member
+    ("y: 2\n    }", "y: 2}"),  # Re-join a multi-line dict
+    ("\n    y: uint256", "\ny: uint256"),  # Dedent a member out of the struct
+    ("\ninterface", "\n    interface"),  # Invalid indent
+    ("{", "("),  # Unbalanced bracket
+]
+
+
+@pytest.mark.parametrize("old,new", EDITS)
+def test_reparse(old, new):
+    from incremental import ParsedModule, reparse
+
+    module = ParsedModule(CONTRACT)
+    assert module.ast == parse(CONTRACT)
+
+    start = CONTRACT.index(old)
+    text = CONTRACT.replace(old, new, 1)
+    try:
+        expected = parse(text)
+    except SyntaxError:
+        with pytest.raises(SyntaxError):
+            reparse(module, start, start + len(old), new)
+    else:
+        module = reparse(module, start, start + len(old), new)
+        assert module.text == text
+        assert module.ast == expected
+
+
+def test_reparse_regions():
+    from incremental import ParsedModule
+
+    # One region per top-level statement, with decorators kept on their function
+    module = ParsedModule(CONTRACT)
+    assert len(module.regions) == 10
+    assert CONTRACT[module.regions[-1][0] :].lstrip().startswith("@view")
+
+
+def test_parse_cache(tmp_path):
+    from cache import CacheStats, ParseCache
+
+    cache = ParseCache(str(tmp_path), max_entries=2)
+    for source in IMPORTS[:3]:
+        assert cache.parse(source) == parse(source)
+    assert cache.stats == CacheStats(0, 0, 3)
+
+    # The newest entries are in memory, the oldest only on disk
+    assert cache.parse(IMPORTS[2]) == parse(IMPORTS[2])
+    assert cache.parse(IMPORTS[0]) == parse(IMPORTS[0])
+    assert cache.stats == CacheStats(1, 1, 3)
+
+    # Every hit is a copy, whichever tier it came from
+    ast = cache.parse(IMPORTS[2])
+    ast[1]["imports"].clear()
+    assert cache.parse(IMPORTS[2]) == parse(IMPORTS[2])
+
+    # Another process (or a later run) shares the disk tier
+    other = ParseCache(str(tmp_path))
+    assert other.parse(IMPORTS[1]) == parse(IMPORTS[1])
+    assert other.stats == CacheStats(0, 1, 0)
+
+    with pytest.raises(SyntaxError):
+        cache.parse("a = $")
+
+
+def test_parse_cache_eviction(tmp_path):
+    from cache import ParseCache
+
+    cache = ParseCache(str(tmp_path), max_bytes=1024)
+    for source in IMPORTS:
+        cache.parse(source)
+    assert sum(size for _, size, _ in cache._files()) <= 1024
+
+
+def test_parse_cache_failed_write(tmp_path, monkeypatch):
+    from cache import ParseCache
+
+    def no_space(src, dst):
+        raise OSError(28, "No space left on device")
+
+    # A failed write is only a cache miss, and leaves nothing behind
+    monkeypatch.setattr(os, "replace", no_space)
+    assert ParseCache(str(tmp_path)).parse(IMPORTS[0]) == parse(IMPORTS[0])
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == []
+
+
+LAZY_SOURCES = [
+    CONTRACT,
+    'def a():\n    b = "("  # )\nc: uint256',
+    # A body that has to be lexed to find where it ends
+    'def a():\n    b = "\\"("\nc: uint256',
+    # Things that look like a body, but aren't one
+    "interface A:\n    def b() -> uint256: view\nc: uint256",
+    "def a(b: uint256,\nc: uint256):\n    pass\nd: uint256",
+]
+
+
+@pytest.mark.parametrize("source", LAZY_SOURCES)
+def test_lazy_bodies(source):
+    from parse import LazyBody
+
+    module = parse(source, lazy=True)
+    bodies = [f["body"] for f in module[1]["function_defs"]]
+    assert all(not isinstance(body, LazyBody) or not body.parsed for body in bodies)
+
+    assert module == parse(source)
+
+
+def test_lazy_body_repr():
+    body = parse("x: uint256\ndef a():\n    pass\n", lazy=True)
+    assert repr(body[1]["function_defs"][0]["body"]) == "LazyBody(<unparsed @ line 3>)"
+
+
+def test_lazy_body_error():
+    source = "x: uint256\ndef a():\n    b = = 1\n"
+    with pytest.raises(SyntaxError):
+        parse(source)
+
+    # The error is only found when the body is used
+    body = parse(source, lazy=True)[1]["function_defs"][0]["body"]
+    with pytest.raises(SyntaxError):
+        list(body)
+
+
+def test_lazy_buffer():
+    # The skeleton's LAZY_BODY tokens can't go in a TokenBuffer
+    with pytest.raises(ValueError):
+        parse(CONTRACT, lazy=True, buffer=True)
+
+
+@pytest.mark.parametrize(
+    "expr,expected",
+    [
+        ("self.c", ("getattr", {"target": "self", "attribute": "c"})),
+        ("c[1]", ("getitem", {"target": "c", "index": 1})),
+        ("(c).d", ("getattr", {"target": "c", "attribute": "d"})),
+        (
+            "a.b[c]",
+            (
+                "getitem",
+                {"target": ("getattr", {"target": "a", "attribute": "b"}), "index": "c"},
+            ),
+        ),
+    ],
+)
+def test_variable_shapes(expr, expected):
+    body = parse(f"def a():\n    b = {expr}\n")[1]["function_defs"][0]["body"]
+    assert body == [("assign", {"target": "b", "expr": expected})]
+
+
+STREAM_SOURCES = [
+    CONTRACT + "# Ünicode comment\n\n\nz: int128",
+    '"""\nModule docstring\n"""\n' + CONTRACT + 'X: constant(String) = "a \\" # b"',
+]
+
+
+def _tokens_of_file(tmp_path, source, chunk_size):
+    from stream import tokenize_file
+    from lex import tokenize
+
+    path = tmp_path / "contract.vy"
+    path.write_text(source, encoding="utf-8")
+
+    expected = [(t.type, t.value, t.index, t.lineno, t.colno) for t in tokenize(source)]
+    tokens = [
+        (t.type, t.value, t.index, t.lineno, t.colno)
+        for t in tokenize_file(str(path), chunk_size)
+    ]
+    assert tokens == expected
+    return path
+
+
+@pytest.mark.parametrize("source", STREAM_SOURCES)
+@pytest.mark.parametrize("chunk_size", [1, 16, 1024])
+def test_parse_file(tmp_path, source, chunk_size):
+    from stream import parse_file
+
+    path = _tokens_of_file(tmp_path, source, chunk_size)
+    with open(path, "rb") as f:
+        assert parse_file(f, chunk_size) == parse(source)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 16, 1024])
+def test_tokenize_file_docstrings(tmp_path, chunk_size):
+    # Many docstrings, each ending at its own closing quotes
+    source = '"""Module"""\n' + (
+        "def a():\n"
+        '    """\n    Says \\""" and \'\'\' # not a comment\n    """\n'
+        "    x = 1  # Nor is this a \"\"\" docstring\n"
+        "\n"
+        "def b():\n"
+        "    \'\'\'B\'\'\'\n"
+        "    y = 2\n"
+    ) * 10
+    _tokens_of_file(tmp_path, source, chunk_size)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 8, 64])
+def test_chunk_bounds(chunk_size):
+    from stream import chunk_bounds
+
+    data = (
+        b'a = 1  # not a """ docstring\n'
+        b'b = "neither \'\'\' is this"\n'
+        b'"""\nA docstring\nover lines\n"""\n'
+        + b"c = 2\n" * 20
+    )
+    bounds = list(chunk_bounds(data, chunk_size))
+    assert bounds[0][0] == 0 and bounds[-1][1] == len(data)
+    assert all(end == start for (_, end), (start, _) in zip(bounds, bounds[1:]))
+
+    docstring = (data.index(b'"""\nA'), data.index(b'"""\nc') + 4)
+    for start, end in bounds:
+        assert end == len(data) or data[end - 1 : end] == b"\n"
+        # Only ever cut outside of the docstring
+        assert not docstring[0] < end < docstring[1]
+        # Chunks are only longer than asked for to get past the docstring
+        if end - start > chunk_size:
+            assert data.rfind(b"\n", start, start + chunk_size) < 0 or (
+                start < docstring[1] and end >= docstring[1]
+            )
+
+
+def test_parse_file_error(tmp_path):
+    from stream import parse_file
+
+    path = tmp_path / "contract.vy"
+    path.write_text(CONTRACT.replace("MAX", "MAX MAX"))
+    with pytest.raises(SyntaxError) as error:
+        parse_file(str(path), chunk_size=64)
+
+    with pytest.raises(SyntaxError) as expected:
+        parse(CONTRACT.replace("MAX", "MAX MAX"))
+    assert str(error.value) == str(expected.value)
+
+
+@pytest.mark.parametrize(
+    "path", sorted(glob.glob(os.path.join(os.path.dirname(__file__), "corpus", "*.vy")))
+)
+def test_corpus(path):
+    # The benchmark corpus has to stay parseable
+    with open(path) as f:
+        module = parse(f.read())
+    assert module[1]["function_defs"]
+
+
+def test_instrumented_parse():
+    from metrics import PipelineMetrics
+
+    ast, metrics = parse(CONTRACT, instrument=True)
+    assert ast == parse(CONTRACT)
+    assert list(metrics.stages) == ["lexer", "postprocess", "parser"]
+    assert metrics.stages["parser"].tokens_in == metrics.stages["postprocess"].tokens_out
+
+    total = PipelineMetrics()
+    total += metrics
+    total += parse(CONTRACT, instrument=True)[1]
+    assert total.parses == 2
+    assert total.stages["lexer"].tokens_out == 2 * metrics.stages["lexer"].tokens_out
+
+    exported = total.to_prometheus().splitlines()
+    assert "# TYPE vyper_grammar_stage_seconds_total counter" in exported
+    assert "vyper_grammar_parses_total 2" in exported
+    lexed = total.stages["lexer"].tokens_out
+    assert f'vyper_grammar_stage_tokens_out_total{{stage="lexer"}} {lexed}' in exported
+
+
+NODE_SOURCES = [
+    CONTRACT,
+    "def a():\n    if x:\n        pass\n    elif y:\n        break\n    else:\n        continue",
+    "def a():\n    a, _ = b",
+    'def a():\n    log A({a: 1})\n    raise "no"',
+    'def a() -> uint256:\n    assert not a, "x"\n    return -a',
+    "def a():\n    b: (A, B) = (1, 2)\n    c: A = [1, 2]\n    x = a.b[c].d()",
+]
+
+
+@pytest.mark.parametrize(
+    "source", [s for s in SOURCES if s not in ARRAYS] + NODE_SOURCES
+)
+def test_nodes(source):
+    import pickle
+
+    module = parse(source, nodes=True)
+    assert module.to_tuple() == parse(source)
+    assert pickle.loads(pickle.dumps(module)) == module
+
+
+def test_node_fields():
+    module = parse(CONTRACT, nodes=True)
+    function = module.function_defs[0]
+    assert function.name == parse(CONTRACT)[1]["function_defs"][0]["name"]
+    with pytest.raises(AttributeError):
+        function.extra = None  # No __dict__
+
+    with pytest.raises(ValueError):
+        parse(CONTRACT, nodes=True, lazy=True)
+
+
+@pytest.mark.parametrize("source", [CONTRACT] + NODE_SOURCES)
+def test_spans(source):
+    from nodes import Node
+
+    ast, spans = parse(source, spans=True)
+    assert ast == parse(source)
+    module, node_spans = parse(source, nodes=True, spans=True)
+    assert module == parse(source, nodes=True)
+
+    def walk(node):
+        if isinstance(node, Node):
+            yield node
+            for field in node.__slots__:
+                yield from walk(getattr(node, field))
+        elif isinstance(node, (list, tuple)):
+            for value in node:
+                yield from walk(value)
+
+    for node in walk(module):
+        start, end = node_spans[node]
+        text = source[start:end]
+        # No whitespace (nor newlines ending the statement) on either side
+        assert text and text == text.strip()
+        lineno = source.count("\n", 0, start) + 1
+        column = start - (source.rfind("\n", 0, start) + 1)
+        assert node_spans.start(node) == (lineno, column)
+
+    # Nodes made from the same tuples and dicts have the same spans
+    for tuple_node, node in zip(ast[1]["function_defs"], module.function_defs):
+        assert spans[tuple_node] == node.span
+        for stmt, stmt_node in zip(tuple_node["body"], node.body):
+            assert spans.get(stmt) == stmt_node.span
+
+
+def test_span_positions():
+    source = "@external\ndef f(a: uint256):\n    x: uint256 = a + 1\n    break\n    break\n"
+    ast, spans = parse(source, spans=True)
+    function = ast[1]["function_defs"][0]
+    assert source[slice(*spans[function])] == source.rstrip()
+    assert spans.start(function) == (1, 0)
+    assert spans.end(function) == (5, 9)
+
+    allocate, first, second = function["body"]
+    assert source[slice(*spans[allocate])] == "x: uint256 = a + 1"
+    assert source[slice(*spans[allocate[1]["initial_value"]])] == "a + 1"
+    # The same statement twice has a span for each
+    assert first == second and first is not second
+    assert spans.start(first) == (4, 4) and spans.start(second) == (5, 4)
+
+    assert "a" not in spans  # Names are plain strings, with no span of their own
+    with pytest.raises(KeyError):
+        spans[("break",)]
+    with pytest.raises(ValueError):
+        parse(source, lazy=True, spans=True)
+    ast, metrics, spans = parse(source, instrument=True, spans=True)
+    assert spans.end(ast[1]["function_defs"][0]) == (5, 9)
+
+
+def test_parser_reuse():
+    import parse as parse_module
+    from lex import tokenize
+
+    parse(CONTRACT)
+    parser = parse_module._parsers.free[-1]
+    assert parse("a: uint256") == parse_module.parse_tokens(tokenize("a: uint256"), None)
+    assert parse_module._parsers.free == [parser]
+    assert parser._text is None and parser.symstack is None
+
+    def nested():
+        # A parse from inside another one (on this thread) gets its own parser
+        yield from tokenize("b: uint256")
+        assert parse("c: uint256")[1]["storage_defs"][0]["name"] == "c"
+
+    assert parse_module.parse_tokens(nested(), None)[1]["storage_defs"][0]["name"] == "b"
+    assert len(parse_module._parsers.free) == 2
+
+
+def test_parse_threads():
+    from concurrent.futures import ThreadPoolExecutor
+
+    sources = [CONTRACT, "a = $", CONTRACT.replace("MAX", "MAX MAX")] + [
+        s for s in SOURCES if s not in ARRAYS
+    ]
+
+    def result(source):
+        try:
+            return parse(source)
+        except SyntaxError as e:
+            return str(e)
+
+    expected = [result(s) for s in sources]
+    with ThreadPoolExecutor(8) as executor:
+        for _ in range(5):
+            assert list(executor.map(result, sources)) == expected
+
+
+@pytest.mark.parametrize("source", [CONTRACT] + [s for s in SOURCES if s not in ARRAYS])
+def test_parse_recovering_valid(source):
+    from recovery import parse_recovering
+
+    assert parse_recovering(source) == (parse(source), [])
+
+
+def test_parse_recovering():
+    from parse import ParseError
+    from recovery import parse_recovering
+
+    source = (
+        CONTRACT.replace("import c as d", "import c as $")
+        .replace("= 100", "= = 100")
+        .replace("total + i", "total +")
+    )
+    ast, errors = parse_recovering(source)
+
+    assert [type(e) for e in errors] == [SyntaxError, ParseError, ParseError]
+    assert str(errors[0]).startswith("Illegal Character $ @ line 3")
+    # Rendered when shown, and the same as parse() would raise
+    assert errors[1]._message is None
+    with pytest.raises(SyntaxError) as error:
+        parse(CONTRACT.replace("= 100", "= = 100"))
+    assert str(errors[1]) == str(error.value)
+    assert "total = total +" in str(errors[2])
+
+    # Everything else is still there
+    expected = parse(CONTRACT)[1]
+    assert ast[1]["imports"] == expected["imports"][:1]
+    for key in ("struct_defs", "interface_defs", "event_defs", "storage_defs"):
+        assert ast[1][key] == expected[key]
+    assert ast[1]["constant_defs"] == []
+    assert ast[1]["function_defs"] == expected["function_defs"][1:]
+
+
+def test_parse_recovering_keywords():
+    from parse import ParseError
+    from recovery import parse_recovering
+
+    # Names the grammar checks are reported like any other syntax error
+    source = (
+        CONTRACT.replace("HashMap", "HashMa")
+        .replace("constant(", "constan(")
+        .replace("indexed(", "indexd(")
+        .replace("total + i", "total +")
+    )
+    ast, errors = parse_recovering(source)
+
+    assert [type(e) for e in errors] == [ParseError] * 4
+    lines = source.splitlines()
+    for error, word in zip(errors, ["indexd", "HashMa", "constan", "total +"]):
+        assert word in lines[error.position[0] - 1]
+    assert ast[1]["storage_defs"] == parse(CONTRACT)[1]["storage_defs"][:1]
+    assert ast[1]["event_defs"] == ast[1]["constant_defs"] == []
+    assert ast[1]["function_defs"] == parse(CONTRACT)[1]["function_defs"][1:]
+
+
+def test_parse_error_pickle():
+    import pickle
+
+    with pytest.raises(SyntaxError) as error:
+        parse("a = = 1")
+    copy = pickle.loads(pickle.dumps(error.value))
+    assert type(copy) is SyntaxError and str(copy) == str(error.value)
+
+
+def test_parse_async():
+    import asyncio
+
+    from aio import parse_async
+
+    assert asyncio.run(parse_async(CONTRACT)) == parse(CONTRACT)
+    with pytest.raises(SyntaxError):
+        asyncio.run(parse_async("a = $"))
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many_async(ordered):
+    import asyncio
+
+    from aio import parse_many_async
+
+    sources = IMPORTS + ["a = $"] + MAPPINGS
+    pulled = []
+
+    def generate():
+        for source in sources:
+            pulled.append(source)
+            yield source
+
+    async def collect():
+        results = []
+        async for result in parse_many_async(generate(), max_concurrency=2, ordered=ordered):
+            # Sources are only taken as results come out (backpressure)
+            assert len(pulled) <= len(results) + 3
+            results.append(result)
+        return results
+
+    results = sorted(asyncio.run(collect()), key=lambda r: r[0])
+    assert [n for n, _, _ in results] == list(range(len(sources)))
+    for n, ast, error in results:
+        if sources[n] == "a = $":
+            assert ast is None and isinstance(error, SyntaxError)
+        else:
+            assert error is None and ast == parse(sources[n])
+
+
+def test_parse_async_timeout():
+    import asyncio
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    from aio import AsyncParser
+
+    with open(os.path.join(os.path.dirname(__file__), "corpus", "markets_large.vy")) as f:
+        huge = f.read()
+
+    async def run(executor):
+        parser = AsyncParser(executor, max_concurrency=1)
+        with pytest.raises(TimeoutError):
+            await parser.parse(huge, timeout=0.01)
+
+        # The worker gave up too, so it's free for the next request
+        start = time.perf_counter()
+        assert await parser.parse("a: uint256", timeout=1)
+        assert time.perf_counter() - start < 0.5
+
+        task = asyncio.ensure_future(parser.parse(huge))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await parser.parse("a: uint256", timeout=1)
+
+    with ThreadPoolExecutor(1) as executor:
+        asyncio.run(run(executor))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        None,
+        True,
+        False,
+        0,
+        -1,
+        2 ** 70,
+        -(2 ** 70),
+        1.5,
+        -0.1,
+        1e300,
+        "",
+        "é",
+        [],
+        (),
+        {},
+        [None, (1, "a"), {"b": [True, -2.5]}],
+    ],
+)
+def test_serialize_values(value):
+    from serialize import dumps, loads
+
+    assert loads(dumps(value)) == value
+    assert type(loads(dumps(value))) is type(value)
+
+
+@pytest.mark.parametrize(
+    "path", [None] + sorted(glob.glob(os.path.join(os.path.dirname(__file__), "corpus", "*.vy")))
+)
+def test_serialize(path):
+    from serialize import dumps, load_lazy, loads
+
+    if path is None:
+        source = CONTRACT
+    else:
+        with open(path) as f:
+            source = f.read()
+    ast = parse(source)
+    data = dumps(ast)
+    assert loads(data) == ast
+
+    module = load_lazy(data)
+    assert module[0] == "Module"
+    functions = module[1]["function_defs"]
+    assert [f["name"] for f in functions] == [f["name"] for f in ast[1]["function_defs"]]
+    assert module[1].decode() == ast[1]
+    assert dict(module[1]).keys() == ast[1].keys()
+
+
+def test_serialize_header():
+    import serialize
+
+    data = serialize.dumps(parse(CONTRACT))
+    with pytest.raises(ValueError):
+        serialize.loads(b"not an ast")
+    with pytest.raises(ValueError):
+        serialize.loads(data.replace(serialize.MAGIC + b"\x01", serialize.MAGIC + b"\x02", 1))
+    with pytest.raises(ValueError):
+        serialize.loads(data[:7] + bytes([data[7] ^ 1]) + data[8:])
+    with pytest.raises(TypeError):
+        serialize.dumps(object())
+
+
+@pytest.mark.parametrize("source", IMPORTS + [CONTRACT, '"""a"""\nimport a\nx: uint256\nimport b'])
+def test_scan_imports(source):
+    from deps import scan_imports
+
+    expected = parse(source)[1]["imports"]
+    if source.endswith("import b"):
+        expected = expected[:1]  # Only the imports at the top
+    assert scan_imports(source) == expected
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_dependency_graph(tmp_path, workers):
+    from deps import ImportCycleError, dependency_graph
+
+    files = {
+        "lib/math.vy": "# Sources are UTF-8, whatever the locale: π\nx: uint256\n",
+        "lib/token.vyi": "from . import math\n",
+        "lib/util.vy": "from . import math\nfrom .token import transfer\n",
+        "app/main.vy": (
+            '"""Main"""\nimport lib.util as u\nfrom ..lib import math\n'
+            "from vyper.interfaces import ERC20\n"
+        ),
+    }
+    for path, text in files.items():
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_text(text, encoding="utf-8")
+
+    graph = dependency_graph(tmp_path, workers)
+    assert graph == {
+        "lib/math.vy": [],
+        "lib/token.vyi": ["lib/math.vy"],
+        "lib/util.vy": ["lib/math.vy", "lib/token.vyi"],
+        "app/main.vy": ["lib/util.vy", "lib/math.vy"],
+    }
+    order = list(graph)
+    for path, dependencies in graph.items():
+        assert all(order.index(d) < order.index(path) for d in dependencies)
+
+    (tmp_path / "lib/math.vy").write_text("import app.main\n")
+    with pytest.raises(ImportCycleError) as error:
+        dependency_graph(tmp_path, workers)
+    cycle = error.value.cycle
+    assert cycle[0] == cycle[-1]
+    assert {"app/main.vy", "lib/math.vy"} <= set(cycle)
+    # Each file imports the next one
+    graph["lib/math.vy"] = ["app/main.vy"]
+    assert all(b in graph[a] for a, b in zip(cycle, cycle[1:]))
+
+    (tmp_path / "lib/math.vy").write_text("import $\n")
+    with pytest.raises(SyntaxError, match="lib/math.vy"):
+        dependency_graph(tmp_path, workers)
+
+
+def test_project_build(tmp_path):
+    from project import Project
+
+    files = {
+        "lib/math.vy": "x: uint256\n",
+        "lib/util.vy": "from . import math\n",
+        "app/main.vy": "import lib.util as u\n",
+        "app/other.vy": CONTRACT,
+    }
+    for path, text in files.items():
+        (tmp_path / path).parent.mkdir(exist_ok=True)
+        (tmp_path / path).write_text(text)
+
+    result = Project(tmp_path).build()
+    assert result.parsed == sorted(files) and result.errors == {}
+    # A new Project, as in a later run
+    project = Project(tmp_path)
+    assert project.build().unchanged == sorted(files)
+    assert project.ast("app/other.vy") == parse(CONTRACT)
+    assert project.ast("app/other.vy", lazy=True)[1]["imports"].decode() == (
+        parse(CONTRACT)[1]["imports"]
+    )
+
+    # Files importing a changed file (even indirectly) are parsed again
+    (tmp_path / "lib/math.vy").write_text("x: uint8\n")
+    result = Project(tmp_path).build()
+    assert result.parsed == ["app/main.vy", "lib/math.vy", "lib/util.vy"]
+    assert result.unchanged == ["app/other.vy"]
+    assert Project(tmp_path).ast("lib/math.vy") == parse("x: uint8\n")
+
+    # Touched without changing
+    os.utime(tmp_path / "app/main.vy", ns=(1, 1))
+    assert Project(tmp_path).build().parsed == []
+
+    (tmp_path / "app/other.vy").unlink()
+    (tmp_path / "app/bad.vy").write_text("x = $\n")
+    result = Project(tmp_path).build(workers=2)
+    assert result.parsed == [] and result.removed == ["app/other.vy"]
+    assert list(result.errors) == ["app/bad.vy"]
+    with pytest.raises(KeyError):
+        Project(tmp_path).ast("app/other.vy")
+    # Errors are reported again, until fixed
+    assert list(Project(tmp_path).build().errors) == ["app/bad.vy"]
+    (tmp_path / "app/bad.vy").write_text("x: uint256\n")
+    assert Project(tmp_path).build().parsed == ["app/bad.vy"]
+
+    # Only the results of the files still there are kept
+    assert len(list((tmp_path / ".vyparse" / "ast").glob("*/*.ast"))) == 4
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_project_build_errors(tmp_path, workers):
+    from project import Project
+
+    files = {
+        "a.vy": "x: HashMa[address, uint256]\n",
+        "b.vy": "x = $\n",
+        "c.vy": "x: uint256\n",
+    }
+    for path, text in files.items():
+        (tmp_path / path).write_text(text)
+
+    # Failures are reported per file, however many workers parse them
+    result = Project(tmp_path, directory=tmp_path / "out").build(workers)
+    assert result.parsed == ["c.vy"]
+    assert sorted(result.errors) == ["a.vy", "b.vy"]
+    assert all(isinstance(e, SyntaxError) for e in result.errors.values())
+
+
+def test_daemon():
+    from daemon import INVALID_PARAMS, METHOD_NOT_FOUND, SYNTAX_ERROR, Server
+
+    server = Server()
+
+    def request(method, params):
+        return {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+
+    def call(method, **params):
+        response = server.handle(request(method, params))
+        return response.get("result"), response.get("error")
+
+    # A notification (no id) gets no response
+    notification = request("open", {"uri": "a", "text": CONTRACT})
+    del notification["id"]
+    assert server.handle(notification) is None
+    assert call("parse", uri="a") == ({"ast": parse(CONTRACT)}, None)
+    assert call("diagnostics", uri="a") == ({"diagnostics": []}, None)
+
+    start = CONTRACT.index("= 100")
+    call("change", uri="a", edits=[{"start": start, "end": start, "text": "= "}])
+    result, error = call("parse", uri="a")
+    assert result is None and error["code"] == SYNTAX_ERROR
+    result, _ = call("diagnostics", uri="a")
+    assert result["diagnostics"] == [
+        {"line": CONTRACT[:start].count("\n"), "column": 25, "message": "Invalid syntax"}
+    ]
+
+    # Fixing it, then another edit on top
+    edits = [
+        {"start": start, "end": start + 2, "text": ""},
+        {"start": 0, "end": 0, "text": "import e\n"},
+    ]
+    call("change", uri="a", edits=edits)
+    assert call("parse", uri="a")[0]["ast"] == parse("import e\n" + CONTRACT)
+    tokens = call("tokens", uri="a")[0]["tokens"]
+    assert tokens[:2] == [["IMPORT", "import", 1, 0], ["NAME", "e", 1, 7]]
+
+    # A name the grammar rejects is a syntax error in the document too
+    text = "import e\n" + CONTRACT
+    start = text.index("HashMap") + len("HashMa")
+    call("change", uri="a", edits=[{"start": start, "end": start + 1, "text": ""}])
+    assert call("parse", uri="a")[1]["code"] == SYNTAX_ERROR
+    result, _ = call("diagnostics", uri="a")
+    assert [d["line"] for d in result["diagnostics"]] == [text[:start].count("\n")]
+    call("change", uri="a", edits=[{"start": start, "end": start, "text": "p"}])
+    assert call("parse", uri="a")[0]["ast"] == parse(text)
+
+    result, _ = call("diagnostics", text="a: uint256\nb = $")
+    assert result["diagnostics"] == [
+        {"line": 1, "column": 4, "message": "Illegal Character $ @ line 2, col 6"}
+    ]
+
+    assert call("change", uri="a", edits=[{"start": 0}])[1]["code"] == INVALID_PARAMS
+    edits = [{"start": 0, "end": len(CONTRACT) + 100, "text": ""}]
+    assert call("change", uri="a", edits=edits)[1]["code"] == INVALID_PARAMS
+    call("close", uri="a")
+    assert call("parse", uri="a")[1]["code"] == INVALID_PARAMS
+    assert call("parse", url="a")[1]["code"] == INVALID_PARAMS
+    assert call("lint")[1]["code"] == METHOD_NOT_FOUND
+
+
+def test_daemon_stdio():
+    import io
+    import json
+    import subprocess
+    import sys
+
+    from daemon import PARSE_ERROR, read_message, write_message
+
+    calls = [
+        ("open", {"uri": "a", "text": CONTRACT}),
+        ("parse", {"uri": "a"}),
+        ("shutdown", {}),
+        ("parse", {"uri": "a"}),
+    ]
+    requests = io.BytesIO()
+    requests.write(b"Content-Length: many\r\n\r\n")  # A bad frame is answered
+    for n, (method, params) in enumerate(calls):
+        request = {"jsonrpc": "2.0", "id": n, "method": method, "params": params}
+        write_message(requests, json.dumps(request).encode())
+    process = subprocess.run(
+        [sys.executable, os.path.join(os.path.dirname(__file__), "daemon.py")],
+        input=requests.getvalue(),
+        capture_output=True,
+        check=True,
+    )
+    output = io.BytesIO(process.stdout)
+    responses = []
+    while (body := read_message(output)) is not None:
+        responses.append(json.loads(body))
+    # Nothing after the shutdown is answered
+    assert [r["id"] for r in responses] == [None, 0, 1, 2]
+    assert responses[0]["error"]["code"] == PARSE_ERROR
+    assert responses[2]["result"]["ast"] == json.loads(json.dumps(parse(CONTRACT)))
+
+
+def test_memory_report():
+    from memory import memory_report
+
+    report = memory_report(CONTRACT)
+    assert report["source_bytes"] == len(CONTRACT)
+    for mode in ("tokenize", "parse"):
+        peak = report[mode]["peak_bytes"]
+        assert peak > 0 and report[mode]["peak_bytes_per_byte"] == peak / len(CONTRACT)
+    assert {"lexer", "postprocess"} <= report["tokenize"]["stages"].keys()
+    nodes = report["parse"]["nodes"]
+    for kind in ("Module", "FunctionDef", "StructDef", "BinOp", "getattr", "assign"):
+        assert nodes[kind] > 0
+    assert list(nodes.values()) == sorted(nodes.values(), reverse=True)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_generate_contract(seed):
+    from synthetic import generate_contract
+
+    text = generate_contract(30_000, seed)
+    assert 30_000 <= len(text) < 45_000
+    assert text == generate_contract(30_000, seed)
+    assert text != generate_contract(30_000, seed + 1)
+    ast = parse(text)
+    for key in ("imports", "interface_defs", "struct_defs", "event_defs", "function_defs"):
+        assert ast[1][key]
+
+
+def _best_time(func, *args, repeat=3):
+    import time
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize("stage", ["tokenize", "parse"])
+def test_linear_scaling(stage):
+    from lex import tokenize
+    from synthetic import generate_contract
+
+    def tokenize_all(text):
+        for _ in tokenize(text):
+            pass
+
+    func = tokenize_all if stage == "tokenize" else parse
+    small, large = generate_contract(16_000), generate_contract(128_000)
+    growth = _best_time(func, large) / _best_time(func, small)
+    # 8x the input: about 8x the time, where quadratic would be about 64x
+    assert growth < 2.5 * len(large) / len(small)
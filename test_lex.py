@@ -0,0 +1,248 @@
+import pytest
+from lex import LineIndex
+
+TEXTS = [
+    "",
+    "a",
+    "a\n",
+    "a: uint256\nb: uint256",
+    "\n\n\ndef a():\n    pass\n\n",
+    "x = 1\r\ny = 2\r\n",
+]
+
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_line_index(text):
+    index = LineIndex(text)
+    for i in range(len(text) + 1):
+        # Reference implementation: scan backwards for the last newline
+        last_cr = max(text.rfind("\n", 0, i), 0)
+        assert index.column(i) == (i - last_cr) + 1
+        lineno = text.count("\n", 0, i) + 1
+        assert index.position(i) == (lineno, i - (text.rfind("\n", 0, i) + 1))
+
+    lines = text.splitlines()
+    assert len(index) == len(lines)
+    assert index.lines(0, len(lines)) == lines
+    assert index.lines(1, 3) == lines[1:3]
+
+
+TOKEN_STREAMS = [
+    "",
+    "\n",
+    "a: uint256",
+    "a: uint256\n",
+    "\n\n# comment\na: uint256\n# another\n\nb: uint256\n",
+    "import a; import b;\nimport c",
+    "def a():\n    pass",
+    "def a():\n    pass\n",
+    "def a():\n    x = 1\n    y = 2\n",
+    "def a():\n    if c:\n        x()\n    y()\nz: u",
+    "def a():\n    if c:\n        if d:\n            x()\nz: u\n",
+    "def a():\n\tif c:\n\t\tx()\n",
+    "def a():\n    x = 1\n    \n    y = 2\n",
+    'def a():\n    """\n    Docs\n    """\n    pass\n',
+    '"""\nModule docs\n"""\na: uint256\n',
+    "a: uint256[3] = [\n    1,\n    2,\n    3,\n]\n",
+    "a: uint256 = foo(\n    1,\n    2\n)\n",
+    "def a():\n    x = (\n        1\n    )\n",
+    "def a():\n        pass\n",
+    "def a():\n    \tpass\n",
+    "def a():\n     pass\n",
+    "a = (\n    1\n",
+    "a = $",
+]
+
+
+def _run(text, pipeline):
+    from lex import tokenize
+
+    try:
+        return [
+            (t.type, t.value, t.index, t.lineno, t.colno)
+            for t in tokenize(text, pipeline=pipeline)
+        ]
+    except SyntaxError as e:
+        return ("SyntaxError", str(e))
+
+
+@pytest.mark.parametrize("text", TOKEN_STREAMS)
+def test_fused_pipeline(text):
+    if not text:
+        pytest.skip("The reference pipeline cannot handle an empty program")
+    assert _run(text, "fused") == _run(text, "reference")
+
+
+def test_fused_pipeline_grammar_sources():
+    from test_grammar import SOURCES
+
+    for text in SOURCES:
+        assert _run(text, "fused") == _run(text, "reference"), text
+
+
+@pytest.mark.parametrize("pipeline", ["fused", "reference"])
+@pytest.mark.parametrize("text", [t for t in TOKEN_STREAMS if t])
+def test_token_buffer(text, pipeline):
+    from lex import tokenize
+
+    expected = _run(text, pipeline)
+    if isinstance(expected, tuple):
+        with pytest.raises(SyntaxError):
+            tokenize(text, pipeline=pipeline, buffer=True)
+        return
+
+    buffer = tokenize(text, pipeline=pipeline, buffer=True)
+    assert [(t.type, t.value, t.index, t.lineno, t.colno) for t in buffer] == expected
+
+
+def test_token_buffer_itemsize():
+    from lex import tokenize
+
+    buffer = tokenize("a: uint256", buffer=True)
+    for column in (buffer.starts, buffer.ends, buffer.linenos, buffer.colnos):
+        assert column.itemsize == 4
+
+
+@pytest.mark.parametrize(
+    "text,types",
+    [
+        # Newlines inside brackets don't end the statement
+        (
+            "a: uint256 = foo(\n    1,\n    2\n)\n",
+            "NAME : NAME = NAME ( DEC_NUM , DEC_NUM ) ENDSTMT",
+        ),
+        # Every DEDENT is followed by an ENDSTMT, since it also ends a statement
+        (
+            "def a():\n    if c:\n        x()\nz: u\n",
+            "DEF NAME ( ) : INDENT IF NAME : INDENT NAME ( ) ENDSTMT "
+            "DEDENT ENDSTMT DEDENT ENDSTMT NAME : NAME ENDSTMT",
+        ),
+        # Only one ENDSTMT at the end, whether or not there is a newline
+        ("a: u\n", "NAME : NAME ENDSTMT"),
+        ("a: u", "NAME : NAME ENDSTMT"),
+    ],
+)
+@pytest.mark.parametrize("pipeline", ["fused", "reference"])
+def test_token_types(text, types, pipeline):
+    from lex import tokenize
+
+    assert [t.type for t in tokenize(text, pipeline=pipeline)] == types.split()
+
+
+@pytest.mark.parametrize("pipeline", ["fused", "reference"])
+def test_stage_metrics(pipeline):
+    from lex import tokenize
+    from metrics import PipelineMetrics
+
+    text = "def a():\n    x = 1\n\n\n    y = 2\n"
+    metrics = PipelineMetrics()
+    tokens = list(tokenize(text, pipeline=pipeline, metrics=metrics))
+    metrics.finish()
+
+    stages = list(metrics.stages.values())
+    assert list(metrics.stages)[0] == "lexer"
+    assert stages[0].tokens_in == 0
+    # Each stage reads what the one before it wrote
+    for before, after in zip(stages, stages[1:]):
+        assert after.tokens_in == before.tokens_out
+    assert stages[-1].tokens_out == len(tokens)
+    assert all(stage.seconds >= 0 for stage in stages)
+
+
+@pytest.mark.parametrize(
+    "text,values",
+    [
+        # Docstrings end at the first closing quotes, not the last ones
+        ('"""a"""\nx\n"""b"""', ['"""a"""', "x", '"""b"""']),
+        ("'''a\n'''\n'''b'''", ["'''a\n'''", "'''b'''"]),
+        ('"""a "quoted" \\""" b"""', ['"""a "quoted" \\""" b"""']),
+        # Strings too, and they skip over escaped quotes
+        ('x = "a" + "b"', ["x", "=", '"a"', "+", '"b"']),
+        ("x = 'a' + 'it\\'s'", ["x", "=", "'a'", "+", "'it\\'s'"]),
+        ('x = "a\\"b" # "c"', ["x", "=", '"a\\"b"']),
+    ],
+)
+def test_string_literals(text, values):
+    from lex import tokenize
+
+    assert [t.value for t in tokenize(text) if t.type != "ENDSTMT"] == values
+
+
+def _lex_seconds(text):
+    import time
+
+    from lex import VyperLexer
+
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        try:
+            for _ in VyperLexer().tokenize(text):
+                pass
+        except SyntaxError:
+            pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda n: '"""Docstring"""\nx = 1\n' * n,
+        # Never closed, with lots of chances to backtrack
+        lambda n: '"""' + '""a' * n,
+        lambda n: '"""' + "\\" * n,
+        lambda n: 'x = "' + 'a\\"' * n,
+    ],
+)
+def test_string_literals_linear(make):
+    # Quadratic scanning would take 16x as long for 4x the text
+    small, large = _lex_seconds(make(5000)), _lex_seconds(make(20000))
+    assert large < 8 * small + 0.01
+
+
+# Pieces of source that exercise every rule, and where the rules overlap
+FRAGMENTS = [
+    "def", "if", "elif", "pass", "True", "xor", "_", "a", "a_1", "Name", "é",
+    "0", "007", "0x1f", "0xZ", "0o7", "0b12", "1.5", "1.", ".5", "1e5", "1e", "2.e-3",
+    "->", "-", "-=", "<", "<<", "<=", ">", ">>", ">=", "=", "==", "!", "!=",
+    "*", "**", "*=", "**=", "+", "+=", "/", "/=", "%", "%=", ".", ";",
+    ",", ":", "@", "(", ")", "[", "]", "{", "}", "$", "?",
+    '"', "'", '"""', "'''", "\\", '"a"', "'b'", '"\\""', "# c",
+    " ", "  ", "   ", "    ", "\t", "\n", "\r\n", "\n\n", "\r",
+]
+
+
+def _lexed(lexer, text):
+    # The tokens up to any error, and the error
+    tokens = []
+    try:
+        for t in lexer.tokenize(text):
+            tokens.append((t.type, t.value, t.lineno, t.index))
+    except SyntaxError as e:
+        return tokens, str(e)
+    return tokens, None
+
+
+def test_table_lexer():
+    import random
+
+    from lex import TableLexer, VyperLexer
+
+    rng = random.Random(14)
+    for _ in range(3000):
+        text = "".join(rng.choices(FRAGMENTS, k=rng.randint(1, 30)))
+        assert _lexed(TableLexer(), text) == _lexed(VyperLexer(), text), text
+
+
+@pytest.mark.parametrize("text", TEXTS + ["def a():\n\tx = 1\n    y = 2\n"])
+def test_table_lexer_tokenize(text):
+    from lex import tokenize
+
+    def lexed(engine):
+        try:
+            return [(t.type, t.value, t.colno) for t in tokenize(text, engine=engine)]
+        except SyntaxError as e:
+            return str(e)
+
+    assert lexed("table") == lexed("sly")